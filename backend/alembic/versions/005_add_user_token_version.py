@@ -0,0 +1,24 @@
+"""Add token_version to users
+
+Revision ID: 005_add_user_token_version
+Revises: 004_add_event_source_id
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '005_add_user_token_version'
+down_revision: Union[str, None] = '004_add_event_source_id'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('token_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,45 @@
+"""Add curriculum_standard_closure
+
+Revision ID: 006_add_standard_closure
+Revises: 005_add_user_token_version
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '006_add_standard_closure'
+down_revision: Union[str, None] = '005_add_user_token_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'curriculum_standard_closure',
+        sa.Column('ancestor_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('curriculum_standards.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('descendant_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('curriculum_standards.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('depth', sa.Integer(), nullable=False),
+    )
+    op.create_index('idx_standard_closure_descendant', 'curriculum_standard_closure', ['descendant_id'])
+
+    # Backfill every (ancestor, descendant) pair from parent_id.
+    op.execute("""
+        INSERT INTO curriculum_standard_closure (ancestor_id, descendant_id, depth)
+        WITH RECURSIVE tree (ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM curriculum_standards
+            UNION ALL
+            SELECT tree.ancestor_id, s.id, tree.depth + 1
+            FROM curriculum_standards s
+            JOIN tree ON s.parent_id = tree.descendant_id
+        )
+        SELECT ancestor_id, descendant_id, depth FROM tree
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_standard_closure_descendant', table_name='curriculum_standard_closure')
+    op.drop_table('curriculum_standard_closure')
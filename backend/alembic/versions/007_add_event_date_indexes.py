@@ -0,0 +1,44 @@
+"""Add event date range indexes
+
+Revision ID: 007_add_event_date_indexes
+Revises: 006_add_standard_closure
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = '007_add_event_date_indexes'
+down_revision: Union[str, None] = '006_add_standard_closure'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (topic_id, date_start) serves topic lookups too, so it replaces idx_events_topic.
+    op.create_index('idx_events_topic_date', 'events', ['topic_id', 'date_start'])
+    op.drop_index('idx_events_topic', table_name='events')
+    # daterange() raises on date_end < date_start, so name offending rows up front
+    # and keep new ones out with a CHECK constraint before building the index.
+    inverted = op.get_bind().execute(sa.text(
+        "SELECT source_id FROM events WHERE date_end < date_start ORDER BY source_id"
+    )).scalars().all()
+    if inverted:
+        raise RuntimeError(
+            f"{len(inverted)} event(s) have date_end before date_start; fix them before upgrading: "
+            + ", ".join(str(source_id) for source_id in inverted[:20])
+        )
+    op.create_check_constraint('ck_events_date_order', 'events', 'date_end IS NULL OR date_end >= date_start')
+    op.execute(
+        "CREATE INDEX idx_events_daterange ON events "
+        "USING gist (daterange(date_start, coalesce(date_end, date_start), '[]'))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX idx_events_daterange")
+    op.drop_constraint('ck_events_date_order', 'events', type_='check')
+    op.create_index('idx_events_topic', 'events', ['topic_id'])
+    op.drop_index('idx_events_topic_date', table_name='events')
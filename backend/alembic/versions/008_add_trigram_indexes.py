@@ -0,0 +1,35 @@
+"""Add pg_trgm indexes for fuzzy search
+
+Revision ID: 008_add_trigram_indexes
+Revises: 007_add_event_date_indexes
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '008_add_trigram_indexes'
+down_revision: Union[str, None] = '007_add_event_date_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = [
+    ('idx_events_title_trgm', 'events', 'title'),
+    ('idx_events_description_trgm', 'events', 'description'),
+    ('idx_standards_code_trgm', 'curriculum_standards', 'code'),
+    ('idx_standards_title_trgm', 'curriculum_standards', 'title'),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name, table, [column], postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in TRIGRAM_INDEXES:
+        op.drop_index(name, table_name=table)
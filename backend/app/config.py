@@ -1,12 +1,61 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
     database_url: str = "sqlite:///./lessonlines.db"
+    # When set, connections take their username/password from this Secrets
+    # Manager secret (cached for the TTL) instead of from database_url.
+    database_secret_arn: Optional[str] = None
+    database_credentials_ttl_seconds: int = 300
+    # Connection pool profile: "lambda" (one pooled connection behind RDS Proxy),
+    # "lambda_nullpool" (no pooling; RDS Proxy multiplexes), "server" (local
+    # uvicorn with concurrent requests) or "auto" (lambda when running in Lambda).
+    database_pool_profile: str = "auto"
+    # Count SQL statements and DB/serialization time per request and report
+    # them in a Server-Timing header and a structured log line.
+    request_instrumentation: bool = False
+    # Log statements slower than this (unset disables the slow-query log).
+    # Only the sampled fraction is logged; EXPLAIN runs on PostgreSQL only.
+    slow_query_threshold_ms: Optional[float] = None
+    slow_query_sample_rate: float = 1.0
+    slow_query_explain: bool = False
+    # Per-route request counts and latency histograms, served in Prometheus
+    # format at /api/admin/metrics. With metrics_emf, handler.py also prints
+    # them as CloudWatch Embedded Metric Format lines after each invocation.
+    metrics_enabled: bool = True
+    metrics_emf: bool = False
+    metrics_namespace: str = "LessonLines"
+    # /health/ready caches its result this long so probes can't become load,
+    # and reports "degraded" when SELECT 1 takes longer than the warn threshold.
+    readiness_cache_seconds: float = 5.0
+    readiness_db_latency_warn_ms: float = 250.0
     secret_key: str = "dev-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24 * 7  # 1 week
+    # Trust the is_pro/is_admin claims of a token for this long after it was
+    # issued; older tokens are checked against the (cached) users row.
+    auth_claims_max_age_seconds: int = 300
+    auth_user_cache_ttl_seconds: int = 30
+    auth_user_cache_size: int = 1024
+    # Decoded JWTs kept per container (0 disables the cache).
+    token_cache_size: int = 1024
+    # bcrypt cost for new hashes; existing hashes at another cost are rehashed
+    # on the next successful login.
+    bcrypt_rounds: int = 12
+    # Threads dedicated to bcrypt, so login bursts can't starve other routes.
+    password_hash_workers: int = 4
+    # Serve read-only catalog endpoints (topics, tags, frameworks) from a
+    # precompiled snapshot. Only set this when the database was bulk-loaded
+    # from the same snapshot, so ids agree.
+    catalog_snapshot_path: Optional[str] = None
+    # Caches derived from the catalog (e.g. standards trees) re-read its
+    # version from the database at most this often.
+    catalog_version_recheck_seconds: float = 5.0
+    # Answer search_events topic/tag/standard/grade/date filters and facets from an
+    # in-memory bitmap index built once per catalog version instead of SQL.
+    catalog_index_enabled: bool = False
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,122 @@
+"""
+Database credential providers.
+
+In Lambda the database password lives in Secrets Manager and is rotated.
+Instead of baking it into DATABASE_URL at import time, the engine asks a
+provider for credentials whenever it opens a new DBAPI connection (see
+install_credentials_hook). Providers cache the secret for a TTL and are
+forced to refresh when the database rejects the cached password, so warm
+containers survive a rotation.
+"""
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE codes PostgreSQL returns for rejected credentials.
+AUTH_FAILURE_SQLSTATES = {"28000", "28P01"}
+
+
+class DatabaseCredentials(NamedTuple):
+    username: str
+    password: str
+
+
+class CredentialsProvider(ABC):
+    """Returns the credentials new connections should use."""
+
+    @abstractmethod
+    def get(self, force_refresh: bool = False) -> DatabaseCredentials:
+        """Current credentials; force_refresh bypasses any cache."""
+
+
+class StaticCredentialsProvider(CredentialsProvider):
+    """Fixed credentials; the local and test stand-in for Secrets Manager."""
+
+    def __init__(self, username: str, password: str):
+        self.credentials = DatabaseCredentials(username, password)
+        self.refreshes = 0
+
+    def get(self, force_refresh: bool = False) -> DatabaseCredentials:
+        if force_refresh:
+            self.refreshes += 1
+        return self.credentials
+
+
+class CachedCredentialsProvider(CredentialsProvider):
+    """Caches the result of fetch() for ttl_seconds; refetches on demand."""
+
+    def __init__(
+        self,
+        fetch: Callable[[], DatabaseCredentials],
+        ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._fetch = fetch
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._credentials: Optional[DatabaseCredentials] = None
+        self._expires_at = 0.0
+
+    def get(self, force_refresh: bool = False) -> DatabaseCredentials:
+        with self._lock:
+            if force_refresh or self._credentials is None or self._clock() >= self._expires_at:
+                self._credentials = self._fetch()
+                self._expires_at = self._clock() + self.ttl_seconds
+            return self._credentials
+
+
+class SecretsManagerCredentialsProvider(CachedCredentialsProvider):
+    """Reads {"username", "password"} from an AWS Secrets Manager secret."""
+
+    def __init__(self, secret_arn: str, ttl_seconds: float = 300):
+        super().__init__(self._fetch_secret, ttl_seconds)
+        self.secret_arn = secret_arn
+        self._client = None
+
+    def _fetch_secret(self) -> DatabaseCredentials:
+        if self._client is None:
+            import boto3
+
+            self._client = boto3.client("secretsmanager")
+        logger.info("Fetching database credentials from Secrets Manager")
+        response = self._client.get_secret_value(SecretId=self.secret_arn)
+        secret = json.loads(response["SecretString"])
+        return DatabaseCredentials(secret["username"], secret["password"])
+
+
+def is_auth_failure(exc: Exception) -> bool:
+    """True when a connect error means the credentials were rejected."""
+    if getattr(exc, "pgcode", None) in AUTH_FAILURE_SQLSTATES:
+        return True
+    return "password authentication failed" in str(exc)
+
+
+def connect_with_credentials(provider: CredentialsProvider):
+    """Build a do_connect listener that injects the provider's credentials."""
+
+    def do_connect(dialect, conn_rec, cargs, cparams):
+        credentials = provider.get()
+        cparams["user"], cparams["password"] = credentials
+        try:
+            return dialect.connect(*cargs, **cparams)
+        except dialect.loaded_dbapi.OperationalError as exc:
+            if not is_auth_failure(exc):
+                raise
+            logger.warning("Database rejected cached credentials; refreshing secret")
+            cparams["user"], cparams["password"] = provider.get(force_refresh=True)
+            return dialect.connect(*cargs, **cparams)
+
+    return do_connect
+
+
+def install_credentials_hook(engine: Engine, provider: CredentialsProvider) -> None:
+    event.listen(engine, "do_connect", connect_with_credentials(provider))
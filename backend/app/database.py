@@ -1,15 +1,179 @@
-from sqlalchemy import create_engine
+import os
+import threading
+import time
+from typing import Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
 from .config import get_settings
+from .credentials import CredentialsProvider, SecretsManagerCredentialsProvider, install_credentials_hook
 
 settings = get_settings()
 
-connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
-engine = create_engine(settings.database_url, connect_args=connect_args)
+# Pool settings per deployment profile (ignored for SQLite).
+# A Lambda container serves one request at a time, so one connection is enough;
+# recycle it well inside RDS Proxy's idle client timeout and pre-ping because
+# the container may have been frozen between invocations.
+POOL_PROFILES = {
+    "lambda": {"pool_size": 1, "max_overflow": 0, "pool_pre_ping": True, "pool_recycle": 300},
+    "lambda_nullpool": {"poolclass": NullPool},
+    "server": {"pool_size": 10, "max_overflow": 20, "pool_pre_ping": True, "pool_recycle": 1800, "pool_timeout": 10},
+}
+
+
+def resolve_pool_profile(profile: str) -> str:
+    if profile == "auto":
+        return "lambda" if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") else "server"
+    if profile not in POOL_PROFILES:
+        raise ValueError(f"Unknown database pool profile: {profile}")
+    return profile
+
+
+def engine_options(database_url: str, profile: str) -> dict:
+    """Keyword arguments for create_engine for the given URL and pool profile."""
+    if database_url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}}
+    return dict(POOL_PROFILES[resolve_pool_profile(profile)])
+
+
+class PoolMetrics:
+    """
+    Connection pool counters, collected through pool events, plus acquisition
+    timings from a wrapper around Pool.connect().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        # Checkouts made while all pool_size connections were already in use,
+        # so the request was served from overflow. A high rate means the pool
+        # is undersized for the process's concurrency.
+        self.overflow_checkouts = 0
+        # Time spent in Pool.connect(), for every checkout and for waits: those
+        # that started with every connection (pool_size + max_overflow) in use
+        # and so blocked for up to pool_timeout.
+        self.acquisitions = 0
+        self.acquire_seconds = 0.0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.wait_timeouts = 0
+        self._engine: Optional[Engine] = None
+
+    def attach(self, engine: Engine) -> None:
+        self._engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        # dispose() swaps in a fresh pool, which needs wrapping again.
+        event.listen(engine, "engine_disposed", lambda engine: self._time_acquisitions(engine.pool))
+        self._time_acquisitions(engine.pool)
+
+    def _time_acquisitions(self, pool) -> None:
+        connect = pool.connect
+
+        def timed_connect():
+            max_overflow = getattr(pool, "_max_overflow", 0)
+            must_wait = (
+                hasattr(pool, "size") and max_overflow >= 0 and pool.checkedout() >= pool.size() + max_overflow
+            )
+            start = time.perf_counter()
+            timed_out = False
+            try:
+                return connect()
+            except PoolTimeoutError:
+                timed_out = True
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.acquisitions += 1
+                    self.acquire_seconds += elapsed
+                    if must_wait:
+                        self.waits += 1
+                        self.wait_seconds += elapsed
+                    if timed_out:
+                        self.wait_timeouts += 1
+
+        pool.connect = timed_connect
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        pool = self._engine.pool
+        overflowed = hasattr(pool, "size") and pool.checkedout() > pool.size()
+        with self._lock:
+            self.checkouts += 1
+            if overflowed:
+                self.overflow_checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            data = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "overflow_checkouts": self.overflow_checkouts,
+                "acquisitions": self.acquisitions,
+                "acquire_seconds": round(self.acquire_seconds, 6),
+                "waits": self.waits,
+                "wait_seconds": round(self.wait_seconds, 6),
+                "wait_timeouts": self.wait_timeouts,
+            }
+        pool = self._engine.pool if self._engine is not None else None
+        if pool is not None and hasattr(pool, "size"):
+            data.update(
+                pool_size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+                idle=pool.checkedin(),
+                # Most connections the pool hands out before callers block.
+                capacity=pool.size() + max(getattr(pool, "_max_overflow", 0), 0),
+            )
+        return data
+
+
+engine = create_engine(settings.database_url, **engine_options(settings.database_url, settings.database_pool_profile))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+pool_metrics = PoolMetrics()
+pool_metrics.attach(engine)
+
+credentials_provider: Optional[CredentialsProvider] = None
+if settings.database_secret_arn:
+    credentials_provider = SecretsManagerCredentialsProvider(
+        settings.database_secret_arn,
+        ttl_seconds=settings.database_credentials_ttl_seconds,
+    )
+    install_credentials_hook(engine, credentials_provider)
+
+
+def database_url_with_credentials() -> str:
+    """DATABASE_URL with the provider's current credentials filled in, for tools like Alembic."""
+    url = make_url(settings.database_url)
+    if credentials_provider is not None:
+        username, password = credentials_provider.get()
+        url = url.set(username=username, password=password)
+    return url.render_as_string(hide_password=False)
+
 
 def get_db():
     db = SessionLocal()
@@ -0,0 +1,164 @@
+"""
+Readiness probe.
+
+/health only says the process is up. ReadinessProbe.check() also measures a
+SELECT 1 round trip and connection pool saturation, compares the database's
+Alembic revision with the head this code ships with, and checks that a
+configured catalog snapshot still matches the database. Results are cached
+for readiness_cache_seconds, and concurrent probes wait for a single
+in-flight check, so aggressive load-balancer probing costs at most one check
+per interval.
+
+Status is "unavailable" (HTTP 503) when the database is unreachable or on
+another migration revision, "degraded" when it is slow, the pool is nearly
+exhausted, or the catalog check fails or finds the snapshot stale, and
+"ready" otherwise.
+"""
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from .config import get_settings
+from .database import pool_metrics
+from .models import Event
+
+settings = get_settings()
+
+ALEMBIC_DIR = Path(__file__).resolve().parent.parent / "alembic"
+POOL_SATURATION_WARN = 0.9
+
+
+@lru_cache()
+def migration_heads() -> tuple[str, ...]:
+    """Head revision(s) of the migrations bundled with this code."""
+    from alembic.script import ScriptDirectory
+
+    return tuple(ScriptDirectory(str(ALEMBIC_DIR)).get_heads())
+
+
+def _check_database(db: Session) -> dict:
+    start = time.perf_counter()
+    try:
+        db.execute(text("SELECT 1"))
+    except SQLAlchemyError as exc:
+        db.rollback()
+        return {"ok": False, "error": exc.__class__.__name__}
+    latency_ms = (time.perf_counter() - start) * 1000
+    return {
+        "ok": True,
+        "latency_ms": round(latency_ms, 2),
+        "slow": latency_ms > settings.readiness_db_latency_warn_ms,
+    }
+
+
+def _check_pool() -> dict:
+    stats = pool_metrics.snapshot()
+    capacity = stats.get("capacity")
+    saturation = round(stats["checked_out"] / capacity, 3) if capacity else None  # None: unpooled
+    return {**stats, "saturation": saturation, "saturated": saturation is not None and saturation >= POOL_SATURATION_WARN}
+
+
+def _check_migrations(db: Session) -> dict:
+    heads = list(migration_heads())
+    try:
+        current = db.execute(text("SELECT version_num FROM alembic_version")).scalars().all()
+    except SQLAlchemyError:
+        # Schema created without Alembic (tests, local create_all): nothing to compare.
+        db.rollback()
+        return {"current": None, "head": heads, "ok": None}
+    return {"current": sorted(current), "head": sorted(heads), "ok": sorted(current) == sorted(heads)}
+
+
+def _check_catalog(db: Session) -> dict:
+    if not settings.catalog_snapshot_path:
+        from .services.catalog_cache import catalog_version
+
+        try:
+            version = catalog_version.current(db)
+        except SQLAlchemyError as exc:
+            db.rollback()
+            return {"source": "database", "ok": False, "error": exc.__class__.__name__}
+        return {"source": "database", "ok": True, "catalog_version": version}
+    from .services.catalog_snapshot import SnapshotError, get_snapshot
+
+    try:
+        snapshot = get_snapshot(settings.catalog_snapshot_path)
+    except SnapshotError as exc:
+        return {"source": "snapshot", "ok": False, "fresh": False, "error": str(exc)}
+    try:
+        built_at = datetime.fromisoformat(snapshot.meta["built_at"])
+        snapshot_events = int(snapshot.meta["event_count"])
+    except (KeyError, TypeError, ValueError) as exc:
+        return {"source": "snapshot", "ok": False, "fresh": False, "error": f"invalid snapshot metadata: {exc!r}"}
+    try:
+        db_events = db.query(func.count(Event.id)).scalar()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        return {"source": "snapshot", "ok": False, "fresh": None, "error": exc.__class__.__name__}
+    return {
+        "source": "snapshot",
+        "ok": True,
+        "catalog_version": snapshot.catalog_version,
+        "age_seconds": round((datetime.now(timezone.utc) - built_at).total_seconds()),
+        "snapshot_events": snapshot_events,
+        "database_events": db_events,
+        "fresh": snapshot_events == db_events,
+    }
+
+
+def run_checks(db: Session) -> dict:
+    # Snapshot the pool before the probe's own session checks out a connection,
+    # otherwise a one-connection (Lambda) pool always reads as saturated.
+    pool = _check_pool()
+    database = _check_database(db)
+    checks = {"database": database, "pool": pool}
+    if database["ok"]:
+        checks["migrations"] = _check_migrations(db)
+        checks["catalog"] = _check_catalog(db)
+
+    if not database["ok"] or checks["migrations"]["ok"] is False:
+        status = "unavailable"
+    elif (
+        database["slow"]
+        or checks["pool"]["saturated"]
+        or not checks["catalog"]["ok"]
+        or checks["catalog"].get("fresh") is False
+    ):
+        status = "degraded"
+    else:
+        status = "ready"
+    return {"status": status, "checked_at": datetime.now(timezone.utc).isoformat(timespec="seconds"), "checks": checks}
+
+
+class ReadinessProbe:
+    """Caches run_checks() for ttl_seconds; concurrent callers share one check."""
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._result: Optional[dict] = None
+        self._expires_at = 0.0
+
+    def check(self, db: Session) -> tuple[dict, bool]:
+        """(result, cached)."""
+        with self._lock:
+            if self._result is not None and self._clock() < self._expires_at:
+                return self._result, True
+            self._result = run_checks(db)
+            self._expires_at = self._clock() + self.ttl_seconds
+            return self._result, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._result = None
+
+
+readiness_probe = ReadinessProbe(settings.readiness_cache_seconds)
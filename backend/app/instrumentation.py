@@ -0,0 +1,179 @@
+"""
+Per-request database and serialization instrumentation.
+
+When enabled (REQUEST_INSTRUMENTATION=true), every HTTP request gets a
+RequestStats object in a context variable. SQLAlchemy cursor events on the
+engine add each statement and its duration to it; serialization time is
+FastAPI's response_model validation and encoding (serialize_response) plus
+InstrumentedJSONResponse rendering the JSON; and RequestInstrumentationMiddleware
+reports the totals as a Server-Timing header plus one structured log line.
+
+Nothing is installed when the setting is off, so the disabled cost is zero.
+"""
+import json
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from fastapi import FastAPI
+from fastapi import routing as fastapi_routing
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+
+class RequestStats:
+    """Counters for one HTTP request."""
+
+    __slots__ = ("scope", "db_statements", "db_seconds", "serialize_seconds")
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope
+        self.db_statements = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+    @property
+    def route(self) -> Optional[str]:
+        """Path template of the matched route, e.g. /api/events/{event_id}."""
+        route = self.scope.get("route") if self.scope else None
+        return getattr(route, "path", None)
+
+    def server_timing(self, total_seconds: float) -> str:
+        return ", ".join([
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.db_statements} queries"',
+            f"ser;dur={self.serialize_seconds * 1000:.2f}",
+            f"total;dur={total_seconds * 1000:.2f}",
+        ])
+
+
+_current_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """Stats for the request being handled, or None outside an instrumented request."""
+    return _current_stats.get()
+
+
+# ── engine hooks ─────────────────────────────────────────────────────────────
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("instrumentation_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["instrumentation_start"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.db_statements += 1
+        stats.db_seconds += time.perf_counter() - started
+
+
+def instrument_engine(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def uninstrument_engine(engine: Engine) -> None:
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ── response / middleware ────────────────────────────────────────────────────
+
+_fastapi_serialize_response = fastapi_routing.serialize_response
+
+
+async def _serialize_response(**kwargs):
+    """fastapi.routing.serialize_response, charged to the current request."""
+    stats = _current_stats.get()
+    if stats is None:
+        return await _fastapi_serialize_response(**kwargs)
+    start = time.perf_counter()
+    try:
+        return await _fastapi_serialize_response(**kwargs)
+    finally:
+        stats.serialize_seconds += time.perf_counter() - start
+
+
+def instrument_serialization() -> None:
+    # FastAPI's request handler looks serialize_response up as a module global.
+    fastapi_routing.serialize_response = _serialize_response
+
+
+class InstrumentedJSONResponse(JSONResponse):
+    """JSONResponse that charges its rendering time to the current request."""
+
+    def render(self, content: Any) -> bytes:
+        stats = _current_stats.get()
+        if stats is None:
+            return super().render(content)
+        start = time.perf_counter()
+        try:
+            return super().render(content)
+        finally:
+            stats.serialize_seconds += time.perf_counter() - start
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Pure ASGI middleware that gives each request its RequestStats. With
+    report=True it also adds Server-Timing and logs one line per request;
+    without, it only provides the context (e.g. the route for the slow-query log).
+    """
+
+    def __init__(self, app, report: bool = True):
+        self.app = app
+        self.report = report
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _current_stats.set(stats)
+        if not self.report:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _current_stats.reset(token)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", stats.server_timing(time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            logger.info(json.dumps({
+                "event": "request",
+                "method": scope["method"],
+                "route": stats.route or scope["path"],
+                "status": status_code,
+                "db_statements": stats.db_statements,
+                "db_ms": round(stats.db_seconds * 1000, 2),
+                "serialize_ms": round(stats.serialize_seconds * 1000, 2),
+                "total_ms": round((time.perf_counter() - start) * 1000, 2),
+            }))
+
+
+def install_request_instrumentation(app: FastAPI, engine: Engine, report: bool = True) -> None:
+    instrument_engine(engine)
+    instrument_serialization()
+    app.add_middleware(RequestInstrumentationMiddleware, report=report)
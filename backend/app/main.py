@@ -1,7 +1,15 @@
 import os
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
 from fastapi.middleware.cors import CORSMiddleware
 
+from .config import get_settings
+from .database import engine, get_db
+from .health import readiness_probe
+from .instrumentation import InstrumentedJSONResponse, install_request_instrumentation
+from .metrics import MetricsMiddleware, registry as metrics_registry
+from .slow_queries import SlowQueryLog
 from .routers import (
     events_router,
     standards_router,
@@ -10,12 +18,20 @@ from .routers import (
     users_router,
     export_router,
     public_timelines_router,
+    admin_router,
 )
 
+settings = get_settings()
+
+app_options = {}
+if settings.request_instrumentation:
+    app_options["default_response_class"] = InstrumentedJSONResponse
+
 app = FastAPI(
     title="LessonLines API",
     description="API for the LessonLines timeline builder for K-12 teachers",
     version="1.0.0",
+    **app_options,
 )
 
 # CORS middleware with dynamic origins
@@ -35,6 +51,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+    metrics_registry.emf_enabled = settings.metrics_emf
+
+slow_query_log = None
+if settings.slow_query_threshold_ms is not None:
+    slow_query_log = SlowQueryLog(
+        settings.slow_query_threshold_ms,
+        sample_rate=settings.slow_query_sample_rate,
+        explain=settings.slow_query_explain,
+    )
+    slow_query_log.attach(engine)
+
+# The slow-query log needs the request context for route names, but only
+# REQUEST_INSTRUMENTATION adds Server-Timing and per-request log lines.
+if settings.request_instrumentation or slow_query_log is not None:
+    install_request_instrumentation(app, engine, report=settings.request_instrumentation)
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(users_router)
@@ -43,6 +77,7 @@ app.include_router(standards_router)
 app.include_router(timelines_router)
 app.include_router(export_router)
 app.include_router(public_timelines_router)
+app.include_router(admin_router)
 
 
 @app.get("/")
@@ -53,3 +88,10 @@ def root():
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/ready")
+def readiness_check(db: Session = Depends(get_db)):
+    result, cached = readiness_probe.check(db)
+    status_code = 503 if result["status"] == "unavailable" else 200
+    return JSONResponse({**result, "cached": cached}, status_code=status_code)
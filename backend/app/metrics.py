@@ -0,0 +1,288 @@
+"""
+In-process metrics registry.
+
+Counters and histograms are recorded as requests happen; counters and gauges
+for the connection pool and caches are read from their owners when metrics
+are collected. registry.render_prometheus() produces the Prometheus text format
+served at /api/admin/metrics. Under Lambda, where nothing scrapes a container,
+handler.py calls flush_emf() after each invocation instead, printing CloudWatch
+Embedded Metric Format lines that CloudWatch turns into metrics.
+
+Route labels are path templates (/api/events/{event_id}), never raw paths, to
+keep label cardinality bounded.
+"""
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "(unmatched)"
+
+# (labels, value) pairs of one metric family.
+Samples = list[tuple[dict, float]]
+# (name, type, help, samples) from a collector; type is "counter" or "gauge".
+Family = tuple[str, str, str, Samples]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in sorted(labels.items())) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> Samples:
+        with self._lock:
+            return [(dict(key), value) for key, value in self._values.items()]
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_format_labels(labels)} {_format_value(value)}" for labels, value in self.samples()]
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._values: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def snapshot(self) -> list[tuple[dict, list[int], float, int]]:
+        with self._lock:
+            return [(dict(key), list(counts), total, count) for key, (counts, total, count) in self._values.items()]
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, counts, total, count in self.snapshot():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named counters and histograms plus collectors that report metric families on demand."""
+
+    def __init__(self, prefix: str = "lessonlines"):
+        self.prefix = prefix
+        self._metrics: dict[str, object] = {}
+        self._collectors: list[Callable[[], list[Family]]] = []
+        # Observations since the last flush_emf(), when EMF is enabled.
+        self.emf_enabled = False
+        self._pending: list[dict] = []
+        self._pending_lock = threading.Lock()
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._metrics.setdefault(f"{self.prefix}_{name}", Counter(f"{self.prefix}_{name}", help))
+
+    def histogram(self, name: str, help: str, buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._metrics.setdefault(f"{self.prefix}_{name}", Histogram(f"{self.prefix}_{name}", help, buckets))
+
+    def register_collector(self, collector: Callable[[], list[Family]]) -> None:
+        """
+        collector() returns (name, type, help, samples) families. Counter
+        families hold cumulative values and are exported with a _total suffix.
+        """
+        self._collectors.append(collector)
+
+    def collect(self) -> list[Family]:
+        families = []
+        for collector in self._collectors:
+            for name, kind, help, samples in collector():
+                name = f"{self.prefix}_{name}_total" if kind == "counter" else f"{self.prefix}_{name}"
+                families.append((name, kind, help, samples))
+        return families
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines += metric.render()
+        for name, kind, help, samples in self.collect():
+            lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+            lines += [f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples]
+        return "\n".join(lines) + "\n"
+
+    def record_emf(self, metric: str, value: float, unit: str, **dimensions) -> None:
+        if not self.emf_enabled:
+            return
+        with self._pending_lock:
+            self._pending.append({"metric": metric, "value": value, "unit": unit, "dimensions": dimensions})
+
+    def emf_documents(self, namespace: str, timestamp_ms: Optional[int] = None) -> list[dict]:
+        """Drain pending observations into EMF documents, one per dimension set."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        grouped: dict[tuple, dict] = {}
+        for item in pending:
+            key = tuple(sorted(item["dimensions"].items()))
+            doc = grouped.setdefault(key, {"dimensions": item["dimensions"], "metrics": {}})
+            values, _ = doc["metrics"].setdefault(item["metric"], ([], item["unit"]))
+            values.append(item["value"])
+
+        timestamp_ms = timestamp_ms or int(time.time() * 1000)
+        documents = []
+        for doc in grouped.values():
+            dimensions = doc["dimensions"]
+            body = {
+                "_aws": {
+                    "Timestamp": timestamp_ms,
+                    "CloudWatchMetrics": [{
+                        "Namespace": namespace,
+                        "Dimensions": [sorted(dimensions)],
+                        "Metrics": [{"Name": name, "Unit": unit} for name, (_, unit) in doc["metrics"].items()],
+                    }],
+                },
+                **dimensions,
+            }
+            for name, (values, _) in doc["metrics"].items():
+                body[name] = values if len(values) > 1 else values[0]
+            documents.append(body)
+        return documents
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter("http_requests_total", "HTTP requests by route, method and status.")
+http_request_duration = registry.histogram("http_request_duration_seconds", "HTTP request latency by route and method.")
+pdf_export_duration = registry.histogram(
+    "pdf_export_duration_seconds", "Time to render a timeline PDF.", buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+
+def observe_pdf_export(seconds: float) -> None:
+    pdf_export_duration.observe(seconds)
+    registry.record_emf("PdfExportDuration", seconds * 1000, "Milliseconds", Operation="pdf_export")
+
+
+def flush_emf(namespace: str, write: Callable[[str], None] = print) -> int:
+    """Write pending observations as EMF lines; returns how many were written."""
+    documents = registry.emf_documents(namespace)
+    for document in documents:
+        write(json.dumps(document, separators=(",", ":")))
+    return len(documents)
+
+
+# ── middleware ───────────────────────────────────────────────────────────────
+
+class MetricsMiddleware:
+    """Pure ASGI middleware counting requests and timing them per route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            http_requests.inc(route=route, method=method, status=str(status_code))
+            http_request_duration.observe(elapsed, route=route, method=method)
+            if registry.emf_enabled:
+                registry.record_emf("Latency", elapsed * 1000, "Milliseconds", Route=route, Method=method)
+                registry.record_emf("Errors", int(status_code >= 500), "Count", Route=route, Method=method)
+
+
+# ── metrics owned by other modules ───────────────────────────────────────────
+
+# Point-in-time pool readings; every other pool_metrics value is cumulative.
+POOL_GAUGES = {"pool_size", "checked_out", "overflow", "idle", "capacity"}
+CACHE_FIELDS = {"size": "gauge", "hit_rate": "gauge", "hits": "counter", "misses": "counter"}
+
+
+def _pool_families() -> list[Family]:
+    from .database import pool_metrics
+
+    return [
+        (
+            f"db_pool_{key}",
+            "gauge" if key in POOL_GAUGES else "counter",
+            f"Connection pool {key.replace('_', ' ')}.",
+            [({}, value)],
+        )
+        for key, value in pool_metrics.snapshot().items()
+    ]
+
+
+def _cache_families() -> list[Family]:
+    from .services.auth import token_cache, user_cache
+    from .services.catalog_cache import catalog_cache
+    from .services.catalog_snapshot import get_snapshot
+
+    stats = {"token": token_cache.stats(), "user": user_cache.stats(), "catalog": catalog_cache.stats()}
+    info = get_snapshot.cache_info()
+    lookups = info.hits + info.misses
+    stats["catalog_snapshot"] = {
+        "size": info.currsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+    }
+    return [
+        (
+            f"cache_{field}",
+            kind,
+            f"Cache {field.replace('_', ' ')}.",
+            [({"cache": name}, values[field]) for name, values in stats.items()],
+        )
+        for field, kind in CACHE_FIELDS.items()
+    ]
+
+
+registry.register_collector(_pool_families)
+registry.register_collector(_cache_families)
@@ -1,6 +1,12 @@
 from .topic import Topic
 from .tag import Tag, event_tags
-from .standard import CurriculumFramework, CurriculumStandard, event_standards
+from .standard import (
+    CurriculumFramework,
+    CurriculumStandard,
+    curriculum_standard_closure,
+    event_standards,
+    rebuild_standard_closure,
+)
 from .event import Event
 from .user import User
 from .timeline import Timeline, TimelineEvent
@@ -11,6 +17,8 @@ __all__ = [
     "CurriculumFramework",
     "CurriculumStandard",
     "event_standards",
+    "curriculum_standard_closure",
+    "rebuild_standard_closure",
     "Event",
     "User",
     "Timeline",
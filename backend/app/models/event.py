@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, Date, DateTime, Numeric, ForeignKey, Index
+from sqlalchemy import DDL, CheckConstraint, Column, String, Text, Date, DateTime, Numeric, ForeignKey, Index, event, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -35,6 +35,29 @@ class Event(Base):
     standards = relationship("CurriculumStandard", secondary=event_standards, back_populates="events")
 
     __table_args__ = (
-        Index("idx_events_topic", "topic_id"),
+        # daterange() below raises on an inverted range, so reject those rows up front.
+        CheckConstraint("date_end IS NULL OR date_end >= date_start", name="ck_events_date_order"),
+        # Leads with topic_id, so it also serves topic-only lookups.
+        Index("idx_events_topic_date", "topic_id", "date_start"),
         Index("idx_events_date", "date_start"),
+        # Date-range overlap (&&) on [date_start, date_end]; see services.event_search.
+        Index(
+            "idx_events_daterange",
+            text("daterange(date_start, coalesce(date_end, date_start), '[]')"),
+            postgresql_using="gist",
+        ).ddl_if(dialect="postgresql"),
+        # pg_trgm indexes for ILIKE '%q%' and fuzzy (<%) search; see services.fuzzy_search.
+        Index(
+            "idx_events_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_events_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
+
+
+# The trigram indexes need the extension before any table is created.
+event.listen(
+    Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, DateTime, Table, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Integer, Table, ForeignKey, Index, event, inspect, literal, select
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -15,6 +15,19 @@ event_standards = Table(
 )
 
 
+# Every (ancestor, descendant) pair of the standards hierarchy, including each
+# standard paired with itself at depth 0, so "this standard or anything below
+# it" is a single indexed join instead of a recursive walk.
+curriculum_standard_closure = Table(
+    "curriculum_standard_closure",
+    Base.metadata,
+    Column("ancestor_id", UUID(), ForeignKey("curriculum_standards.id", ondelete="CASCADE"), primary_key=True),
+    Column("descendant_id", UUID(), ForeignKey("curriculum_standards.id", ondelete="CASCADE"), primary_key=True),
+    Column("depth", Integer, nullable=False),
+    Index("idx_standard_closure_descendant", "descendant_id"),
+)
+
+
 class CurriculumFramework(Base):
     __tablename__ = "curriculum_frameworks"
 
@@ -45,3 +58,86 @@ class CurriculumStandard(Base):
     framework = relationship("CurriculumFramework", back_populates="standards")
     parent = relationship("CurriculumStandard", remote_side=[id], backref="children")
     events = relationship("Event", secondary=event_standards, back_populates="standards")
+
+    __table_args__ = (
+        # pg_trgm indexes for fuzzy (<%) search; the extension is created in models.event.
+        Index(
+            "idx_standards_code_trgm", "code", postgresql_using="gin", postgresql_ops={"code": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_standards_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+# ── closure maintenance ──────────────────────────────────────────────────────
+# ORM writes keep curriculum_standard_closure current through these mapper
+# events. Bulk Core loads bypass them and call rebuild_standard_closure().
+
+def _closure_rows_for(standard_id):
+    """SELECT of (ancestor_id, descendant_id, depth) for one standard, walking parent_id."""
+    standards = CurriculumStandard.__table__
+    ancestors = select(
+        literal(standard_id, UUID()).label("id"), literal(0).label("depth")
+    ).cte("ancestors", recursive=True)
+    ancestors = ancestors.union_all(
+        select(standards.c.parent_id, ancestors.c.depth + 1)
+        .join_from(standards, ancestors, standards.c.id == ancestors.c.id)
+        .where(standards.c.parent_id.is_not(None))
+    )
+    return select(ancestors.c.id, literal(standard_id, UUID()), ancestors.c.depth)
+
+
+def _insert_closure_rows(connection, standard_ids) -> None:
+    for standard_id in standard_ids:
+        connection.execute(
+            curriculum_standard_closure.insert().from_select(
+                ["ancestor_id", "descendant_id", "depth"], _closure_rows_for(standard_id)
+            )
+        )
+
+
+@event.listens_for(CurriculumStandard, "after_insert")
+def _standard_inserted(mapper, connection, target):
+    _insert_closure_rows(connection, [target.id])
+
+
+@event.listens_for(CurriculumStandard, "after_update")
+def _standard_updated(mapper, connection, target):
+    if not inspect(target).attrs.parent_id.history.has_changes():
+        return
+    # Re-parenting moves the whole subtree: drop its rows and recompute them.
+    closure = curriculum_standard_closure
+    subtree = connection.execute(
+        select(closure.c.descendant_id).where(closure.c.ancestor_id == target.id).order_by(closure.c.depth)
+    ).scalars().all()
+    connection.execute(closure.delete().where(closure.c.descendant_id.in_(subtree)))
+    _insert_closure_rows(connection, subtree)
+
+
+@event.listens_for(CurriculumStandard, "after_delete")
+def _standard_deleted(mapper, connection, target):
+    closure = curriculum_standard_closure
+    connection.execute(
+        closure.delete().where((closure.c.ancestor_id == target.id) | (closure.c.descendant_id == target.id))
+    )
+
+
+def rebuild_standard_closure(connection) -> int:
+    """Recompute the whole closure table from parent_id; returns the number of rows."""
+    standards = CurriculumStandard.__table__
+    tree = select(
+        standards.c.id.label("ancestor_id"), standards.c.id.label("descendant_id"), literal(0).label("depth")
+    ).cte("tree", recursive=True)
+    tree = tree.union_all(
+        select(tree.c.ancestor_id, standards.c.id, tree.c.depth + 1)
+        .join_from(standards, tree, standards.c.parent_id == tree.c.descendant_id)
+    )
+    connection.execute(curriculum_standard_closure.delete())
+    connection.execute(
+        curriculum_standard_closure.insert().from_select(
+            ["ancestor_id", "descendant_id", "depth"], select(tree.c.ancestor_id, tree.c.descendant_id, tree.c.depth)
+        )
+    )
+    # INSERT ... SELECT rowcount is unreliable across drivers (SQLite reports -1).
+    return connection.execute(select(func.count()).select_from(curriculum_standard_closure)).scalar()
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, Integer, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -15,6 +15,8 @@ class User(Base):
     display_name = Column(String(255))
     is_pro = Column(Boolean, default=False)
     is_admin = Column(Boolean, default=False)
+    # Embedded in access tokens; bump it to revoke every token issued so far.
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     pro_purchased_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,189 @@
+"""
+On-demand sampling profiler for individual routes.
+
+Arming a route swaps its endpoint (route.dependant.call) for a wrapper of the
+same kind, sync or async, so FastAPI keeps calling it the same way. For the
+next N requests, the wrapper starts a sampler thread that reads the handler
+thread's stack from sys._current_frames() every interval. Samples are
+aggregated as collapsed stacks ("frame;frame;frame count" lines), which
+flamegraph.pl, speedscope and similar tools accept. Once the N-th request has
+started, the original endpoint is restored, so a disarmed route costs
+nothing.
+
+Sampling is wall-clock: a handler waiting on the database shows the driver
+frames it is blocked in. For async endpoints, samples taken while the
+coroutine is suspended are recorded as "(suspended)".
+
+State is per process, so under Lambda only the container that served the
+arming request is profiled.
+"""
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from typing import Optional
+
+from fastapi.routing import APIRoute
+
+MAX_REQUESTS = 1000
+
+
+class ProfileSession:
+    """Samples collected for one route over a fixed number of requests."""
+
+    def __init__(self, route: APIRoute, method: str, requests: int, interval_seconds: float):
+        self.route = route
+        self.method = method
+        self.path = route.path
+        self.requested = requests
+        self.remaining = requests
+        self.completed = 0
+        self.interval_seconds = interval_seconds
+        self.samples: Counter[str] = Counter()
+        self.started_at = time.time()
+        self.original_call = route.dependant.call
+        self._lock = threading.Lock()
+
+    @property
+    def armed(self) -> bool:
+        return self.route.dependant.call is not self.original_call
+
+    def claim(self) -> bool:
+        """Take one of the remaining request slots; disarm on the last one."""
+        with self._lock:
+            if self.remaining == 0:
+                return False
+            self.remaining -= 1
+            if self.remaining == 0:
+                self.disarm()
+            return True
+
+    def disarm(self) -> None:
+        self.route.dependant.call = self.original_call
+
+    @contextmanager
+    def sample_current_thread(self):
+        thread_id = threading.get_ident()
+        root = sys._getframe(2)  # the endpoint wrapper's frame
+        stop = threading.Event()
+        counts: Counter[str] = Counter()
+
+        def sample():
+            while not stop.wait(self.interval_seconds):
+                frame = sys._current_frames().get(thread_id)
+                counts[_collapse(frame, root)] += 1
+
+        sampler = threading.Thread(target=sample, name="profiler-sampler", daemon=True)
+        sampler.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            sampler.join()
+            prefix = f"{self.method} {self.path}"
+            with self._lock:
+                for stack, count in counts.items():
+                    self.samples[f"{prefix};{stack}" if stack else prefix] += count
+                self.completed += 1
+
+    def collapsed(self) -> str:
+        with self._lock:
+            return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "method": self.method,
+                "path": self.path,
+                "requests": self.requested,
+                "remaining": self.remaining,
+                "completed": self.completed,
+                "samples": sum(self.samples.values()),
+                "interval_ms": self.interval_seconds * 1000,
+                "started_at": self.started_at,
+                "armed": self.armed,
+            }
+
+
+def _frame_name(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+def _collapse(frame, root) -> str:
+    """Stack below `root`, outermost first; "(suspended)" when root is not on it."""
+    names = []
+    while frame is not None and frame is not root:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    if frame is None:
+        return "(suspended)"
+    return ";".join(reversed(names))
+
+
+def _wrap(session: ProfileSession, endpoint):
+    if asyncio.iscoroutinefunction(endpoint):
+        @wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            if not session.claim():
+                return await endpoint(*args, **kwargs)
+            with session.sample_current_thread():
+                return await endpoint(*args, **kwargs)
+        return async_wrapper
+
+    @wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        if not session.claim():
+            return endpoint(*args, **kwargs)
+        with session.sample_current_thread():
+            return endpoint(*args, **kwargs)
+    return wrapper
+
+
+class RouteProfiler:
+    """The armed and finished profiling sessions of this process, keyed by (method, path)."""
+
+    def __init__(self):
+        self._sessions: dict[tuple[str, str], ProfileSession] = {}
+        self._lock = threading.Lock()
+
+    def arm(self, routes, method: str, path: str, requests: int, interval_ms: float = 5.0) -> ProfileSession:
+        method = method.upper()
+        route = next(
+            (r for r in routes if isinstance(r, APIRoute) and r.path == path and method in r.methods),
+            None,
+        )
+        if route is None:
+            raise LookupError(f"No route {method} {path}")
+        if not 1 <= requests <= MAX_REQUESTS:
+            raise ValueError(f"requests must be between 1 and {MAX_REQUESTS}")
+        with self._lock:
+            existing = self._sessions.get((method, path))
+            if existing is not None and existing.armed:
+                raise ValueError(f"{method} {path} is already being profiled")
+            session = ProfileSession(route, method, requests, interval_ms / 1000)
+            route.dependant.call = _wrap(session, session.original_call)
+            self._sessions[(method, path)] = session
+        return session
+
+    def get(self, method: str, path: str) -> Optional[ProfileSession]:
+        return self._sessions.get((method.upper(), path))
+
+    def discard(self, method: str, path: str) -> Optional[ProfileSession]:
+        with self._lock:
+            session = self._sessions.pop((method.upper(), path), None)
+        if session is not None:
+            session.disarm()
+        return session
+
+    def sessions(self) -> list[ProfileSession]:
+        return list(self._sessions.values())
+
+    def clear(self) -> None:
+        for method, path in list(self._sessions):
+            self.discard(method, path)
+
+
+profiler = RouteProfiler()
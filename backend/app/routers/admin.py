@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
+
+from ..metrics import registry
+from ..profiler import profiler
+from ..schemas import ProfileRequest, ProfileSessionResponse
+from ..services.auth import get_current_admin_user
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["admin"],
+    dependencies=[Depends(get_current_admin_user)],
+)
+
+
+def _get_session(method: str, path: str):
+    session = profiler.get(method, path)
+    if session is None:
+        raise HTTPException(status_code=404, detail="No profile for this route")
+    return session
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """Request, pool, cache and export metrics of this process in Prometheus text format."""
+    return PlainTextResponse(registry.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@router.post("/profiler", response_model=ProfileSessionResponse)
+def start_profiling(data: ProfileRequest, request: Request):
+    """Profile the next `requests` calls to a route in this process."""
+    try:
+        session = profiler.arm(request.app.routes, data.method, data.path, data.requests, data.interval_ms)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    return session.summary()
+
+
+@router.get("/profiler", response_model=list[ProfileSessionResponse])
+def list_profiles():
+    return [session.summary() for session in profiler.sessions()]
+
+
+@router.get("/profiler/collapsed", response_class=PlainTextResponse)
+def get_profile(
+    path: str = Query(..., description="Route path template"),
+    method: str = Query("GET"),
+):
+    """Samples in collapsed-stack format, for flamegraph.pl or speedscope."""
+    return _get_session(method, path).collapsed()
+
+
+@router.delete("/profiler")
+def discard_profile(
+    path: str = Query(..., description="Route path template"),
+    method: str = Query("GET"),
+):
+    _get_session(method, path)
+    profiler.discard(method, path)
+    return {"status": "deleted"}
@@ -1,26 +1,40 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models import User
 from ..schemas import UserCreate, Token, UserResponse
-from ..services.auth import (
-    verify_password,
-    get_password_hash,
-    create_access_token,
-)
+from ..services.auth import create_user_access_token
+from ..services.passwords import password_hasher
 from ..config import get_settings
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 settings = get_settings()
 
+# These routes are async so bcrypt can run on password_hasher's own threads
+# while the event loop keeps serving other requests; blocking database work is
+# handed to the regular threadpool.
+
+
+def _find_user(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+
+def _save(db: Session, obj=None):
+    if obj is not None:
+        db.add(obj)
+    db.commit()
+    if obj is not None:
+        db.refresh(obj)
+
 
 @router.post("/register", response_model=UserResponse)
-def register(data: UserCreate, db: Session = Depends(get_db)):
+async def register(data: UserCreate, db: Session = Depends(get_db)):
     # Check if user exists
-    existing_user = db.query(User).filter(User.email == data.email).first()
+    existing_user = await run_in_threadpool(_find_user, db, data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -30,32 +44,40 @@ def register(data: UserCreate, db: Session = Depends(get_db)):
     # Create user
     user = User(
         email=data.email,
-        hashed_password=get_password_hash(data.password),
+        hashed_password=await password_hasher.hash_async(data.password),
         display_name=data.display_name,
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    await run_in_threadpool(_save, db, user)
 
     return user
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = await run_in_threadpool(_find_user, db, form_data.username)
+    valid = False
+    if user:
+        valid, new_hash = await password_hasher.verify_and_update_async(
+            form_data.password, user.hashed_password
+        )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(
-        data={"sub": str(user.id), "is_admin": user.is_admin},
+    access_token = create_user_access_token(
+        user,
         expires_delta=timedelta(minutes=settings.access_token_expire_minutes)
     )
 
+    # The stored hash used a different bcrypt cost; upgrade it transparently
+    if new_hash:
+        user.hashed_password = new_hash
+        await run_in_threadpool(_save, db)
+
     return {"access_token": access_token, "token_type": "bearer"}
@@ -1,17 +1,47 @@
-from typing import Optional
+from datetime import date
+from typing import Optional, Union
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from ..config import get_settings
 from ..database import get_db
 from ..models import Topic, Event, Tag, CurriculumStandard
-from ..schemas import TopicResponse, EventListResponse, EventResponse, TagResponse
+from ..schemas import (
+    EventBatchRequest,
+    EventBatchResponse,
+    EventListResponse,
+    EventProjection,
+    EventProjectionSearchResponse,
+    EventResponse,
+    EventSearchResponse,
+    EventSuggestion,
+    TagResponse,
+    TopicResponse,
+)
+from ..services import catalog_index, fuzzy_search
+from ..services.catalog_snapshot import get_snapshot
+from ..services.event_search import (
+    EventFilters,
+    apply_filters,
+    facet_counts,
+    listing_options,
+    parse_facets,
+    parse_fields,
+    project,
+)
+from ..services.suggest import event_prefix_index
 
 router = APIRouter(prefix="/api", tags=["events"])
+settings = get_settings()
 
 
 @router.get("/topics", response_model=list[TopicResponse])
 def get_topics(db: Session = Depends(get_db)):
+    if settings.catalog_snapshot_path:
+        return get_snapshot(settings.catalog_snapshot_path).topics()
     topics = db.query(Topic).order_by(Topic.name).all()
     return topics
 
@@ -21,45 +51,93 @@ def get_tags(
     category: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
+    if settings.catalog_snapshot_path:
+        return get_snapshot(settings.catalog_snapshot_path).tags(category)
     query = db.query(Tag)
     if category:
         query = query.filter(Tag.category == category)
     return query.order_by(Tag.name).all()
 
 
-@router.get("/events", response_model=list[EventListResponse])
+@router.get(
+    "/events",
+    response_model=Union[
+        list[EventListResponse], EventSearchResponse, list[EventProjection], EventProjectionSearchResponse
+    ],
+)
 def search_events(
     topic: Optional[str] = Query(None, description="Filter by topic slug"),
     q: Optional[str] = Query(None, description="Search query"),
+    fuzzy: bool = Query(False, description="Also match titles close to `q` (typos), most similar first"),
     standard: Optional[UUID] = Query(None, description="Filter by standard ID"),
+    include_descendants: bool = Query(False, description="Also match standards below `standard` in its hierarchy"),
     tag: Optional[str] = Query(None, description="Filter by tag name"),
     grade: Optional[str] = Query(None, description="Filter by grade level"),
+    date_from: Optional[date] = Query(None, description="Only events ending on or after this date"),
+    date_to: Optional[date] = Query(None, description="Only events starting on or before this date"),
+    facets: Optional[str] = Query(
+        None, description="Comma-separated facets to count (topic, tag, grade, framework); returns {events, facets}"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated event fields to return (id is always included), e.g. title,date_start"
+    ),
     db: Session = Depends(get_db)
 ):
-    query = db.query(Event).options(joinedload(Event.tags))
-
-    if topic:
-        topic_obj = db.query(Topic).filter(Topic.slug == topic).first()
-        if topic_obj:
-            query = query.filter(Event.topic_id == topic_obj.id)
-
-    if q:
-        search_term = f"%{q}%"
-        query = query.filter(
-            (Event.title.ilike(search_term)) | (Event.description.ilike(search_term))
-        )
-
-    if standard:
-        query = query.join(Event.standards).filter(CurriculumStandard.id == standard)
-
-    if tag:
-        query = query.join(Event.tags).filter(Tag.name == tag)
-
-    if grade:
-        query = query.join(Event.standards).filter(CurriculumStandard.grade_level == grade)
-
-    events = query.order_by(Event.date_start).all()
-    return events
+    try:
+        facet_names = parse_facets(facets)
+        field_names = parse_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=422, detail="date_from must not be after date_to")
+
+    filters = EventFilters(topic, q, standard, include_descendants, tag, grade, date_from, date_to, fuzzy)
+    indexed = catalog_index.search(db, filters, facet_names) if settings.catalog_index_enabled else None
+    if indexed is not None:
+        events, counts = indexed
+    else:
+        ranking = ("title",) if q and fuzzy else ()
+        query = apply_filters(db.query(Event).options(*listing_options(field_names, also=ranking)), db, filters)
+        events = query.order_by(Event.date_start).all()
+        if ranking:
+            events = fuzzy_search.rank(q, events, "title")
+        counts = facet_counts(db, filters, facet_names) if facet_names else None
+
+    if field_names is not None:
+        # Encode partial rows directly so unrequested fields are omitted rather than null.
+        events = [project(event, field_names) for event in events]
+        return JSONResponse(jsonable_encoder(events if not facet_names else {"events": events, "facets": counts}))
+    if not facet_names:
+        return events
+    return {"events": events, "facets": counts}
+
+
+# Declared before /events/{event_id} so "suggest" is not parsed as an id.
+@router.get("/events/suggest", response_model=list[EventSuggestion])
+def suggest_events(
+    q: str = Query(..., min_length=1, description="Title prefix as typed"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """Typeahead: events whose title, or a word in it, starts with q."""
+    return event_prefix_index(db).suggest(q, limit)
+
+
+@router.post("/events/batch", response_model=EventBatchResponse)
+def get_events_batch(request: EventBatchRequest, db: Session = Depends(get_db)):
+    """Full details for up to MAX_BATCH_EVENTS events in three queries, whatever the count."""
+    ids = list(dict.fromkeys(request.ids))
+    events = db.query(Event).options(
+        selectinload(Event.tags),
+        selectinload(Event.standards).joinedload(CurriculumStandard.framework)
+    ).filter(Event.id.in_(ids)).all()
+
+    by_id = {event.id: event for event in events}
+    return {
+        "events": [_event_detail(by_id[event_id]) for event_id in ids if event_id in by_id],
+        "missing": [event_id for event_id in ids if event_id not in by_id],
+    }
 
 
 @router.get("/events/{event_id}", response_model=EventResponse)
@@ -72,8 +150,12 @@ def get_event(event_id: UUID, db: Session = Depends(get_db)):
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
+    return _event_detail(event)
+
+
+def _event_detail(event: Event) -> dict:
     # Transform standards to include framework_code
-    response_data = {
+    return {
         "id": event.id,
         "topic_id": event.topic_id,
         "title": event.title,
@@ -100,5 +182,3 @@ def get_event(event_id: UUID, db: Session = Depends(get_db)):
         ],
         "created_at": event.created_at,
     }
-
-    return response_data
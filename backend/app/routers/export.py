@@ -1,15 +1,12 @@
 import io
+import time
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
 from ..database import get_db
+from ..metrics import observe_pdf_export
 from ..models import User, Timeline, TimelineEvent, Event
 from ..services.auth import get_current_user
 
@@ -17,15 +14,22 @@ router = APIRouter(prefix="/api/timelines", tags=["export"])
 
 
 COLOR_SCHEMES = {
-    "blue_green": {"primary": colors.HexColor("#3498db"), "secondary": colors.HexColor("#2ecc71")},
-    "red_orange": {"primary": colors.HexColor("#e74c3c"), "secondary": colors.HexColor("#f39c12")},
-    "purple_blue": {"primary": colors.HexColor("#9b59b6"), "secondary": colors.HexColor("#3498db")},
-    "dark": {"primary": colors.HexColor("#34495e"), "secondary": colors.HexColor("#34495e")},
+    "blue_green": {"primary": "#3498db", "secondary": "#2ecc71"},
+    "red_orange": {"primary": "#e74c3c", "secondary": "#f39c12"},
+    "purple_blue": {"primary": "#9b59b6", "secondary": "#3498db"},
+    "dark": {"primary": "#34495e", "secondary": "#34495e"},
 }
 
 
 def generate_timeline_pdf(timeline: Timeline) -> io.BytesIO:
     """Generate a PDF for the given timeline."""
+    # ReportLab adds ~100ms to import; load it on the first export, not on cold start.
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter, landscape
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
     buffer = io.BytesIO()
 
     # Use landscape for horizontal timelines
@@ -40,7 +44,10 @@ def generate_timeline_pdf(timeline: Timeline) -> io.BytesIO:
     )
 
     # Get color scheme
-    scheme = COLOR_SCHEMES.get(timeline.color_scheme, COLOR_SCHEMES["blue_green"])
+    scheme = {
+        role: colors.HexColor(hex_color)
+        for role, hex_color in COLOR_SCHEMES.get(timeline.color_scheme, COLOR_SCHEMES["blue_green"]).items()
+    }
 
     # Styles
     styles = getSampleStyleSheet()
@@ -163,7 +170,9 @@ def export_timeline_pdf(
         raise HTTPException(status_code=404, detail="Timeline not found")
 
     # Generate PDF
+    started = time.perf_counter()
     pdf_buffer = generate_timeline_pdf(timeline)
+    observe_pdf_export(time.perf_counter() - started)
 
     # Create safe filename
     safe_title = "".join(c for c in timeline.title if c.isalnum() or c in " -_").strip()
@@ -1,26 +1,80 @@
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session, joinedload
 
+from ..config import get_settings
 from ..database import get_db
 from ..models import CurriculumFramework, CurriculumStandard
-from ..schemas import CurriculumFrameworkResponse, CurriculumStandardResponse
+from ..schemas import CurriculumFrameworkResponse, CurriculumStandardResponse, StandardTreeResponse
+from ..services import fuzzy_search
+from ..services.catalog_cache import catalog_cache, catalog_version
+from ..services.catalog_snapshot import get_snapshot
 
 router = APIRouter(prefix="/api/standards", tags=["standards"])
+settings = get_settings()
 
 
 @router.get("/frameworks", response_model=list[CurriculumFrameworkResponse])
 def get_frameworks(db: Session = Depends(get_db)):
+    if settings.catalog_snapshot_path:
+        return get_snapshot(settings.catalog_snapshot_path).frameworks()
     frameworks = db.query(CurriculumFramework).order_by(CurriculumFramework.name).all()
     return frameworks
 
 
+@router.get("/frameworks/{code}/tree", response_model=StandardTreeResponse)
+def get_framework_tree(code: str, db: Session = Depends(get_db)):
+    """A framework's standards nested by parent, cached until the catalog version changes."""
+    version = catalog_version.current(db)
+    body = catalog_cache.get_or_build(version, ("standards_tree", code), lambda: _framework_tree_json(db, code, version))
+    return Response(content=body, media_type="application/json")
+
+
+_TREE_FIELDS = ("id", "code", "title", "grade_level", "strand")
+
+
+def _framework_tree_json(db: Session, code: str, version: str) -> str:
+    if settings.catalog_snapshot_path:
+        snapshot = get_snapshot(settings.catalog_snapshot_path)
+        framework = next((f for f in snapshot.frameworks() if f["code"] == code), None)
+        if framework is None:
+            raise HTTPException(status_code=404, detail="Framework not found")
+        rows = [s for s in snapshot.standards() if s["framework_id"] == framework["id"]]
+    else:
+        framework = db.query(CurriculumFramework).filter(CurriculumFramework.code == code).first()
+        if framework is None:
+            raise HTTPException(status_code=404, detail="Framework not found")
+        rows = [
+            row._asdict()
+            for row in db.query(*(getattr(CurriculumStandard, f) for f in _TREE_FIELDS), CurriculumStandard.parent_id)
+            .filter(CurriculumStandard.framework_id == framework.id)
+            .order_by(CurriculumStandard.code)
+        ]
+    return StandardTreeResponse(
+        framework=CurriculumFrameworkResponse.model_validate(framework),
+        catalog_version=version,
+        standards=_assemble_tree(rows),
+    ).model_dump_json()
+
+
+def _assemble_tree(rows: list[dict]) -> list[dict]:
+    """Nest rows (already in display order) under their parent_id in one pass."""
+    nodes = {row["id"]: {**{f: row[f] for f in _TREE_FIELDS}, "children": []} for row in rows}
+    roots = []
+    for row in rows:
+        # A parent outside this framework (or missing) makes the standard a root.
+        parent = nodes.get(row["parent_id"])
+        (parent["children"] if parent is not None else roots).append(nodes[row["id"]])
+    return roots
+
+
 @router.get("", response_model=list[CurriculumStandardResponse])
 def search_standards(
     framework: Optional[str] = Query(None, description="Filter by framework code"),
     grade: Optional[str] = Query(None, description="Filter by grade level"),
     q: Optional[str] = Query(None, description="Search query"),
+    fuzzy: bool = Query(False, description="Also match codes and titles close to `q` (typos), most similar first"),
     db: Session = Depends(get_db)
 ):
     query = db.query(CurriculumStandard).options(joinedload(CurriculumStandard.framework))
@@ -33,13 +87,18 @@ def search_standards(
 
     if q:
         search_term = f"%{q}%"
-        query = query.filter(
+        match = (
             (CurriculumStandard.title.ilike(search_term)) |
             (CurriculumStandard.description.ilike(search_term)) |
             (CurriculumStandard.code.ilike(search_term))
         )
+        if fuzzy:
+            match = match | fuzzy_search.standard_match(db, q)
+        query = query.filter(match)
 
     standards = query.order_by(CurriculumStandard.code).all()
+    if q and fuzzy:
+        standards = fuzzy_search.rank(q, standards, "code", "title")
 
     return [
         {
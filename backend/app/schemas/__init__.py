@@ -2,11 +2,20 @@ from .event import (
     TopicResponse,
     TagResponse,
     EventListResponse,
+    EventProjection,
+    EventSuggestion,
+    FacetCount,
+    EventSearchResponse,
+    EventProjectionSearchResponse,
     EventResponse,
+    EventBatchRequest,
+    EventBatchResponse,
 )
 from .standard import (
     CurriculumFrameworkResponse,
     StandardBrief,
+    StandardTreeNode,
+    StandardTreeResponse,
     CurriculumStandardResponse,
 )
 from .timeline import (
@@ -19,6 +28,10 @@ from .timeline import (
     PublicTimelineResponse,
     ReorderRequest,
 )
+from .admin import (
+    ProfileRequest,
+    ProfileSessionResponse,
+)
 from .user import (
     UserCreate,
     UserLogin,
@@ -29,9 +42,18 @@ __all__ = [
     "TopicResponse",
     "TagResponse",
     "EventListResponse",
+    "EventProjection",
+    "EventSuggestion",
+    "FacetCount",
+    "EventSearchResponse",
+    "EventProjectionSearchResponse",
     "EventResponse",
+    "EventBatchRequest",
+    "EventBatchResponse",
     "CurriculumFrameworkResponse",
     "StandardBrief",
+    "StandardTreeNode",
+    "StandardTreeResponse",
     "CurriculumStandardResponse",
     "TimelineEventCreate",
     "TimelineEventResponse",
@@ -45,4 +67,6 @@ __all__ = [
     "UserLogin",
     "UserResponse",
     "Token",
+    "ProfileRequest",
+    "ProfileSessionResponse",
 ]
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+
+
+class ProfileRequest(BaseModel):
+    method: str = "GET"
+    path: str = Field(..., description="Route path template, e.g. /api/events/{event_id}")
+    requests: int = Field(10, ge=1, le=1000)
+    interval_ms: float = Field(5.0, ge=1, le=1000)
+
+
+class ProfileSessionResponse(BaseModel):
+    method: str
+    path: str
+    requests: int
+    remaining: int
+    completed: int
+    samples: int
+    interval_ms: float
+    started_at: float
+    armed: bool
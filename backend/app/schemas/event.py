@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date, datetime
 from uuid import UUID
 from typing import Optional
@@ -48,6 +48,43 @@ class EventListResponse(BaseModel):
         from_attributes = True
 
 
+class EventProjection(BaseModel):
+    """search_events with fields=: only id and the requested fields are present."""
+    id: UUID
+    title: Optional[str] = None
+    description: Optional[str] = None
+    date_start: Optional[date] = None
+    date_display: Optional[str] = None
+    location: Optional[str] = None
+    image_url: Optional[str] = None
+    tags: Optional[list[TagResponse]] = None
+
+
+class EventSuggestion(BaseModel):
+    id: UUID
+    title: str
+    date_start: date
+    date_display: str
+
+
+class FacetCount(BaseModel):
+    value: str
+    label: str
+    count: int
+
+
+class EventSearchResponse(BaseModel):
+    """search_events with facets=: the matching events plus counts per facet value."""
+    events: list[EventListResponse]
+    facets: dict[str, list[FacetCount]]
+
+
+class EventProjectionSearchResponse(BaseModel):
+    """search_events with both fields= and facets=."""
+    events: list[EventProjection]
+    facets: dict[str, list[FacetCount]]
+
+
 class EventResponse(BaseModel):
     id: UUID
     topic_id: UUID
@@ -68,3 +105,16 @@ class EventResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+MAX_BATCH_EVENTS = 100
+
+
+class EventBatchRequest(BaseModel):
+    ids: list[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_EVENTS)
+
+
+class EventBatchResponse(BaseModel):
+    """Found events in request order; ids with no event are listed in `missing`."""
+    events: list[EventResponse]
+    missing: list[UUID] = []
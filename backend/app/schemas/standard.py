@@ -26,6 +26,21 @@ class StandardBrief(BaseModel):
         from_attributes = True
 
 
+class StandardTreeNode(BaseModel):
+    id: UUID
+    code: str
+    title: str
+    grade_level: Optional[str] = None
+    strand: Optional[str] = None
+    children: list["StandardTreeNode"] = []
+
+
+class StandardTreeResponse(BaseModel):
+    framework: CurriculumFrameworkResponse
+    catalog_version: str
+    standards: list[StandardTreeNode]
+
+
 class CurriculumStandardResponse(BaseModel):
     id: UUID
     code: str
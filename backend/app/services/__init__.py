@@ -2,12 +2,16 @@ from .auth import (
     verify_password,
     get_password_hash,
     create_access_token,
+    create_user_access_token,
     get_current_user,
+    get_current_user_verified,
 )
 
 __all__ = [
     "verify_password",
     "get_password_hash",
     "create_access_token",
+    "create_user_access_token",
     "get_current_user",
+    "get_current_user_verified",
 ]
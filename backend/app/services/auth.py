@@ -1,65 +1,192 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from ..cache import ExpiringLRUCache
 from ..config import get_settings
 from ..database import get_db
 from ..models import User
+from .passwords import password_hasher
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# jose (which pulls in cryptography) is imported on first use so that cold
+# starts serving public catalog routes never load it.
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    from jose import jwt
+
     to_encode = data.copy()
+    now = datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
-    to_encode.update({"exp": expire})
+        expire = now + timedelta(minutes=settings.access_token_expire_minutes)
+    to_encode.update({"exp": expire, "iat": now})
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     return encoded_jwt
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
+def create_user_access_token(user: User, expires_delta: Optional[timedelta] = None) -> str:
+    """Issue a token carrying the claims get_current_user can trust without a DB lookup."""
+    return create_access_token(
+        data={
+            "sub": str(user.id),
+            "is_pro": bool(user.is_pro),
+            "is_admin": bool(user.is_admin),
+            "tv": user.token_version or 0,
+        },
+        expires_delta=expires_delta,
+    )
+
+
+class UserCache:
+    """
+    Per-container TTL cache of users rows, keyed by id.
+    Entries are plain column dicts; callers get a fresh detached User each time.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int):
+        self.ttl_seconds = ttl_seconds
+        self._cache = ExpiringLRUCache(maxsize)
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    def get(self, user_id: UUID) -> Optional[User]:
+        row = self._cache.get(user_id)
+        return User(**row) if row is not None else None
+
+    def put(self, user: User) -> None:
+        row = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        self._cache.put(user.id, row, time.time() + self.ttl_seconds)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._cache.invalidate(user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+user_cache = UserCache(settings.auth_user_cache_ttl_seconds, settings.auth_user_cache_size)
+
+# Decoded claims keyed by a hash of the token, kept until the token expires.
+# The auto-saving editor sends the same token many times a minute, so this
+# skips the HS256 verification and JSON parsing on repeat requests.
+token_cache = ExpiringLRUCache(settings.token_cache_size)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target):
+    user_cache.invalidate(target.id)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_token(token: str) -> tuple[dict, UUID]:
+    key = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(key)
+    if cached is not None:
+        return cached
+
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+        user_id = UUID(payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        raise _credentials_exception()
+
+    # jose rejects tokens past "exp"; tokens without one are cached briefly.
+    token_cache.put(key, (payload, user_id), payload.get("exp", time.time() + 60))
+    return payload, user_id
+
+
+def _claims_are_fresh(payload: dict) -> bool:
+    if not all(claim in payload for claim in ("is_pro", "is_admin", "tv", "iat")):
+        return False
+    return time.time() - payload["iat"] <= settings.auth_claims_max_age_seconds
+
 
-    user = db.query(User).filter(User.id == UUID(user_id)).first()
+def _check_token_version(payload: dict, user: User) -> User:
+    if "tv" in payload and payload["tv"] != (user.token_version or 0):
+        raise _credentials_exception()
+    return user
+
+
+def _load_user(db: Session, user_id: UUID) -> User:
+    user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
 
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Resolve the caller without touching the database when possible.
+    Fresh tokens from create_user_access_token are trusted as-is and yield a
+    detached User carrying only id, is_pro, is_admin and token_version. Older
+    or claim-less tokens are checked against the cached users row. Routes that
+    need the full, current row depend on get_current_user_verified instead.
+    """
+    payload, user_id = _decode_token(token)
+
+    if _claims_are_fresh(payload):
+        return User(
+            id=user_id,
+            is_pro=payload["is_pro"],
+            is_admin=payload["is_admin"],
+            token_version=payload["tv"],
+        )
+
+    user = user_cache.get(user_id)
+    if user is None:
+        user = _load_user(db, user_id)
+        user_cache.put(user)
+    return _check_token_version(payload, user)
+
+
+def get_current_user_verified(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> User:
+    """The caller's current users row, always read from the database."""
+    payload, user_id = _decode_token(token)
+    return _check_token_version(payload, _load_user(db, user_id))
+
+
 def get_current_admin_user(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_verified),
 ) -> User:
     if not current_user.is_admin:
         raise HTTPException(
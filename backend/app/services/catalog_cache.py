@@ -0,0 +1,128 @@
+"""
+Catalog version tracking and caches keyed on it.
+
+The curated catalog (topics, tags, frameworks, standards, events and their
+links) changes only when it is seeded, imported or edited, but nothing in the
+database records a version. CatalogVersion derives one: the snapshot's
+catalog_version when catalog_snapshot_path is set, otherwise a digest of row
+counts and latest timestamps of the catalog tables, read in one aggregate
+query. The digest is reused for recheck_seconds, so anything cached per
+version costs at most one cheap query per interval.
+
+Counts and timestamps miss in-place edits (a retitled standard), so ORM
+commits that touch catalog rows in this process also bump a local generation
+that is part of the version. Edits made by other containers are picked up on
+their next recheck, provided they add, remove or update timestamped rows.
+"""
+import hashlib
+import threading
+import time
+from typing import Callable, Hashable, Optional, TypeVar
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from ..cache import ExpiringLRUCache
+from ..config import get_settings
+from ..models import CurriculumFramework, CurriculumStandard, Event, Tag, Topic, event_standards, event_tags
+
+settings = get_settings()
+
+CATALOG_MODELS = (Topic, Tag, CurriculumFramework, CurriculumStandard, Event)
+
+T = TypeVar("T")
+
+
+def _fingerprint_query():
+    columns = []
+    for model in CATALOG_MODELS:
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        for name in ("updated_at", "created_at"):
+            if hasattr(model, name):  # Tag has no timestamps
+                columns.append(select(func.max(getattr(model, name))).scalar_subquery())
+                break
+    for table in (event_tags, event_standards):
+        columns.append(select(func.count()).select_from(table).scalar_subquery())
+    return select(*columns)
+
+
+class CatalogVersion:
+    """Current catalog version, rechecked against the database at most every recheck_seconds."""
+
+    def __init__(self, recheck_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.recheck_seconds = recheck_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._digest: Optional[str] = None
+        self._checked_at = 0.0
+        self._generation = 0
+
+    def current(self, db: Session) -> str:
+        if settings.catalog_snapshot_path:
+            from .catalog_snapshot import get_snapshot
+
+            return get_snapshot(settings.catalog_snapshot_path).catalog_version
+        with self._lock:
+            digest, generation = self._digest, self._generation
+            if digest is not None and self._clock() - self._checked_at < self.recheck_seconds:
+                return f"{digest}.{generation}"
+        # Query without the lock so a recheck never queues other requests behind it.
+        row = db.execute(_fingerprint_query()).one()
+        digest = hashlib.sha1(repr(tuple(row)).encode()).hexdigest()[:12]
+        with self._lock:
+            # An invalidate() during the query wins; the next call rechecks.
+            if self._generation == generation:
+                self._digest = digest
+                self._checked_at = self._clock()
+            return f"{digest}.{self._generation}"
+
+    def invalidate(self) -> None:
+        """Force a new version: bump the generation and recheck on next use."""
+        with self._lock:
+            self._generation += 1
+            self._digest = None
+
+
+class CatalogCache:
+    """Values derived from the catalog; entries built for an older version are rebuilt."""
+
+    def __init__(self, maxsize: int = 256):
+        # Entries never expire by time, only by catalog version.
+        self._cache = ExpiringLRUCache(maxsize)
+
+    def get_or_build(self, version: str, key: Hashable, build: Callable[[], T]) -> T:
+        entry = self._cache.get(key, valid=lambda entry: entry[0] == version)
+        if entry is not None:
+            return entry[1]
+        value = build()
+        self._cache.put(key, (version, value), float("inf"))
+        return value
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+catalog_version = CatalogVersion(settings.catalog_version_recheck_seconds)
+catalog_cache = CatalogCache()
+
+
+# ── local invalidation ───────────────────────────────────────────────────────
+
+@event.listens_for(Session, "after_flush")
+def _note_catalog_writes(session, flush_context):
+    if any(isinstance(obj, CATALOG_MODELS) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["catalog_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.info.pop("catalog_changed", False):
+        catalog_version.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_on_rollback(session):
+    session.info.pop("catalog_changed", None)
@@ -0,0 +1,187 @@
+"""
+In-memory bitmap index over the curated catalog.
+
+The catalog is read-mostly and small, so with catalog_index_enabled the
+structured filters of search_events (topic, tag, standard, grade, dates) are
+answered without touching the database. Each event gets a bit position in
+date order, and every topic, tag, standard, grade and framework maps to a
+Python int used as a bitset of the events it covers. A combined filter is a
+few big-int ANDs, a facet count is (matches & bits).bit_count(), and the
+list rows are kept pre-built in bit order. Because bits follow date_start,
+a date bound is a bisect into the sorted start dates, plus the few
+multi-day events that start before date_from and end after it.
+
+One index is built per catalog version (see catalog_cache) and rebuilt on
+the first request after the version changes. Keyword search (q) keeps its
+ILIKE semantics by staying in SQL.
+"""
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models import (
+    CurriculumFramework,
+    CurriculumStandard,
+    Event,
+    Tag,
+    Topic,
+    curriculum_standard_closure,
+    event_standards,
+    event_tags,
+)
+from .catalog_cache import catalog_cache, catalog_version
+from .event_search import EventFilters
+
+_LIST_COLUMNS = ("id", "title", "description", "date_start", "date_display", "location", "image_url")
+
+
+def _positions(bits: int):
+    """Indexes of the set bits, lowest first."""
+    digits = bin(bits)[:1:-1]  # least significant first, without "0b"
+    position = digits.find("1")
+    while position != -1:
+        yield position
+        position = digits.find("1", position + 1)
+
+
+class CatalogIndex:
+    """Bitsets over one catalog version; bit i is the i-th event by (date_start, id)."""
+
+    def __init__(self, version: str):
+        self.version = version
+        self.rows: list[dict] = []
+        self.all = 0
+        self.starts: list = []
+        # (date_end, position) of multi-day events, by date_end.
+        self.spans: list[tuple] = []
+        self.topics: dict[str, int] = {}
+        self.topic_names: dict[str, str] = {}
+        self.tags: dict[str, int] = defaultdict(int)
+        self.standards: dict = defaultdict(int)
+        self.descendants: dict = defaultdict(list)
+        self.grades: dict[str, int] = defaultdict(int)
+        self.frameworks: dict[str, int] = defaultdict(int)
+        self.framework_names: dict[str, str] = {}
+
+    @classmethod
+    def load(cls, db: Session, version: str) -> "CatalogIndex":
+        index = cls(version)
+        events = db.execute(
+            select(*(getattr(Event, c) for c in _LIST_COLUMNS), Event.topic_id, Event.date_end)
+            .order_by(Event.date_start, Event.id)
+        ).all()
+        position_of = {}
+        topic_bits = defaultdict(int)
+        for position, event in enumerate(events):
+            row = event._asdict()
+            topic_bits[row.pop("topic_id")] |= 1 << position
+            date_end = row.pop("date_end")
+            index.starts.append(row["date_start"])
+            if date_end is not None and date_end > row["date_start"]:
+                index.spans.append((date_end, position))
+            row["tags"] = []
+            index.rows.append(row)
+            position_of[row["id"]] = position
+        index.all = (1 << len(events)) - 1
+        index.spans.sort()
+
+        for topic_id, slug, name in db.execute(select(Topic.id, Topic.slug, Topic.name)):
+            index.topics[slug] = topic_bits.get(topic_id, 0)
+            index.topic_names[slug] = name
+
+        tags = {tag.id: tag for tag in db.execute(select(Tag.id, Tag.name, Tag.category))}
+        for event_id, tag_id in db.execute(select(event_tags.c.event_id, event_tags.c.tag_id)):
+            tag, position = tags[tag_id], position_of[event_id]
+            index.tags[tag.name] |= 1 << position
+            index.rows[position]["tags"].append({"id": tag.id, "name": tag.name, "category": tag.category})
+
+        frameworks = {}
+        for framework_id, code, name in db.execute(
+            select(CurriculumFramework.id, CurriculumFramework.code, CurriculumFramework.name)
+        ):
+            frameworks[framework_id] = code
+            index.framework_names[code] = name
+        standards = {
+            s.id: s for s in db.execute(
+                select(CurriculumStandard.id, CurriculumStandard.grade_level, CurriculumStandard.framework_id)
+            )
+        }
+        for event_id, standard_id in db.execute(select(event_standards.c.event_id, event_standards.c.standard_id)):
+            bit, standard = 1 << position_of[event_id], standards[standard_id]
+            index.standards[standard_id] |= bit
+            if standard.grade_level is not None:
+                index.grades[standard.grade_level] |= bit
+            index.frameworks[frameworks[standard.framework_id]] |= bit
+
+        closure = curriculum_standard_closure
+        for ancestor_id, descendant_id in db.execute(select(closure.c.ancestor_id, closure.c.descendant_id)):
+            index.descendants[ancestor_id].append(descendant_id)
+        return index
+
+    def match(self, filters: EventFilters) -> int:
+        """Bitset of the events matching the structured filters (q is not supported)."""
+        bits = self.all
+        # Like the SQL path, an unknown topic slug does not filter.
+        if filters.topic and filters.topic in self.topics:
+            bits &= self.topics[filters.topic]
+        if filters.standard and filters.include_descendants:
+            subtree = 0
+            for standard_id in self.descendants.get(filters.standard, ()):
+                subtree |= self.standards.get(standard_id, 0)
+            bits &= subtree
+        elif filters.standard:
+            bits &= self.standards.get(filters.standard, 0)
+        if filters.tag:
+            bits &= self.tags.get(filters.tag, 0)
+        if filters.grade:
+            bits &= self.grades.get(filters.grade, 0)
+        if filters.date_to:
+            bits &= (1 << bisect_right(self.starts, filters.date_to)) - 1
+        if filters.date_from:
+            bits &= self._ending_on_or_after(filters.date_from)
+        return bits
+
+    def _ending_on_or_after(self, day) -> int:
+        starts_before = bisect_left(self.starts, day)
+        bits = self.all & ~((1 << starts_before) - 1)
+        for _, position in self.spans[bisect_left(self.spans, (day,)):]:
+            bits |= 1 << position
+        return bits
+
+    def events(self, bits: int) -> list[dict]:
+        return [self.rows[position] for position in _positions(bits)]
+
+    def facet_counts(self, bits: int, facets: list[str]) -> dict[str, list[dict]]:
+        sources = {
+            "topic": (self.topics, self.topic_names),
+            "tag": (self.tags, {}),
+            "grade": (self.grades, {}),
+            "framework": (self.frameworks, self.framework_names),
+        }
+        result = {}
+        for name in facets:
+            value_bits, labels = sources[name]
+            counts = [
+                {"value": value, "label": labels.get(value, value), "count": (bits & covered).bit_count()}
+                for value, covered in value_bits.items()
+            ]
+            result[name] = sorted((c for c in counts if c["count"]), key=lambda c: (-c["count"], c["value"]))
+        return result
+
+
+def get_catalog_index(db: Session) -> CatalogIndex:
+    """The index for the current catalog version, built on first use."""
+    version = catalog_version.current(db)
+    return catalog_cache.get_or_build(version, "catalog_index", lambda: CatalogIndex.load(db, version))
+
+
+def search(db: Session, filters: EventFilters, facets: list[str]) -> Optional[tuple[list[dict], dict]]:
+    """(events, facet counts) from the index, or None when the filters need SQL."""
+    if filters.q:
+        return None
+    index = get_catalog_index(db)
+    bits = index.match(filters)
+    return index.events(bits), index.facet_counts(bits, facets)
@@ -0,0 +1,407 @@
+"""
+Precompiled snapshot of the curated catalog.
+
+The curated catalog (topics, tags, curriculum frameworks and standards, events
+and their tag/standard associations) is compiled from the JSON files in
+event-data/ plus the reference data in app.seed into a single read-only
+SQLite file. Loading the snapshot avoids re-parsing and re-resolving the JSON
+on every import and lets read-only catalog endpoints be served straight from
+the memory-mapped file.
+
+Row ids are derived deterministically from natural keys (topic slug, tag name,
+framework code, standard code, event source_id), so a database bulk-loaded
+from a snapshot and the snapshot itself agree on every id.
+
+Build with: python -m app.services.catalog_snapshot build
+"""
+import argparse
+import hashlib
+import json
+import sqlite3
+import uuid
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import bindparam, delete, insert, update
+from sqlalchemy.orm import Session
+
+from ..models import (
+    CurriculumFramework,
+    CurriculumStandard,
+    Event,
+    Tag,
+    Topic,
+    event_standards,
+    event_tags,
+    rebuild_standard_closure,
+)
+from .import_events import parse_event_dates
+
+# Bump when the snapshot table layout changes; loaders refuse other versions.
+SNAPSHOT_FORMAT_VERSION = 1
+
+EVENT_DATA_DIR = Path(__file__).parent.parent.parent / "event-data"
+DEFAULT_SNAPSHOT_PATH = EVENT_DATA_DIR / "catalog.snapshot"
+
+# Namespace for the deterministic row ids stored in the snapshot.
+CATALOG_NAMESPACE = uuid.UUID("6f1c2a4e-3b7d-5e8f-9a0b-1c2d3e4f5a6b")
+
+# Let SQLite map up to 64 MiB of the file instead of copying pages into its cache.
+MMAP_SIZE = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE topics (
+    id TEXT PRIMARY KEY, slug TEXT NOT NULL UNIQUE, name TEXT NOT NULL, description TEXT
+);
+CREATE TABLE tags (id TEXT PRIMARY KEY, name TEXT NOT NULL UNIQUE, category TEXT);
+CREATE TABLE frameworks (
+    id TEXT PRIMARY KEY, code TEXT NOT NULL UNIQUE, name TEXT NOT NULL,
+    state TEXT, subject TEXT, grade_levels TEXT
+);
+CREATE TABLE standards (
+    id TEXT PRIMARY KEY, framework_id TEXT NOT NULL, code TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL, description TEXT, grade_level TEXT, strand TEXT, parent_id TEXT
+);
+CREATE TABLE events (
+    id TEXT PRIMARY KEY, source_id TEXT NOT NULL UNIQUE, topic_id TEXT NOT NULL,
+    title TEXT NOT NULL, description TEXT NOT NULL, date_start TEXT NOT NULL, date_end TEXT,
+    date_display TEXT NOT NULL, date_precision TEXT, location TEXT, significance TEXT,
+    source_url TEXT, source_citation TEXT, image_url TEXT
+);
+CREATE TABLE event_tags (event_id TEXT NOT NULL, tag_id TEXT NOT NULL, PRIMARY KEY (event_id, tag_id));
+CREATE TABLE event_standards (
+    event_id TEXT NOT NULL, standard_id TEXT NOT NULL, PRIMARY KEY (event_id, standard_id)
+);
+"""
+
+_EVENT_COLUMNS = (
+    "id", "source_id", "topic_id", "title", "description", "date_start", "date_end",
+    "date_display", "date_precision", "location", "significance", "source_url",
+    "source_citation", "image_url",
+)
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot is missing or was built with an incompatible format."""
+
+
+def catalog_id(kind: str, key: str) -> uuid.UUID:
+    """Deterministic id for a catalog row, e.g. catalog_id("topic", "civil_war")."""
+    return uuid.uuid5(CATALOG_NAMESPACE, f"{kind}:{key}")
+
+
+# ── build ────────────────────────────────────────────────────────────────────
+
+def build_snapshot(data_dir: Path = EVENT_DATA_DIR, output_path: Path = DEFAULT_SNAPSHOT_PATH) -> dict:
+    """
+    Compile the reference data and every *.json file in data_dir into a
+    snapshot at output_path, replacing any existing file.
+    Returns the snapshot's meta dict.
+    """
+    from ..seed import FRAMEWORKS_DATA, STANDARDS_DATA, TAGS_DATA
+
+    files = sorted(data_dir.glob("*.json"))
+    documents = []
+    digest = hashlib.sha256()
+    digest.update(json.dumps([TAGS_DATA, FRAMEWORKS_DATA, STANDARDS_DATA], sort_keys=True).encode())
+    for file_path in files:
+        raw = file_path.read_bytes()
+        digest.update(file_path.name.encode())
+        digest.update(raw)
+        documents.append(json.loads(raw))
+
+    tags = {t["name"]: (str(catalog_id("tag", t["name"])), t["name"], t["category"]) for t in TAGS_DATA}
+    frameworks = [
+        (str(catalog_id("framework", f["code"])), f["code"], f["name"], f["state"], f["subject"], f["grade_levels"])
+        for f in FRAMEWORKS_DATA
+    ]
+    standards = {
+        s["code"]: (
+            str(catalog_id("standard", s["code"])),
+            str(catalog_id("framework", s["framework"])),
+            s["code"],
+            s["title"],
+            s.get("description"),
+            s.get("grade_level"),
+            s.get("strand"),
+            str(catalog_id("standard", s["parent"])) if s.get("parent") else None,
+        )
+        for s in STANDARDS_DATA
+    }
+
+    topics = []
+    events = []
+    tag_links = []
+    standard_links = []
+    for data in documents:
+        topic_data = data["topic"]
+        topic_id = str(catalog_id("topic", topic_data["slug"]))
+        topics.append((topic_id, topic_data["slug"], topic_data["name"], topic_data.get("description")))
+
+        for raw in data["events"]:
+            parse_event_dates(raw)
+            event_id = str(catalog_id("event", raw["id"]))
+            events.append((
+                event_id,
+                raw["id"],
+                topic_id,
+                raw["title"],
+                raw["description"],
+                raw["date_start"],
+                raw.get("date_end"),
+                raw["date_display"],
+                raw.get("date_precision", "day"),
+                raw.get("location"),
+                raw.get("significance"),
+                raw.get("source_url"),
+                raw.get("source_citation"),
+                raw.get("image_url"),
+            ))
+            for name in dict.fromkeys(raw.get("tags", [])):
+                if name not in tags:
+                    tags[name] = (str(catalog_id("tag", name)), name, None)
+                tag_links.append((event_id, tags[name][0]))
+            # Unknown standard codes are skipped, matching import_events_from_file.
+            for code in dict.fromkeys(raw.get("standards", [])):
+                if code in standards:
+                    standard_links.append((event_id, standards[code][0]))
+
+    meta = {
+        "format_version": str(SNAPSHOT_FORMAT_VERSION),
+        "catalog_version": digest.hexdigest()[:16],
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "source_files": json.dumps([f.name for f in files]),
+        "event_count": str(len(events)),
+    }
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+        conn.executemany("INSERT INTO topics VALUES (?, ?, ?, ?)", topics)
+        conn.executemany("INSERT INTO tags VALUES (?, ?, ?)", tags.values())
+        conn.executemany("INSERT INTO frameworks VALUES (?, ?, ?, ?, ?, ?)", frameworks)
+        conn.executemany("INSERT INTO standards VALUES (?, ?, ?, ?, ?, ?, ?, ?)", standards.values())
+        conn.executemany(f"INSERT INTO events VALUES ({', '.join('?' * len(_EVENT_COLUMNS))})", events)
+        conn.executemany("INSERT INTO event_tags VALUES (?, ?)", tag_links)
+        conn.executemany("INSERT INTO event_standards VALUES (?, ?)", standard_links)
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    tmp_path.replace(output_path)
+    return meta
+
+
+# ── read ─────────────────────────────────────────────────────────────────────
+
+class CatalogSnapshot:
+    """Read-only, memory-mapped view over a snapshot file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise SnapshotError(f"Catalog snapshot not found: {self.path}")
+
+        self._conn = sqlite3.connect(
+            f"file:{self.path}?mode=ro&immutable=1", uri=True, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+
+        self.meta = {row["key"]: row["value"] for row in self._conn.execute("SELECT key, value FROM meta")}
+        if self.meta.get("format_version") != str(SNAPSHOT_FORMAT_VERSION):
+            self._conn.close()
+            raise SnapshotError(
+                f"Unsupported snapshot format {self.meta.get('format_version')!r}; "
+                f"expected {SNAPSHOT_FORMAT_VERSION}. Rebuild the snapshot."
+            )
+
+    @property
+    def catalog_version(self) -> str:
+        return self.meta["catalog_version"]
+
+    def _rows(self, sql: str, params: tuple = ()) -> list[dict]:
+        return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def topics(self) -> list[dict]:
+        return self._rows("SELECT id, slug, name, description FROM topics ORDER BY name")
+
+    def tags(self, category: Optional[str] = None) -> list[dict]:
+        if category:
+            return self._rows(
+                "SELECT id, name, category FROM tags WHERE category = ? ORDER BY name", (category,)
+            )
+        return self._rows("SELECT id, name, category FROM tags ORDER BY name")
+
+    def frameworks(self) -> list[dict]:
+        return self._rows(
+            "SELECT id, code, name, state, subject, grade_levels FROM frameworks ORDER BY name"
+        )
+
+    def standards(self) -> list[dict]:
+        return self._rows(
+            "SELECT id, framework_id, code, title, description, grade_level, strand, parent_id "
+            "FROM standards ORDER BY code"
+        )
+
+    def events(self) -> list[dict]:
+        return self._rows(f"SELECT {', '.join(_EVENT_COLUMNS)} FROM events ORDER BY date_start, source_id")
+
+    def event_tags(self) -> list[dict]:
+        return self._rows("SELECT event_id, tag_id FROM event_tags")
+
+    def event_standards(self) -> list[dict]:
+        return self._rows("SELECT event_id, standard_id FROM event_standards")
+
+
+@lru_cache()
+def get_snapshot(path: str) -> CatalogSnapshot:
+    """Open a snapshot once per process; warm containers reuse the mapping."""
+    return CatalogSnapshot(Path(path))
+
+
+# ── bulk load ────────────────────────────────────────────────────────────────
+
+def load_snapshot_into_db(db: Session, snapshot: CatalogSnapshot) -> dict:
+    """
+    Bulk-load a snapshot into the database.
+    - Rows missing from the DB (by natural key) are inserted with the snapshot's ids.
+    - Existing events are updated in place and their tags/standards replaced.
+    - Rows absent from the snapshot are left untouched.
+    Returns a summary dict.
+    """
+    topic_ids = _merge_by_key(db, Topic, "slug", snapshot.topics())
+    tag_ids = _merge_by_key(db, Tag, "name", snapshot.tags())
+    framework_ids = _merge_by_key(db, CurriculumFramework, "code", snapshot.frameworks())
+
+    standards = snapshot.standards()
+    for row in standards:
+        row["framework_id"] = framework_ids[row["framework_id"]]
+    standard_ids = _merge_by_key(db, CurriculumStandard, "code", standards, deferred=("parent_id",))
+    parent_updates = [
+        {"b_id": standard_ids[row["id"]], "parent_id": standard_ids[row["parent_id"]]}
+        for row in standards
+        if row["parent_id"]
+    ]
+    if parent_updates:
+        db.execute(
+            update(CurriculumStandard.__table__)
+            .where(CurriculumStandard.__table__.c.id == bindparam("b_id"))
+            .values(parent_id=bindparam("parent_id")),
+            parent_updates,
+        )
+    # Core inserts bypass the mapper events that maintain the closure table.
+    rebuild_standard_closure(db.connection())
+
+    events = snapshot.events()
+    for row in events:
+        row["topic_id"] = topic_ids[row["topic_id"]]
+        row["date_start"] = date.fromisoformat(row["date_start"])
+        row["date_end"] = date.fromisoformat(row["date_end"]) if row["date_end"] else None
+
+    existing = dict(
+        db.query(Event.source_id, Event.id)
+        .filter(Event.source_id.in_([row["source_id"] for row in events]))
+        .all()
+    )
+    event_ids = {}
+    new_rows = []
+    changed_rows = []
+    for row in events:
+        snapshot_id = row.pop("id")
+        if row["source_id"] in existing:
+            event_ids[snapshot_id] = existing[row["source_id"]]
+            changed_rows.append({"b_id": existing[row["source_id"]], **row})
+        else:
+            event_ids[snapshot_id] = uuid.UUID(snapshot_id)
+            new_rows.append({"id": uuid.UUID(snapshot_id), **row})
+
+    if new_rows:
+        db.execute(insert(Event.__table__), new_rows)
+    if changed_rows:
+        table = Event.__table__
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values({col: bindparam(col) for col in _EVENT_COLUMNS if col != "id"}),
+            changed_rows,
+        )
+        changed_ids = [row["b_id"] for row in changed_rows]
+        db.execute(delete(event_tags).where(event_tags.c.event_id.in_(changed_ids)))
+        db.execute(delete(event_standards).where(event_standards.c.event_id.in_(changed_ids)))
+
+    tag_links = [
+        {"event_id": event_ids[link["event_id"]], "tag_id": tag_ids[link["tag_id"]]}
+        for link in snapshot.event_tags()
+    ]
+    standard_links = [
+        {"event_id": event_ids[link["event_id"]], "standard_id": standard_ids[link["standard_id"]]}
+        for link in snapshot.event_standards()
+    ]
+    if tag_links:
+        db.execute(insert(event_tags), tag_links)
+    if standard_links:
+        db.execute(insert(event_standards), standard_links)
+
+    db.flush()
+    return {
+        "catalog_version": snapshot.catalog_version,
+        "topics": len(topic_ids),
+        "inserted": len(new_rows),
+        "updated": len(changed_rows),
+    }
+
+
+# ── helpers ──────────────────────────────────────────────────────────────────
+
+def _merge_by_key(db: Session, model, key: str, rows: list[dict], deferred: tuple = ()) -> dict:
+    """
+    Insert snapshot rows whose natural key is not yet in the table.
+    Returns a map of snapshot id -> database id for every row.
+    """
+    column = getattr(model, key)
+    existing = dict(db.query(column, model.id).filter(column.in_([row[key] for row in rows])).all())
+
+    ids = {}
+    missing = []
+    for row in rows:
+        if row[key] in existing:
+            ids[row["id"]] = existing[row[key]]
+        else:
+            ids[row["id"]] = uuid.UUID(row["id"])
+            missing.append({**row, "id": ids[row["id"]], **{col: None for col in deferred}})
+
+    if missing:
+        db.execute(insert(model.__table__), missing)
+    return ids
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build or inspect the catalog snapshot.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="compile event-data/*.json into a snapshot")
+    build_parser.add_argument("--data-dir", type=Path, default=EVENT_DATA_DIR)
+    build_parser.add_argument("--output", type=Path, default=DEFAULT_SNAPSHOT_PATH)
+    info_parser = subparsers.add_parser("info", help="print a snapshot's metadata")
+    info_parser.add_argument("path", type=Path, nargs="?", default=DEFAULT_SNAPSHOT_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        meta = build_snapshot(args.data_dir, args.output)
+        print(f"Wrote {args.output} (catalog {meta['catalog_version']}, {meta['event_count']} events)")
+    else:
+        print(json.dumps(CatalogSnapshot(args.path).meta, indent=2))
+
+
+if __name__ == "__main__":
+    main()
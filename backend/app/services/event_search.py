@@ -0,0 +1,208 @@
+"""
+Event search filters and facet counts.
+
+search_events and its facet counts apply the same filters, so they live here
+rather than in the router. facet_counts() answers every requested facet in
+one round trip: each facet is a GROUP BY over the filtered event ids, and the
+groups are combined with UNION ALL.
+"""
+from datetime import date
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import Date, and_, func, literal, literal_column, select, union_all
+from sqlalchemy.orm import Query, Session, joinedload, load_only, selectinload
+
+from ..models import (
+    CurriculumFramework,
+    CurriculumStandard,
+    Event,
+    Tag,
+    Topic,
+    curriculum_standard_closure,
+    event_standards,
+    event_tags,
+)
+from . import fuzzy_search
+
+FACETS = ("topic", "tag", "grade", "framework")
+# EventListResponse's fields, selectable with fields=; id is always returned.
+LIST_FIELDS = ("id", "title", "description", "date_start", "date_display", "location", "image_url", "tags")
+
+
+class EventFilters(NamedTuple):
+    topic: Optional[str] = None
+    q: Optional[str] = None
+    standard: Optional[UUID] = None
+    include_descendants: bool = False
+    tag: Optional[str] = None
+    grade: Optional[str] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    fuzzy: bool = False
+
+
+def parse_facets(value: Optional[str]) -> list[str]:
+    """"topic,tag" -> ["topic", "tag"]; raises ValueError for unknown names."""
+    names = [name.strip() for name in (value or "").split(",") if name.strip()]
+    unknown = sorted(set(names) - set(FACETS))
+    if unknown:
+        raise ValueError(f"Unknown facet(s): {', '.join(unknown)}; expected {', '.join(FACETS)}")
+    return list(dict.fromkeys(names))
+
+
+def date_overlap(dialect_name: str, date_from: Optional[date], date_to: Optional[date]):
+    """
+    Events whose [date_start, date_end] overlaps [date_from, date_to].
+
+    An event without date_end is a single day, and either bound may be open.
+    On PostgreSQL this is written as a daterange overlap matching the
+    expression of idx_events_daterange, so the GiST index applies.
+    """
+    if dialect_name == "postgresql":
+        inclusive = literal_column("'[]'")
+        span = func.daterange(Event.date_start, func.coalesce(Event.date_end, Event.date_start), inclusive)
+        return span.op("&&")(func.daterange(literal(date_from, Date), literal(date_to, Date), inclusive))
+    clauses = []
+    if date_to:
+        clauses.append(Event.date_start <= date_to)
+    if date_from:
+        clauses.append(func.coalesce(Event.date_end, Event.date_start) >= date_from)
+    return and_(*clauses)
+
+
+def parse_fields(value: Optional[str]) -> Optional[list[str]]:
+    """"title,date_start" -> ["id", "title", "date_start"]; None when no projection was asked for."""
+    if value is None:
+        return None
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = sorted(set(names) - set(LIST_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}; expected {', '.join(LIST_FIELDS)}")
+    return ["id", *(name for name in dict.fromkeys(names) if name != "id")]
+
+
+def listing_options(fields: Optional[list[str]], also: tuple = ()) -> list:
+    """Loader options fetching only `fields` (plus `also`) of Event, and tags only when listed."""
+    if fields is None:
+        return [joinedload(Event.tags)]
+    columns = dict.fromkeys(name for name in (*fields, *also) if name != "tags")
+    options = [load_only(*(getattr(Event, name) for name in columns))]
+    if "tags" in fields:
+        options.append(selectinload(Event.tags).load_only(Tag.id, Tag.name, Tag.category))
+    return options
+
+
+def project(event, fields: list[str]) -> dict:
+    """The listed fields of an Event (or an index row dict) as a plain dict."""
+    get = event.get if isinstance(event, dict) else lambda name: getattr(event, name)
+    row = {name: get(name) for name in fields if name != "tags"}
+    if "tags" in fields:
+        row["tags"] = [
+            tag if isinstance(tag, dict) else {"id": tag.id, "name": tag.name, "category": tag.category}
+            for tag in get("tags")
+        ]
+    return row
+
+
+def apply_filters(query: Query, db: Session, filters: EventFilters) -> Query:
+    """
+    Narrow a query over Event to the events matching `filters`.
+
+    Association filters are correlated EXISTS subqueries rather than joins:
+    each filter is checked independently, an event matching through several
+    rows is still one result row, and the planner can probe the association
+    tables' (event_id, ...) primary keys.
+    """
+    if filters.topic:
+        topic_obj = db.query(Topic).filter(Topic.slug == filters.topic).first()
+        if topic_obj:
+            query = query.filter(Event.topic_id == topic_obj.id)
+
+    if filters.q:
+        search_term = f"%{filters.q}%"
+        match = (Event.title.ilike(search_term)) | (Event.description.ilike(search_term))
+        if filters.fuzzy:
+            match = match | fuzzy_search.event_title_match(db, filters.q)
+        query = query.filter(match)
+
+    if filters.standard and filters.include_descendants:
+        closure = curriculum_standard_closure
+        query = query.filter(
+            select(event_standards.c.event_id)
+            .join(closure, closure.c.descendant_id == event_standards.c.standard_id)
+            .where(event_standards.c.event_id == Event.id, closure.c.ancestor_id == filters.standard)
+            .exists()
+        )
+    elif filters.standard:
+        query = query.filter(
+            select(event_standards.c.event_id)
+            .where(event_standards.c.event_id == Event.id, event_standards.c.standard_id == filters.standard)
+            .exists()
+        )
+
+    if filters.tag:
+        query = query.filter(
+            select(event_tags.c.event_id)
+            .join(Tag, Tag.id == event_tags.c.tag_id)
+            .where(event_tags.c.event_id == Event.id, Tag.name == filters.tag)
+            .exists()
+        )
+
+    if filters.grade:
+        query = query.filter(
+            select(event_standards.c.event_id)
+            .join(CurriculumStandard, CurriculumStandard.id == event_standards.c.standard_id)
+            .where(event_standards.c.event_id == Event.id, CurriculumStandard.grade_level == filters.grade)
+            .exists()
+        )
+
+    if filters.date_from or filters.date_to:
+        query = query.filter(date_overlap(db.get_bind().dialect.name, filters.date_from, filters.date_to))
+
+    return query
+
+
+def _facet_selects(event_ids, facets: list[str]) -> list:
+    standards = CurriculumStandard.__table__
+    selects = {
+        "topic": select(literal("topic"), Topic.slug, Topic.name, func.count(Event.id))
+        .join(Topic, Topic.id == Event.topic_id)
+        .where(Event.id.in_(event_ids))
+        .group_by(Topic.slug, Topic.name),
+        "tag": select(literal("tag"), Tag.name, Tag.name, func.count(event_tags.c.event_id))
+        .join(Tag, Tag.id == event_tags.c.tag_id)
+        .where(event_tags.c.event_id.in_(event_ids))
+        .group_by(Tag.name),
+        # An event aligned to several standards of one grade or framework counts once.
+        "grade": select(
+            literal("grade"), standards.c.grade_level, standards.c.grade_level,
+            func.count(event_standards.c.event_id.distinct()),
+        )
+        .join(standards, standards.c.id == event_standards.c.standard_id)
+        .where(event_standards.c.event_id.in_(event_ids), standards.c.grade_level.is_not(None))
+        .group_by(standards.c.grade_level),
+        "framework": select(
+            literal("framework"), CurriculumFramework.code, CurriculumFramework.name,
+            func.count(event_standards.c.event_id.distinct()),
+        )
+        .join(standards, standards.c.id == event_standards.c.standard_id)
+        .join(CurriculumFramework, CurriculumFramework.id == standards.c.framework_id)
+        .where(event_standards.c.event_id.in_(event_ids))
+        .group_by(CurriculumFramework.code, CurriculumFramework.name),
+    }
+    return [selects[name] for name in facets]
+
+
+def facet_counts(db: Session, filters: EventFilters, facets: list[str]) -> dict[str, list[dict]]:
+    """{facet: [{"value", "label", "count"}, ...]} over the events matching `filters`, most frequent first."""
+    result = {name: [] for name in facets}
+    if not facets:
+        return result
+    filtered = apply_filters(db.query(Event.id), db, filters).cte("filtered_events")
+    event_ids = select(filtered.c.id)
+    for facet, value, label, count in db.execute(union_all(*_facet_selects(event_ids, facets))):
+        result[facet].append({"value": value, "label": label, "count": count})
+    for counts in result.values():
+        counts.sort(key=lambda c: (-c["count"], c["value"]))
+    return result
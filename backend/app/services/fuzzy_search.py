@@ -0,0 +1,130 @@
+"""
+Typo-tolerant search with trigrams.
+
+On PostgreSQL, fuzzy matches use pg_trgm's word-similarity operator
+(`q <% column`) against GIN trigram indexes (migration 008), so "Gettysberg"
+finds "Battle of Gettysburg" without a scan. Other databases (SQLite in
+development and tests) have no trigram support. For them, TrigramIndex
+keeps an in-memory posting list per trigram, built once per catalog version.
+Candidates are looked up from the postings and then scored.
+
+Matches are ranked in Python with word_similarity(), which follows pg_trgm:
+the best similarity between the query's trigrams and any contiguous run of
+the text's trigrams. The ranking is therefore the same on every database.
+"""
+import re
+from collections import Counter
+from typing import Hashable, Iterable
+
+from sqlalchemy import false, literal, or_
+from sqlalchemy.orm import Session
+
+from ..models import CurriculumStandard, Event
+from .catalog_cache import catalog_cache, catalog_version
+
+# pg_trgm.word_similarity_threshold's default.
+FUZZY_THRESHOLD = 0.6
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _ordered_trigrams(text: str) -> list[str]:
+    """Trigrams of each word, padded like pg_trgm ("  w", " wo", ..., "rd "), in text order."""
+    grams = []
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def trigrams(text: str) -> set[str]:
+    return set(_ordered_trigrams(text))
+
+
+def word_similarity(query: str, text: str) -> float:
+    """pg_trgm's word_similarity(query, text), from 0 to 1."""
+    wanted = trigrams(query)
+    if not wanted:
+        return 0.0
+    ordered = _ordered_trigrams(text)
+    best = 0.0
+    for start, gram in enumerate(ordered):
+        if gram not in wanted:
+            continue  # an extent starting on a miss never beats the next hit
+        seen, count = set(), 0
+        for extent_gram in ordered[start:]:
+            if extent_gram in seen:
+                continue
+            seen.add(extent_gram)
+            if extent_gram in wanted:
+                count += 1
+                best = max(best, count / (len(wanted) + len(seen) - count))
+    return best
+
+
+class TrigramIndex:
+    """Posting lists from trigram to document keys."""
+
+    def __init__(self, documents: Iterable[tuple[Hashable, str]]):
+        self.texts: dict[Hashable, str] = {}
+        self._postings: dict[str, list[Hashable]] = {}
+        for key, text in documents:
+            self.texts[key] = text
+            for gram in trigrams(text):
+                self._postings.setdefault(gram, []).append(key)
+
+    def search(self, query: str, threshold: float = FUZZY_THRESHOLD) -> dict[Hashable, float]:
+        """{key: word_similarity} for documents scoring at least `threshold`."""
+        wanted = trigrams(query)
+        if not wanted:
+            return {}
+        hits = Counter()
+        for gram in wanted:
+            hits.update(self._postings.get(gram, ()))
+        # hits / len(wanted) bounds the similarity from above, so most keys are skipped unscored.
+        scores = {}
+        for key, count in hits.items():
+            if count / len(wanted) >= threshold:
+                score = word_similarity(query, self.texts[key])
+                if score >= threshold:
+                    scores[key] = score
+        return scores
+
+
+def _is_postgresql(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _index(db: Session, key: str, load) -> TrigramIndex:
+    version = catalog_version.current(db)
+    return catalog_cache.get_or_build(version, key, lambda: TrigramIndex(load()))
+
+
+def event_title_match(db: Session, q: str):
+    """WHERE clause for events whose title fuzzily contains q."""
+    if _is_postgresql(db):
+        return literal(q).op("<%")(Event.title)
+    index = _index(db, "event_title_trigrams", lambda: db.query(Event.id, Event.title).all())
+    ids = list(index.search(q))
+    return Event.id.in_(ids) if ids else false()
+
+
+def standard_match(db: Session, q: str):
+    """WHERE clause for standards whose code or title fuzzily contains q."""
+    if _is_postgresql(db):
+        return or_(literal(q).op("<%")(CurriculumStandard.title), literal(q).op("<%")(CurriculumStandard.code))
+
+    def load():
+        rows = db.query(CurriculumStandard.id, CurriculumStandard.code, CurriculumStandard.title)
+        return [(row.id, f"{row.code} {row.title}") for row in rows]
+
+    index = _index(db, "standard_trigrams", load)
+    ids = list(index.search(q))
+    return CurriculumStandard.id.in_(ids) if ids else false()
+
+
+def rank(q: str, items: list, *attributes: str) -> list:
+    """items by best word_similarity of q to any of the named attributes; ties keep their order."""
+    def score(item):
+        return max(word_similarity(q, getattr(item, name) or "") for name in attributes)
+    return sorted(items, key=lambda item: -score(item))
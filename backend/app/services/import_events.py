@@ -5,6 +5,7 @@ Events are identified by their source_id slug for upsert logic.
 import json
 from datetime import date
 from pathlib import Path
+from typing import Optional
 
 from sqlalchemy.orm import Session
 
@@ -38,8 +39,7 @@ def import_events_from_file(db: Session, file_path: Path) -> dict:
 
     for raw in data["events"]:
         source_id = raw["id"]
-        date_start = date.fromisoformat(raw["date_start"])
-        date_end = date.fromisoformat(raw["date_end"]) if raw.get("date_end") else None
+        date_start, date_end = parse_event_dates(raw)
 
         tags = _resolve_tags(db, raw.get("tags", []))
         standards = _resolve_standards(db, raw.get("standards", []))
@@ -84,6 +84,19 @@ def import_all_event_files(db: Session, data_dir: Path) -> list[dict]:
     return results
 
 
+def parse_event_dates(raw: dict) -> tuple[date, Optional[date]]:
+    """
+    (date_start, date_end) of a raw event.
+    Raises ValueError when date_end precedes date_start, which the events
+    table's CHECK constraint and date range index reject.
+    """
+    date_start = date.fromisoformat(raw["date_start"])
+    date_end = date.fromisoformat(raw["date_end"]) if raw.get("date_end") else None
+    if date_end is not None and date_end < date_start:
+        raise ValueError(f"Event {raw['id']!r}: date_end {date_end} is before date_start {date_start}")
+    return date_start, date_end
+
+
 # ── helpers ──────────────────────────────────────────────────────────────────
 
 def _apply_fields(event: Event, raw: dict, topic_id, date_start, date_end) -> None:
@@ -0,0 +1,99 @@
+"""
+Set-based maintenance actions, invoked from the Lambda handler.
+Each action issues a fixed number of statements regardless of table size.
+"""
+from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy.orm import Session, aliased
+
+from ..models import Event, TimelineEvent, event_standards, event_tags
+
+# How many duplicate pairs a dry-run report lists by title.
+DRY_RUN_SAMPLE_SIZE = 50
+
+
+def _duplicate_pairs():
+    """
+    Select (old_id, new_id) for every source_id=NULL event that shares a
+    title and topic with a source_id event. When several source_id events
+    match, the one with the lowest source_id is canonical.
+    """
+    canonical_keys = (
+        select(
+            Event.title,
+            Event.topic_id,
+            func.min(Event.source_id).label("source_id"),
+        )
+        .where(Event.source_id.is_not(None))
+        .group_by(Event.title, Event.topic_id)
+        .subquery("canonical_keys")
+    )
+    old = aliased(Event, name="old")
+    canonical = aliased(Event, name="canonical")
+    return (
+        select(old.id.label("old_id"), canonical.id.label("new_id"), old.title.label("title"))
+        .join(
+            canonical_keys,
+            and_(canonical_keys.c.title == old.title, canonical_keys.c.topic_id == old.topic_id),
+        )
+        .join(canonical, canonical.source_id == canonical_keys.c.source_id)
+        .where(old.source_id.is_(None))
+    )
+
+
+def deduplicate_events(db: Session, dry_run: bool = False) -> dict:
+    """
+    Remove source_id=NULL events that have a canonical source_id twin,
+    pointing their timeline_events at the twin first.
+    With dry_run=True nothing is modified and a sample of pairs is returned.
+    Returns a summary dict; the caller commits.
+    """
+    pairs = _duplicate_pairs().subquery("pairs")
+    old_ids = select(pairs.c.old_id)
+
+    duplicates = db.execute(select(func.count()).select_from(pairs)).scalar_one()
+    affected = db.execute(
+        select(func.count()).select_from(TimelineEvent).where(TimelineEvent.event_id.in_(old_ids))
+    ).scalar_one()
+
+    if dry_run:
+        sample = db.execute(
+            select(pairs.c.old_id, pairs.c.new_id, pairs.c.title)
+            .order_by(pairs.c.title)
+            .limit(DRY_RUN_SAMPLE_SIZE)
+        ).all()
+        return {
+            "dry_run": True,
+            "duplicates": duplicates,
+            "timeline_events_to_reassign": affected,
+            "sample": [
+                {"old_id": str(row.old_id), "new_id": str(row.new_id), "title": row.title}
+                for row in sample
+            ],
+        }
+
+    if not duplicates:
+        return {"dry_run": False, "deleted": 0, "timeline_events_reassigned": 0}
+
+    replacement = (
+        select(pairs.c.new_id)
+        .where(pairs.c.old_id == TimelineEvent.__table__.c.event_id)
+        .scalar_subquery()
+    )
+    reassigned = db.execute(
+        update(TimelineEvent.__table__)
+        .where(TimelineEvent.__table__.c.event_id.in_(old_ids))
+        .values(event_id=replacement)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+    # Association rows cascade on PostgreSQL; delete them explicitly so SQLite
+    # (foreign keys off by default) ends up in the same state.
+    db.execute(delete(event_tags).where(event_tags.c.event_id.in_(old_ids)))
+    db.execute(delete(event_standards).where(event_standards.c.event_id.in_(old_ids)))
+    deleted = db.execute(
+        delete(Event.__table__)
+        .where(Event.__table__.c.id.in_(old_ids))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+    return {"dry_run": False, "deleted": deleted, "timeline_events_reassigned": reassigned}
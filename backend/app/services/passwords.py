@@ -0,0 +1,69 @@
+"""
+Password hashing with a configurable bcrypt cost, run off the request threads.
+
+bcrypt is deliberately slow (~250ms at cost 12). Hashing inside a sync route
+holds one of the server's shared worker threads for that long, so a burst of
+logins at the start of a semester starves every other route. PasswordHasher
+runs bcrypt in its own small, bounded thread pool instead; the bcrypt C code
+releases the GIL, so the pool's threads hash in parallel while the event
+loop keeps serving other requests.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
+
+from ..config import get_settings
+
+settings = get_settings()
+
+
+class PasswordHasher:
+    """bcrypt at a fixed cost; hashes made at any other cost are upgraded on login."""
+
+    def __init__(self, rounds: int, max_workers: int):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self._context = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def context(self):
+        # passlib is imported on first use to keep it off the cold-start path.
+        if self._context is None:
+            from passlib.context import CryptContext
+
+            self._context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=self.rounds)
+        return self._context
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    def hash(self, password: str) -> str:
+        return self.context.hash(password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self.context.verify(password, hashed_password)
+
+    def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """
+        Check a password. When it matches but the stored hash used a different
+        cost (or scheme), also return a replacement hash to persist.
+        """
+        return self.context.verify_and_update(password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run(self.hash, password)
+
+    async def verify_and_update_async(self, password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        return await self._run(self.verify_and_update, password, hashed_password)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+
+password_hasher = PasswordHasher(settings.bcrypt_rounds, settings.password_hash_workers)
@@ -0,0 +1,65 @@
+"""
+Typeahead suggestions for event titles.
+
+PrefixIndex holds two sorted arrays of normalized keys: whole titles, and
+title suffixes starting at each later word ("of gettysburg", "gettysburg").
+A query is a bisect into each array, followed by a walk over the matching
+range until `limit` distinct events are found. Titles starting with the
+query come first, then titles containing a word starting with it, each
+alphabetically. The index is rebuilt once per catalog version, so a
+keystroke costs two bisects and never touches the database.
+"""
+import re
+from bisect import bisect_left
+from typing import Hashable, Iterable
+
+from sqlalchemy.orm import Session
+
+from ..models import Event
+from .catalog_cache import catalog_cache, catalog_version
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def normalize(text: str) -> list[str]:
+    return _WORD.findall(text.casefold())
+
+
+class PrefixIndex:
+    def __init__(self, documents: Iterable[tuple[Hashable, str, dict]]):
+        """documents: (key, text, payload) triples; payload is what suggest() returns."""
+        self.payloads: dict[Hashable, dict] = {}
+        titles, words = [], []
+        for key, text, payload in documents:
+            self.payloads[key] = payload
+            tokens = normalize(text)
+            if not tokens:
+                continue
+            titles.append((" ".join(tokens), key))
+            words.extend((" ".join(tokens[i:]), key) for i in range(1, len(tokens)))
+        # (normalized text, key) pairs sorted by text, and the texts alone for bisect.
+        self._entries = [sorted(titles, key=lambda entry: entry[0]), sorted(words, key=lambda entry: entry[0])]
+        self._texts = [[text for text, _ in entries] for entries in self._entries]
+
+    def suggest(self, query: str, limit: int = 10) -> list[dict]:
+        prefix = " ".join(normalize(query))
+        if not prefix:
+            return []
+        found: dict[Hashable, dict] = {}
+        for entries, texts in zip(self._entries, self._texts):
+            for position in range(bisect_left(texts, prefix), len(entries)):
+                text, key = entries[position]
+                if len(found) == limit or not text.startswith(prefix):
+                    break
+                found.setdefault(key, self.payloads[key])
+        return list(found.values())
+
+
+def event_prefix_index(db: Session) -> PrefixIndex:
+    """The suggestion index for the current catalog version, built on first use."""
+    def load():
+        rows = db.query(Event.id, Event.title, Event.date_start, Event.date_display)
+        return [(row.id, row.title, row._asdict()) for row in rows]
+
+    version = catalog_version.current(db)
+    return catalog_cache.get_or_build(version, "event_prefix_index", lambda: PrefixIndex(load()))
@@ -0,0 +1,145 @@
+"""
+Slow-query log.
+
+SlowQueryLog times every statement on an engine and, for those above a
+threshold, logs one JSON line with the normalized SQL, the shapes (types, not
+values) of the bound parameters, the route that issued it and, on PostgreSQL,
+optionally the EXPLAIN plan. Timing a statement costs two perf_counter calls;
+the expensive part (EXPLAIN and logging) only runs for the sampled fraction of
+slow statements.
+
+Enable with SLOW_QUERY_THRESHOLD_MS (plus SLOW_QUERY_SAMPLE_RATE and
+SLOW_QUERY_EXPLAIN). The route name comes from the request context that
+app.instrumentation provides.
+"""
+import hashlib
+import json
+import logging
+import random
+import re
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .instrumentation import current_request_stats
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+# qmark (SQLite), pyformat (psycopg2) and named placeholders.
+_PLACEHOLDER = re.compile(r"\?|%\(\w+\)s|%s|(?<!:):\w+")
+# "IN (?, ?, ?)" from expanding parameters collapses to "IN (?)".
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_sql(statement: str) -> str:
+    """Statement with literals and placeholders replaced by ?, for grouping."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(?)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def fingerprint(normalized_sql: str) -> str:
+    return hashlib.sha1(normalized_sql.encode()).hexdigest()[:12]
+
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+def parameter_shapes(parameters: Any, executemany: bool = False) -> Any:
+    """Types of the bound parameters; values are never logged."""
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "shape": parameter_shapes(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: _type_name(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_type_name(value) for value in parameters]
+    return _type_name(parameters)
+
+
+class SlowQueryLog:
+    """Logs statements slower than threshold_ms; keeps the most recent entries in memory."""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        sample_rate: float = 1.0,
+        explain: bool = False,
+        keep: int = 100,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.threshold_seconds = threshold_ms / 1000
+        self.sample_rate = sample_rate
+        self.explain = explain
+        self.recent: deque[dict] = deque(maxlen=keep)
+        self._rng = rng
+        # Bound methods are new objects on every access; keep one of each so
+        # the listeners can be found again by detach().
+        self._listeners = (
+            ("before_cursor_execute", self._before_cursor_execute),
+            ("after_cursor_execute", self._after_cursor_execute),
+        )
+
+    def attach(self, engine: Engine) -> None:
+        for name, fn in self._listeners:
+            if not event.contains(engine, name, fn):
+                event.listen(engine, name, fn)
+
+    def detach(self, engine: Engine) -> None:
+        for name, fn in self._listeners:
+            if event.contains(engine, name, fn):
+                event.remove(engine, name, fn)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["slow_query_start"].pop()
+        if elapsed < self.threshold_seconds or self._rng() >= self.sample_rate:
+            return
+
+        normalized = normalize_sql(statement)
+        stats = current_request_stats()
+        entry = {
+            "event": "slow_query",
+            "duration_ms": round(elapsed * 1000, 2),
+            "route": stats.route if stats else None,
+            "fingerprint": fingerprint(normalized),
+            "statement": normalized,
+            "parameters": parameter_shapes(parameters, executemany),
+        }
+        if self.explain and not executemany:
+            entry["plan"] = self._explain(conn, statement, parameters)
+        self.recent.append(entry)
+        logger.warning(json.dumps(entry))
+
+    @staticmethod
+    def _explain(conn, statement: str, parameters) -> Optional[list[str]]:
+        """EXPLAIN (no ANALYZE) of a SELECT on a separate cursor of the same connection."""
+        if conn.dialect.name != "postgresql" or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return None
+        # A failed EXPLAIN would abort the caller's transaction, so fence it
+        # with a savepoint.
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute("EXPLAIN " + statement, parameters)
+                plan = [row[0] for row in cursor.fetchall()]
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                logger.debug("EXPLAIN failed for slow query", exc_info=True)
+                plan = None
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        finally:
+            cursor.close()
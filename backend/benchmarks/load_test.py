@@ -0,0 +1,386 @@
+"""
+Load-test harness that replays classroom traffic against the app.
+
+Each scenario is a set of virtual users running short scripts concurrently:
+
+- autosave:  teachers editing their timelines, auto-saving every few seconds
+             (title updates with a reorder every third save)
+- classroom: 30 students opening the same public timeline, then a few of its events
+- catalog:   teachers browsing topics, tags, frameworks, standards and events
+- pdf_spike: pro teachers exporting PDFs at the same moment
+
+Requests go through one of three transports: "asgi" (in-process httpx),
+"mangum" (handler.handler with synthetic API Gateway HTTP API events, each
+worker thread standing in for one warm Lambda container) or a running server
+(--target, e.g. uvicorn; it must use the same database and SECRET_KEY, and
+REQUEST_INSTRUMENTATION=true for statement counts). Statement counts are read
+from the Server-Timing header that app.instrumentation adds.
+
+Run from backend/:
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --transport mangum --concurrency 10 --scenario classroom
+    python -m benchmarks.load_test --database-url postgresql://localhost/lessonlines_load --target http://localhost:8000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional
+from urllib.parse import urlencode
+
+from . import summarize
+
+SCENARIOS = ("autosave", "classroom", "catalog", "pdf_spike")
+_DB_STATEMENTS = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    headers: dict = {}
+    params: dict = {}
+    json: Optional[dict] = None
+
+
+class Response(NamedTuple):
+    status: int
+    seconds: float
+    db_statements: Optional[int]
+
+
+def parse_db_statements(server_timing: Optional[str]) -> Optional[int]:
+    match = _DB_STATEMENTS.search(server_timing or "")
+    return int(match.group(2)) if match else None
+
+
+# ── transports ───────────────────────────────────────────────────────────────
+
+class HttpxTransport:
+    """In-process ASGI (app given) or a running server (base_url given)."""
+
+    def __init__(self, app=None, base_url: str = "http://loadtest"):
+        import httpx
+
+        transport = httpx.ASGITransport(app=app) if app is not None else None
+        self.client = httpx.AsyncClient(transport=transport, base_url=base_url, timeout=60)
+
+    async def send(self, request: Request) -> Response:
+        start = time.perf_counter()
+        resp = await self.client.request(
+            request.method, request.path, headers=request.headers, params=request.params, json=request.json
+        )
+        await resp.aread()
+        elapsed = time.perf_counter() - start
+        return Response(resp.status_code, elapsed, parse_db_statements(resp.headers.get("server-timing")))
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def api_gateway_event(request: Request) -> dict:
+    """API Gateway HTTP API (payload v2.0) event for one request."""
+    headers = {"host": "loadtest.local", "user-agent": "load-test", **{k.lower(): v for k, v in request.headers.items()}}
+    body = None
+    if request.json is not None:
+        body = json.dumps(request.json)
+        headers["content-type"] = "application/json"
+    return {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": request.path,
+        "rawQueryString": urlencode(request.params),
+        "headers": headers,
+        "requestContext": {
+            "accountId": "000000000000",
+            "apiId": "loadtest",
+            "domainName": "loadtest.local",
+            "requestId": str(uuid.uuid4()),
+            "stage": "$default",
+            "timeEpoch": int(time.time() * 1000),
+            "http": {
+                "method": request.method,
+                "path": request.path,
+                "protocol": "HTTP/1.1",
+                "sourceIp": "127.0.0.1",
+                "userAgent": "load-test",
+            },
+        },
+        "body": body,
+        "isBase64Encoded": False,
+    }
+
+
+class MangumTransport:
+    """Invokes handler.handler from a pool of threads, one per simulated container."""
+
+    def __init__(self, containers: int):
+        import handler
+
+        self.handler = handler.handler
+        # Mangum drives each request with asyncio.get_event_loop(), which
+        # worker threads don't have until one is set.
+        self.pool = ThreadPoolExecutor(
+            max_workers=containers,
+            thread_name_prefix="lambda",
+            initializer=lambda: asyncio.set_event_loop(asyncio.new_event_loop()),
+        )
+
+    def _invoke(self, request: Request) -> Response:
+        start = time.perf_counter()
+        result = self.handler(api_gateway_event(request), None)
+        elapsed = time.perf_counter() - start
+        headers = {k.lower(): v for k, v in (result.get("headers") or {}).items()}
+        return Response(result["statusCode"], elapsed, parse_db_statements(headers.get("server-timing")))
+
+    async def send(self, request: Request) -> Response:
+        return await asyncio.get_running_loop().run_in_executor(self.pool, self._invoke, request)
+
+    async def close(self) -> None:
+        self.pool.shutdown()
+
+
+# ── scenarios ────────────────────────────────────────────────────────────────
+
+class ScenarioContext(NamedTuple):
+    rng: random.Random
+    topic_slugs: list[str]
+    event_ids: list[str]
+    framework_codes: list[str]
+    # (timeline_id, auth headers, timeline entry ids, is_pro)
+    timelines: list[tuple[str, dict, list[str], bool]]
+    public_timeline_id: str
+    public_event_ids: list[str]
+
+
+def autosave(ctx: ScenarioContext, users: int) -> list[list[Request]]:
+    scripts = []
+    for timeline_id, headers, entry_ids, _ in ctx.timelines[:users]:
+        script = []
+        for save in range(9):
+            script.append(Request("PUT", f"/api/timelines/{timeline_id}", headers, json={"title": f"Unit draft {save}"}))
+            if save % 3 == 2:
+                order = list(entry_ids)
+                ctx.rng.shuffle(order)
+                script.append(Request("PUT", f"/api/timelines/{timeline_id}/events/reorder", headers, json={"positions": order}))
+        scripts.append(script)
+    return scripts
+
+
+def classroom(ctx: ScenarioContext, users: int) -> list[list[Request]]:
+    scripts = []
+    for _ in range(users):
+        script = [Request("GET", f"/api/public/timelines/{ctx.public_timeline_id}")]
+        for event_id in ctx.rng.sample(ctx.public_event_ids, min(3, len(ctx.public_event_ids))):
+            script.append(Request("GET", f"/api/events/{event_id}"))
+        scripts.append(script)
+    return scripts
+
+
+def catalog(ctx: ScenarioContext, users: int) -> list[list[Request]]:
+    scripts = []
+    for _ in range(users):
+        script = [
+            Request("GET", "/api/topics"),
+            Request("GET", "/api/tags"),
+            Request("GET", "/api/standards/frameworks"),
+            Request("GET", "/api/standards", params={"framework": ctx.rng.choice(ctx.framework_codes)}),
+            Request("GET", "/api/events", params={"topic": ctx.rng.choice(ctx.topic_slugs)}),
+        ]
+        script += [Request("GET", f"/api/events/{event_id}") for event_id in ctx.rng.sample(ctx.event_ids, 3)]
+        scripts.append(script)
+    return scripts
+
+
+def pdf_spike(ctx: ScenarioContext, users: int) -> list[list[Request]]:
+    pro = [t for t in ctx.timelines if t[3]]
+    return [[Request("POST", f"/api/timelines/{timeline_id}/export/pdf", headers)] for timeline_id, headers, _, _ in pro[:users]]
+
+
+SCENARIO_BUILDERS: dict[str, tuple[Callable, int]] = {
+    # name: (builder, default virtual users)
+    "autosave": (autosave, 20),
+    "classroom": (classroom, 30),
+    "catalog": (catalog, 20),
+    "pdf_spike": (pdf_spike, 10),
+}
+
+
+async def run_scenario(transport, scripts: list[list[Request]], concurrency: int) -> dict:
+    gate = asyncio.Semaphore(concurrency)
+    responses: list[Response] = []
+
+    async def virtual_user(script: list[Request]) -> None:
+        async with gate:
+            for request in script:
+                responses.append(await transport.send(request))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(virtual_user(script) for script in scripts))
+    elapsed = time.perf_counter() - start
+
+    statements = [r.db_statements for r in responses if r.db_statements is not None]
+    return {
+        "virtual_users": len(scripts),
+        "requests": len(responses),
+        "errors": sum(1 for r in responses if r.status >= 400),
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(len(responses) / elapsed, 2) if elapsed else 0.0,
+        "latency": summarize([r.seconds for r in responses]),
+        "db_statements": {
+            "total": sum(statements),
+            "per_request_mean": round(sum(statements) / len(statements), 2) if statements else None,
+            "per_request_max": max(statements, default=None),
+        },
+    }
+
+
+# ── setup ────────────────────────────────────────────────────────────────────
+
+def prepare(engine, scale: str, seed: int) -> ScenarioContext:
+    """Generate the synthetic dataset and pick the timelines and events scenarios use."""
+    from sqlalchemy import select, update
+
+    from app.models import CurriculumFramework, TimelineEvent, Timeline, User
+    from app.services.auth import create_user_access_token
+
+    from .synthetic import SCALES, generate
+
+    dataset = generate(engine, seed=seed, **SCALES[scale])
+    timelines = []
+    with engine.begin() as conn:
+        for timeline_id, user_id, is_pro in dataset.sample_timelines:
+            entry_ids = conn.execute(
+                select(TimelineEvent.id).where(TimelineEvent.timeline_id == timeline_id)
+            ).scalars().all()
+            token = create_user_access_token(User(id=user_id, is_pro=is_pro, is_admin=False, token_version=0))
+            timelines.append((str(timeline_id), {"Authorization": f"Bearer {token}"}, [str(i) for i in entry_ids], is_pro))
+
+        public_id = dataset.sample_timelines[0][0]
+        conn.execute(update(Timeline).where(Timeline.id == public_id).values(is_public=True))
+        public_event_ids = conn.execute(
+            select(TimelineEvent.event_id).where(TimelineEvent.timeline_id == public_id, TimelineEvent.event_id.is_not(None))
+        ).scalars().all()
+        framework_codes = conn.execute(select(CurriculumFramework.code)).scalars().all()
+
+    return ScenarioContext(
+        rng=random.Random(seed),
+        topic_slugs=dataset.topic_slugs,
+        event_ids=[str(i) for i in dataset.event_ids],
+        framework_codes=framework_codes,
+        timelines=timelines,
+        public_timeline_id=str(public_id),
+        public_event_ids=[str(i) for i in public_event_ids],
+    )
+
+
+async def run(
+    scenarios: list[str],
+    transport_name: str,
+    concurrency: int,
+    users: Optional[int] = None,
+    scale: str = "small",
+    seed: int = 1,
+    database_url: Optional[str] = None,
+    target: Optional[str] = None,
+) -> dict:
+    # Statement counts come from Server-Timing, so turn instrumentation on
+    # before the app (and its settings) are imported.
+    os.environ.setdefault("REQUEST_INSTRUMENTATION", "true")
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.database import Base, engine_options, get_db
+    from app.instrumentation import instrument_engine
+    from app.main import app
+
+    tmp = None
+    if not database_url:
+        # A file rather than :memory: so each worker thread gets its own connection.
+        tmp = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{tmp.name}/load_test.db"
+    engine = create_engine(database_url, **engine_options(database_url, "server"))
+    Base.metadata.create_all(bind=engine)
+    instrument_engine(engine)
+    ctx = prepare(engine, scale, seed)
+
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    previous_override = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = override_get_db
+    if target:
+        transport = HttpxTransport(base_url=target)
+    elif transport_name == "mangum":
+        transport = MangumTransport(concurrency)
+    else:
+        transport = HttpxTransport(app=app)
+
+    results = {}
+    try:
+        for name in scenarios:
+            builder, default_users = SCENARIO_BUILDERS[name]
+            results[name] = await run_scenario(transport, builder(ctx, users or default_users), concurrency)
+    finally:
+        await transport.close()
+        if previous_override is None:
+            app.dependency_overrides.pop(get_db, None)
+        else:
+            app.dependency_overrides[get_db] = previous_override
+        engine.dispose()
+        if tmp is not None:
+            tmp.cleanup()
+
+    return {
+        "load_test": scenarios,
+        "transport": "http" if target else transport_name,
+        "target": target,
+        "database": engine.dialect.name,
+        "scale": scale,
+        "concurrency": concurrency,
+        "scenarios": results,
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="repeatable (default: all)")
+    parser.add_argument("--transport", choices=["asgi", "mangum"], default="asgi")
+    parser.add_argument("--target", help="base URL of a running server; overrides --transport")
+    parser.add_argument("--concurrency", type=int, default=30, help="concurrent virtual users (containers for mangum)")
+    parser.add_argument("--users", type=int, help="virtual users per scenario (default: per-scenario)")
+    parser.add_argument("--scale", choices=["tiny", "small", "full"], default="small")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--database-url", help="empty database to load (default: temporary SQLite file)")
+    args = parser.parse_args(argv)
+    if args.target and not args.database_url:
+        parser.error("--target needs --database-url pointing at the server's (empty) database")
+
+    result = asyncio.run(run(
+        args.scenario or list(SCENARIOS),
+        args.transport,
+        args.concurrency,
+        users=args.users,
+        scale=args.scale,
+        seed=args.seed,
+        database_url=args.database_url,
+        target=args.target,
+    ))
+    print(json.dumps(result, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
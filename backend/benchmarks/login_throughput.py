@@ -0,0 +1,125 @@
+"""
+Login-storm benchmark.
+
+Fires a burst of concurrent logins at the app in-process (httpx + ASGI, an
+in-memory SQLite database) while a second stream of clients browses
+/api/topics, and reports login throughput plus the latency of the browsing
+requests during the storm. With bcrypt on its own pool the browsing latency
+should stay close to its idle value.
+
+Run from backend/:
+    python -m benchmarks.login_throughput --logins 200 --concurrency 50 --rounds 12
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from . import summarize
+
+
+async def _timed(client, method: str, url: str, samples: list[float], **kwargs) -> int:
+    start = time.perf_counter()
+    resp = await client.request(method, url, **kwargs)
+    samples.append(time.perf_counter() - start)
+    return resp.status_code
+
+
+async def run(logins: int, concurrency: int, browsers: int) -> dict:
+    import httpx
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.database import Base, get_db
+    from app.main import app
+    from app.models import Topic, User
+    from app.services.passwords import password_hasher
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    hashed = password_hasher.hash("password123")
+    with Session() as db:
+        db.add(Topic(slug="civil_war", name="American Civil War"))
+        db.add_all(User(email=f"user{i}@example.com", hashed_password=hashed) for i in range(logins))
+        db.commit()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        idle_samples: list[float] = []
+        for _ in range(20):
+            await _timed(client, "GET", "/api/topics", idle_samples)
+
+        login_samples: list[float] = []
+        browse_samples: list[float] = []
+        gate = asyncio.Semaphore(concurrency)
+        storm_running = True
+
+        async def login(i: int) -> int:
+            async with gate:
+                return await _timed(
+                    client, "POST", "/api/auth/login", login_samples,
+                    data={"username": f"user{i}@example.com", "password": "password123"},
+                )
+
+        async def browse():
+            while storm_running:
+                await _timed(client, "GET", "/api/topics", browse_samples)
+
+        browsers_tasks = [asyncio.create_task(browse()) for _ in range(browsers)]
+        start = time.perf_counter()
+        statuses = await asyncio.gather(*(login(i) for i in range(logins)))
+        elapsed = time.perf_counter() - start
+        storm_running = False
+        await asyncio.gather(*browsers_tasks)
+
+    app.dependency_overrides.pop(get_db, None)
+    return {
+        "benchmark": "login_throughput",
+        "bcrypt_rounds": password_hasher.rounds,
+        "hash_workers": password_hasher.max_workers,
+        "logins": logins,
+        "concurrency": concurrency,
+        "failed_logins": sum(1 for s in statuses if s != 200),
+        "elapsed_s": round(elapsed, 3),
+        "logins_per_s": round(logins / elapsed, 2),
+        "login_latency": summarize(login_samples),
+        "browse_latency_idle": summarize(idle_samples),
+        "browse_latency_during_storm": summarize(browse_samples),
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--browsers", type=int, default=5, help="concurrent /api/topics clients")
+    parser.add_argument("--rounds", type=int, help="bcrypt cost (default: BCRYPT_ROUNDS or 12)")
+    parser.add_argument("--workers", type=int, help="bcrypt threads (default: PASSWORD_HASH_WORKERS or 4)")
+    args = parser.parse_args(argv)
+
+    # Settings are read once at import, so configure them before importing the app.
+    if args.rounds:
+        os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    if args.workers:
+        os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+
+    result = asyncio.run(run(args.logins, args.concurrency, args.browsers))
+    print(json.dumps(result, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
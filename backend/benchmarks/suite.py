@@ -0,0 +1,276 @@
+"""
+Core benchmark suite.
+
+Generates a synthetic dataset (see benchmarks.synthetic), then times the hot
+paths through the real app: event search with common filter combinations,
+loading a timeline, adding/removing/reordering timeline entries, importing an
+event file, and PDF export. Results are printed (and optionally written) as
+JSON; --compare flags p50 regressions against an earlier results file.
+
+Run from backend/:
+    python -m benchmarks.suite --scale small --output bench.json
+    python -m benchmarks.suite --scale small --compare bench.json
+    python -m benchmarks.suite --scale full --database-url postgresql://localhost/lessonlines_bench
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import summarize
+
+
+def measure(fn: Callable[[], object], iterations: int, warmup: int = 2) -> list[float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _ok(resp):
+    if resp.status_code != 200:
+        raise RuntimeError(f"{resp.request.method} {resp.request.url} -> {resp.status_code}: {resp.text[:200]}")
+    return resp
+
+
+def run(scale: str, iterations: int, seed: int = 1, database_url: Optional[str] = None) -> dict:
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.config import get_settings
+    from app.database import Base, get_db
+    from app.main import app
+    from app.models import User
+    from app.services.auth import create_user_access_token
+    from app.services.import_events import import_events_from_file
+
+    from .synthetic import SCALES, generate, write_import_file
+
+    if database_url:
+        engine = create_engine(database_url)
+    else:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    started = time.perf_counter()
+    dataset = generate(engine, seed=seed, **SCALES[scale])
+    generate_seconds = time.perf_counter() - started
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    previous_override = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+    rng = random.Random(seed)
+    settings = get_settings()
+    index_enabled = settings.catalog_index_enabled
+
+    def auth(user_id, is_pro: bool) -> dict:
+        user = User(id=user_id, is_pro=is_pro, is_admin=False, token_version=0)
+        return {"Authorization": f"Bearer {create_user_access_token(user)}"}
+
+    samples: dict[str, list[float]] = {}
+    try:
+        # ── search ──
+        tags, grades = dataset.tag_names, ["5", "8", "9-10", "11-12", "AP"]
+        search_cases = {
+            "search_events.topic": lambda: {"topic": rng.choice(dataset.topic_slugs)},
+            "search_events.q": lambda: {"q": rng.choice(["Siege", "Boston", "Charter"])},
+            "search_events.q_fuzzy": lambda: {"q": rng.choice(["Seige", "Bostn", "Chartr"]), "fuzzy": True},
+            "search_events.tag": lambda: {"tag": rng.choice(tags[-20:])},
+            "search_events.grade": lambda: {"grade": rng.choice(grades)},
+            # What a list page renders, without descriptions.
+            "search_events.grade_compact": lambda: {"grade": rng.choice(grades), "fields": "title,date_display,tags"},
+            "search_events.topic_tag_grade": lambda: {
+                "topic": rng.choice(dataset.topic_slugs), "tag": rng.choice(tags[:10]), "grade": rng.choice(grades),
+            },
+            # Several association filters at once, on popular standards and tags.
+            "search_events.standard_grade_tag": lambda: {
+                "standard": str(rng.choice(dataset.standard_ids[:10])), "grade": rng.choice(grades), "tag": rng.choice(tags[:10]),
+            },
+            "search_events.subtree_grade_tag": lambda: {
+                "standard": str(rng.choice(dataset.strand_ids)), "include_descendants": True,
+                "grade": rng.choice(grades), "tag": rng.choice(tags[:10]),
+            },
+            # Era browsing: one decade, alone and within a topic.
+            "search_events.decade": lambda: _decade(rng),
+            "search_events.topic_decade": lambda: {"topic": rng.choice(dataset.topic_slugs), **_decade(rng)},
+            "search_events.facets": lambda: {"grade": rng.choice(grades), "facets": "topic,tag,grade,framework"},
+        }
+        for name, params in search_cases.items():
+            samples[name] = measure(lambda: _ok(client.get("/api/events", params=params())), iterations)
+
+        # A timeline preview's worth of events in one request.
+        samples["get_events_batch.20"] = measure(
+            lambda: _ok(client.post("/api/events/batch", json={"ids": [str(i) for i in rng.sample(dataset.event_ids, 20)]})),
+            iterations,
+        )
+
+        # Typeahead, one request per keystroke.
+        samples["suggest_events"] = measure(
+            lambda: _ok(client.get("/api/events/suggest", params={"q": rng.choice(["s", "si", "sie", "bos", "charter o"])})),
+            iterations,
+        )
+
+        # The same filters answered from the in-memory catalog index.
+        settings.catalog_index_enabled = True
+        try:
+            for name in ("search_events.topic_tag_grade", "search_events.facets"):
+                params = search_cases[name]
+                samples[name.replace("search_events.", "search_events.indexed.")] = measure(
+                    lambda: _ok(client.get("/api/events", params=params())), iterations
+                )
+        finally:
+            settings.catalog_index_enabled = index_enabled
+
+        # ── timelines ──
+        timelines = dataset.sample_timelines
+        headers = {user_id: auth(user_id, is_pro) for _, user_id, is_pro in timelines}
+        samples["get_timeline"] = measure(lambda: _get_random_timeline(client, rng, timelines, headers), iterations)
+
+        # Add an entry and remove it again, so every iteration sees the same timeline.
+        timeline_id, user_id, _ = timelines[0]
+        owner = headers[user_id]
+        url = f"/api/timelines/{timeline_id}"
+        existing_ids = [e["id"] for e in _ok(client.get(url, headers=owner)).json()["events"]]
+        add_samples, remove_samples = [], []
+        for i in range(iterations + 2):
+            start = time.perf_counter()
+            added = _ok(client.post(f"{url}/events", headers=owner, json={"event_id": str(rng.choice(dataset.event_ids))}))
+            added_at = time.perf_counter()
+            position = next(e["position"] for e in added.json()["events"] if e["id"] not in existing_ids)
+            removed_at = time.perf_counter()
+            _ok(client.delete(f"{url}/events/{position}", headers=owner))
+            if i >= 2:
+                add_samples.append(added_at - start)
+                remove_samples.append(time.perf_counter() - removed_at)
+        samples["timeline.add_event"] = add_samples
+        samples["timeline.remove_event"] = remove_samples
+
+        orders = [existing_ids, existing_ids[::-1]]
+        samples["timeline.reorder"] = measure(
+            lambda: _ok(client.put(f"{url}/events/reorder", headers=owner, json={"positions": rng.choice(orders)})),
+            iterations,
+        )
+
+        pro_timelines = [t for t in timelines if t[2]]
+        samples["export_pdf"] = measure(
+            lambda: _export_random_timeline(client, rng, pro_timelines, headers), max(3, iterations // 4)
+        )
+
+        # ── import ──
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_import_file(Path(tmp) / "synthetic_import.json", dataset, events=500, seed=seed)
+
+            def import_and_rollback():
+                with Session() as db:
+                    import_events_from_file(db, path)
+                    db.rollback()
+
+            samples["import_events.500"] = measure(import_and_rollback, max(3, iterations // 4), warmup=1)
+    finally:
+        if previous_override is None:
+            app.dependency_overrides.pop(get_db, None)
+        else:
+            app.dependency_overrides[get_db] = previous_override
+
+    return {
+        "suite": "core",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "scale": scale,
+        "seed": seed,
+        "iterations": iterations,
+        "dataset": dataset.counts,
+        "generate_s": round(generate_seconds, 2),
+        "results": {name: summarize(values) for name, values in samples.items()},
+    }
+
+
+def _decade(rng) -> dict:
+    start = rng.randrange(1500, 1990, 10)
+    return {"date_from": f"{start}-01-01", "date_to": f"{start + 9}-12-31"}
+
+
+def _get_random_timeline(client, rng, timelines, headers):
+    timeline_id, user_id, _ = rng.choice(timelines)
+    return _ok(client.get(f"/api/timelines/{timeline_id}", headers=headers[user_id]))
+
+
+def _export_random_timeline(client, rng, timelines, headers):
+    timeline_id, user_id, _ = rng.choice(timelines)
+    return _ok(client.post(f"/api/timelines/{timeline_id}/export/pdf", headers=headers[user_id]))
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.2) -> list[dict]:
+    """Benchmarks whose p50 grew by more than `tolerance` (a fraction) over the baseline."""
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or not before["p50_ms"]:
+            continue
+        ratio = result["p50_ms"] / before["p50_ms"]
+        if ratio > 1 + tolerance:
+            regressions.append({
+                "benchmark": name,
+                "baseline_p50_ms": before["p50_ms"],
+                "p50_ms": result["p50_ms"],
+                "ratio": round(ratio, 2),
+            })
+    return regressions
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scale", choices=["tiny", "small", "full"], default="small")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--database-url", help="empty database to benchmark against (default: in-memory SQLite)")
+    parser.add_argument("--output", type=Path, help="also write the results JSON here")
+    parser.add_argument("--compare", type=Path, help="results JSON from an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p50 growth for --compare")
+    args = parser.parse_args(argv)
+
+    result = run(args.scale, args.iterations, seed=args.seed, database_url=args.database_url)
+    if args.compare:
+        result["regressions"] = compare(json.loads(args.compare.read_text()), result, args.tolerance)
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n")
+    if result.get("regressions"):
+        sys.exit(1)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Deterministic synthetic catalog and user data for benchmarks.
+
+generate() bulk-inserts topics, tags, frameworks with a two-level standards
+hierarchy, events with skewed tag/standard fan-out (a few popular tags and
+standards, a long tail of rare ones), users, and timelines mixing curated and
+custom entries. The same seed always produces the same rows and ids, so runs
+on different commits measure the same data.
+"""
+import json
+import random
+import uuid
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+from typing import NamedTuple
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+
+from app.models import (
+    CurriculumFramework,
+    CurriculumStandard,
+    Event,
+    Tag,
+    Timeline,
+    TimelineEvent,
+    Topic,
+    User,
+    event_standards,
+    event_tags,
+    rebuild_standard_closure,
+)
+
+SCALES = {
+    "tiny": {"events": 200, "users": 20},
+    "small": {"events": 5_000, "users": 500},
+    "full": {"events": 100_000, "users": 10_000},
+}
+
+TAG_CATEGORIES = ["military", "political", "social", "economic", "cultural", "science"]
+GRADE_LEVELS = ["5", "8", "9-10", "11-12", "AP"]
+_ADJECTIVES = ["Great", "Second", "Northern", "Treaty", "Siege", "Battle", "Founding", "Fall", "Rise", "Crisis"]
+_NOUNS = ["Compromise", "Convention", "Rebellion", "Expedition", "Reform", "Uprising", "Charter", "Alliance"]
+_PLACES = ["Boston", "Paris", "Richmond", "Vicksburg", "Philadelphia", "Yorktown", "Saratoga", "Lyon", "Normandy"]
+# Synthetic users never log in, so a bcrypt-shaped placeholder is enough.
+_PLACEHOLDER_HASH = "$2b$04$KHB6F0vPq1lXr4o6kC0aE.5lq7y7m2m5yJ7E0j7q7Xz8f4cQeC0yS"
+_CHUNK = 5_000
+
+
+class Dataset(NamedTuple):
+    counts: dict
+    topic_slugs: list[str]
+    tag_names: list[str]
+    standard_codes: list[str]
+    # Leaf standards, most frequently aligned first, and their parent strands.
+    standard_ids: list[uuid.UUID]
+    strand_ids: list[uuid.UUID]
+    event_ids: list[uuid.UUID]
+    # (timeline_id, user_id, is_pro) for the first timelines generated.
+    sample_timelines: list[tuple[uuid.UUID, uuid.UUID, bool]]
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+@lru_cache(maxsize=None)
+def _zipf_weights(n: int) -> list[float]:
+    return list(accumulate(1 / (i + 1) for i in range(n)))
+
+
+def _skewed(rng: random.Random, population: list, k: int) -> list:
+    """k distinct picks where the i-th item is ~1/(i+1) as likely as the first."""
+    cum_weights = _zipf_weights(len(population))
+    picked = {}
+    while len(picked) < min(k, len(population)):
+        index = rng.choices(range(len(population)), cum_weights=cum_weights)[0]
+        picked[index] = population[index]
+    return list(picked.values())
+
+
+def _title(rng: random.Random, i: int) -> str:
+    return f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)} of {rng.choice(_PLACES)} #{i}"
+
+
+def _insert(conn, table, rows: list[dict]) -> None:
+    for start in range(0, len(rows), _CHUNK):
+        conn.execute(table.insert(), rows[start:start + _CHUNK])
+
+
+def generate(
+    engine: Engine,
+    events: int,
+    users: int,
+    topics: int = 20,
+    timelines_per_user: float = 2.0,
+    seed: int = 1,
+) -> Dataset:
+    """Insert a synthetic dataset into an empty schema and describe what was made."""
+    with engine.connect() as conn:
+        if conn.execute(select(func.count()).select_from(Event.__table__)).scalar():
+            raise ValueError("synthetic data needs an empty database; the events table has rows")
+    rng = random.Random(seed)
+
+    topic_rows = [
+        {"id": _uuid(rng), "slug": f"topic_{i:02d}", "name": f"Synthetic Topic {i}", "description": "Generated"}
+        for i in range(topics)
+    ]
+    tag_rows = [
+        {"id": _uuid(rng), "name": f"{category}-{i}", "category": category}
+        for category in TAG_CATEGORIES
+        for i in range(8)
+    ]
+    rng.shuffle(tag_rows)
+
+    framework_rows, standard_rows, leaf_standards = [], [], []
+    for f in range(4):
+        framework_id = _uuid(rng)
+        framework_rows.append({"id": framework_id, "code": f"SYN{f}", "name": f"Synthetic Framework {f}", "subject": "History"})
+        for s in range(10):
+            strand_id = _uuid(rng)
+            standard_rows.append({
+                "id": strand_id, "framework_id": framework_id, "code": f"SYN{f}.{s}",
+                "title": f"Strand {s}", "grade_level": None, "strand": f"Strand {s}", "parent_id": None,
+            })
+            for c in range(10):
+                leaf = {
+                    "id": _uuid(rng), "framework_id": framework_id, "code": f"SYN{f}.{s}.{c}",
+                    "title": f"Standard {f}.{s}.{c}", "description": "Generated standard",
+                    "grade_level": rng.choice(GRADE_LEVELS), "strand": f"Strand {s}", "parent_id": strand_id,
+                }
+                standard_rows.append(leaf)
+                leaf_standards.append(leaf)
+    rng.shuffle(leaf_standards)
+
+    event_rows, tag_links, standard_links = [], [], []
+    event_dates = {}
+    for i in range(events):
+        event_id = _uuid(rng)
+        start = date(1492, 1, 1) + timedelta(days=rng.randrange(185_000))
+        end = start + timedelta(days=rng.randrange(1, 400)) if rng.random() < 0.3 else None
+        event_dates[event_id] = start
+        event_rows.append({
+            "id": event_id,
+            "source_id": f"syn_{i:06d}",
+            "topic_id": rng.choice(topic_rows)["id"],
+            "title": _title(rng, i),
+            "description": " ".join(rng.choices(_NOUNS + _PLACES + _ADJECTIVES, k=40)),
+            "date_start": start,
+            "date_end": end,
+            "date_display": start.isoformat(),
+            "date_precision": "day",
+            "location": rng.choice(_PLACES),
+        })
+        for tag in _skewed(rng, tag_rows, rng.randint(1, 5)):
+            tag_links.append({"event_id": event_id, "tag_id": tag["id"]})
+        for standard in _skewed(rng, leaf_standards, rng.randint(0, 4)):
+            standard_links.append({"event_id": event_id, "standard_id": standard["id"]})
+
+    event_ids = [row["id"] for row in event_rows]
+    user_rows, timeline_rows, entry_rows = [], [], []
+    for u in range(users):
+        user_id = _uuid(rng)
+        is_pro = rng.random() < 0.2
+        user_rows.append({
+            "id": user_id, "email": f"teacher{u:05d}@example.com", "hashed_password": _PLACEHOLDER_HASH,
+            "display_name": f"Teacher {u}", "is_pro": is_pro, "is_admin": False, "token_version": 0,
+        })
+        for t in range(rng.randint(0, round(timelines_per_user * 2))):
+            timeline_id = _uuid(rng)
+            timeline_rows.append({
+                "id": timeline_id, "user_id": user_id, "title": f"Unit {t} for teacher {u}",
+                "color_scheme": "blue_green", "layout": rng.choice(["horizontal", "vertical"]),
+                "font": "system", "is_public": rng.random() < 0.1,
+                "_is_pro": is_pro,
+            })
+            entries = []
+            for _ in range(rng.randint(3, 25)):
+                if rng.random() < 0.1:
+                    custom_date = date(1492, 1, 1) + timedelta(days=rng.randrange(185_000))
+                    entries.append((custom_date, None, {
+                        "custom_title": "Class field trip", "custom_description": "Custom entry",
+                        "custom_date_display": custom_date.isoformat(), "custom_date_start": custom_date,
+                    }))
+                else:
+                    event_id = rng.choice(event_ids)
+                    entries.append((event_dates[event_id], event_id, {}))
+            entries.sort(key=lambda entry: entry[0])
+            for position, (_, event_id, custom) in enumerate(entries):
+                entry_rows.append({
+                    "id": _uuid(rng), "timeline_id": timeline_id, "event_id": event_id,
+                    "position": position, "custom_title": None, "custom_description": None,
+                    "custom_date_display": None, "custom_date_start": None, **custom,
+                })
+
+    sample_timelines = [(row["id"], row["user_id"], row.pop("_is_pro")) for row in timeline_rows[:200]]
+    for row in timeline_rows[200:]:
+        row.pop("_is_pro")
+
+    with engine.begin() as conn:
+        _insert(conn, Topic.__table__, topic_rows)
+        _insert(conn, Tag.__table__, tag_rows)
+        _insert(conn, CurriculumFramework.__table__, framework_rows)
+        _insert(conn, CurriculumStandard.__table__, [r for r in standard_rows if r["parent_id"] is None])
+        _insert(conn, CurriculumStandard.__table__, [r for r in standard_rows if r["parent_id"] is not None])
+        _insert(conn, Event.__table__, event_rows)
+        _insert(conn, event_tags, tag_links)
+        _insert(conn, event_standards, standard_links)
+        _insert(conn, User.__table__, user_rows)
+        _insert(conn, Timeline.__table__, timeline_rows)
+        _insert(conn, TimelineEvent.__table__, entry_rows)
+        rebuild_standard_closure(conn)
+
+    return Dataset(
+        counts={
+            "topics": len(topic_rows),
+            "tags": len(tag_rows),
+            "standards": len(standard_rows),
+            "events": len(event_rows),
+            "event_tags": len(tag_links),
+            "event_standards": len(standard_links),
+            "users": len(user_rows),
+            "timelines": len(timeline_rows),
+            "timeline_events": len(entry_rows),
+        },
+        topic_slugs=[row["slug"] for row in topic_rows],
+        tag_names=[row["name"] for row in tag_rows],
+        standard_codes=[row["code"] for row in leaf_standards],
+        standard_ids=[row["id"] for row in leaf_standards],
+        strand_ids=[row["id"] for row in standard_rows if row["parent_id"] is None],
+        event_ids=event_ids,
+        sample_timelines=sample_timelines,
+    )
+
+
+def write_import_file(path: Path, dataset: Dataset, events: int, seed: int = 1) -> Path:
+    """Write an event-data style JSON file that import_events_from_file can load."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(events):
+        start = date(1700, 1, 1) + timedelta(days=rng.randrange(100_000))
+        rows.append({
+            "id": f"import_{i:05d}",
+            "title": _title(rng, i),
+            "description": " ".join(rng.choices(_NOUNS + _PLACES, k=30)),
+            "date_start": start.isoformat(),
+            "date_display": start.isoformat(),
+            "location": rng.choice(_PLACES),
+            "tags": _skewed(rng, dataset.tag_names, rng.randint(1, 4)),
+            "standards": _skewed(rng, dataset.standard_codes, rng.randint(0, 3)),
+        })
+    path.write_text(json.dumps({
+        "topic": {"slug": "synthetic_import", "name": "Synthetic Import"},
+        "events": rows,
+    }))
+    return path
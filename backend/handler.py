@@ -3,62 +3,53 @@ Lambda handler for LessonLines API.
 Uses Mangum to adapt FastAPI for AWS Lambda.
 
 Supports multiple modes:
-- API requests: routed to FastAPI via Mangum (default)
+- API requests: routed to FastAPI via Mangum (default); with METRICS_EMF=true,
+  request metrics are printed as CloudWatch EMF lines after each invocation
 - Migrations: triggered with {"action": "migrate"} payload
 - Seed: triggered with {"action": "seed"} payload
+- Deduplicate events: triggered with {"action": "deduplicate_events", "dry_run": true|false} payload
+- Load snapshot: triggered with {"action": "load_snapshot"} payload (bulk-loads event-data/catalog.snapshot)
 - Make admin: triggered with {"action": "make_admin", "email": "...", "password": "..."} payload
 """
-import json
 import os
 import io
 import logging
 from pathlib import Path
 
-import boto3
 from mangum import Mangum
 
 logger = logging.getLogger(__name__)
 
-# Get database credentials from Secrets Manager if running in Lambda
-if os.environ.get('DATABASE_SECRET_ARN'):
-    secrets_client = boto3.client('secretsmanager')
-    try:
-        secret_response = secrets_client.get_secret_value(
-            SecretId=os.environ['DATABASE_SECRET_ARN']
-        )
-        secret = json.loads(secret_response['SecretString'])
-
-        # Set environment variables for database connection
-        os.environ['DATABASE_USER'] = secret['username']
-        os.environ['DATABASE_PASSWORD'] = secret['password']
-
-        # Construct DATABASE_URL for SQLAlchemy
-        db_host = os.environ.get('DATABASE_HOST', 'localhost')
-        db_port = os.environ.get('DATABASE_PORT', '5432')
-        db_name = os.environ.get('DATABASE_NAME', 'lessonlines')
-        os.environ['DATABASE_URL'] = (
-            f"postgresql://{secret['username']}:{secret['password']}"
-            f"@{db_host}:{db_port}/{db_name}"
-        )
-    except Exception as e:
-        print(f"Error retrieving database secret: {e}")
-        raise
-
+# In Lambda the database password comes from Secrets Manager via the
+# credentials provider installed in app.database, which caches the secret with
+# a TTL and refreshes it when the database rejects a rotated password.
+# DATABASE_URL only carries the host, port and database name.
+if os.environ.get('DATABASE_SECRET_ARN') and not os.environ.get('DATABASE_URL'):
+    db_host = os.environ.get('DATABASE_HOST', 'localhost')
+    db_port = os.environ.get('DATABASE_PORT', '5432')
+    db_name = os.environ.get('DATABASE_NAME', 'lessonlines')
+    os.environ['DATABASE_URL'] = f"postgresql://{db_host}:{db_port}/{db_name}"
+
+from app.config import get_settings
 from app.main import app
+from app.metrics import flush_emf
 
 # Create Mangum handler for API requests
 _api_handler = Mangum(app, lifespan="off")
+_settings = get_settings()
 
 
 def _run_migration(command="upgrade", revision="head"):
     """Run Alembic migration commands programmatically."""
     from alembic.config import Config
     from alembic import command as alembic_command
+    from app.database import database_url_with_credentials
 
     # Configure Alembic
     alembic_cfg = Config()
     alembic_cfg.set_main_option("script_location", str(Path(__file__).parent / "alembic"))
-    alembic_cfg.set_main_option("sqlalchemy.url", os.environ["DATABASE_URL"])
+    # ConfigParser treats % as interpolation, so escape it in the rendered password
+    alembic_cfg.set_main_option("sqlalchemy.url", database_url_with_credentials().replace("%", "%%"))
 
     # Capture Alembic output
     output_buffer = io.StringIO()
@@ -126,40 +117,20 @@ def handler(event, context):
             }
 
     if isinstance(event, dict) and event.get("action") == "deduplicate_events":
-        logger.info("Deduplicating events: removing source_id=NULL events that have a source_id counterpart")
+        dry_run = bool(event.get("dry_run", False))
+        logger.info(f"Deduplicating events (dry_run={dry_run}): removing source_id=NULL events that have a source_id counterpart")
         try:
             from app.database import SessionLocal
-            from app.models import Event, TimelineEvent
-            from sqlalchemy import text
+            from app.services.maintenance import deduplicate_events
 
             db = SessionLocal()
             try:
-                # Find all events without source_id that share a title+topic with a source_id event
-                old_events = db.query(Event).filter(Event.source_id == None).all()
-                deleted = 0
-                reassigned = 0
-
-                for old in old_events:
-                    # Find the canonical replacement (same title + topic, has source_id)
-                    new = db.query(Event).filter(
-                        Event.source_id != None,
-                        Event.title == old.title,
-                        Event.topic_id == old.topic_id,
-                    ).first()
-
-                    if new:
-                        # Reassign any timeline_events pointing to the old event
-                        count = db.query(TimelineEvent).filter(TimelineEvent.event_id == old.id).update(
-                            {"event_id": new.id}
-                        )
-                        reassigned += count
-                        db.delete(old)
-                        deleted += 1
-
-                db.commit()
+                result = deduplicate_events(db, dry_run=dry_run)
+                if not dry_run:
+                    db.commit()
                 return {
                     "statusCode": 200,
-                    "body": {"success": True, "deleted": deleted, "timeline_events_reassigned": reassigned},
+                    "body": {"success": True, **result},
                 }
             finally:
                 db.close()
@@ -192,6 +163,30 @@ def handler(event, context):
                 "body": {"success": False, "error": str(e)},
             }
 
+    if isinstance(event, dict) and event.get("action") == "load_snapshot":
+        logger.info("Bulk-loading catalog snapshot")
+        try:
+            from app.database import SessionLocal
+            from app.services.catalog_snapshot import DEFAULT_SNAPSHOT_PATH, CatalogSnapshot, load_snapshot_into_db
+
+            snapshot = CatalogSnapshot(event.get("path") or DEFAULT_SNAPSHOT_PATH)
+            db = SessionLocal()
+            try:
+                result = load_snapshot_into_db(db, snapshot)
+                db.commit()
+                return {
+                    "statusCode": 200,
+                    "body": {"success": True, "result": result},
+                }
+            finally:
+                db.close()
+        except Exception as e:
+            logger.exception("Snapshot load failed")
+            return {
+                "statusCode": 500,
+                "body": {"success": False, "error": str(e)},
+            }
+
     if isinstance(event, dict) and event.get("action") == "make_admin":
         email = event.get("email")
         password = event.get("password")
@@ -230,4 +225,8 @@ def handler(event, context):
             return {"statusCode": 500, "body": {"success": False, "error": str(e)}}
 
     # Default: route to FastAPI via Mangum
-    return _api_handler(event, context)
+    try:
+        return _api_handler(event, context)
+    finally:
+        if _settings.metrics_emf:
+            flush_emf(_settings.metrics_namespace)
@@ -19,7 +19,8 @@ from app.models import (
     Topic,
     User,
 )
-from app.services.auth import create_access_token, get_password_hash
+from app.services.auth import create_access_token, get_password_hash, token_cache, user_cache
+from app.services.catalog_cache import catalog_cache, catalog_version
 
 # In-memory SQLite for tests
 engine = create_engine(
@@ -47,6 +48,10 @@ def setup_database():
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
+    user_cache.clear()
+    token_cache.clear()
+    catalog_cache.clear()
+    catalog_version.invalidate()
 
 
 @pytest.fixture
@@ -236,6 +241,18 @@ def sample_standard(db, sample_framework):
     return standard
 
 
+@pytest.fixture
+def standard_tree(db, sample_framework):
+    """APUSH.5 > APUSH.5.1 > APUSH.5.1.A, plus APUSH.5.2; returned by code."""
+    period = CurriculumStandard(framework_id=sample_framework.id, code="APUSH.5", title="Period 5", grade_level="11")
+    causes = CurriculumStandard(framework_id=sample_framework.id, code="APUSH.5.1", title="Causes", grade_level="11", parent=period)
+    secession = CurriculumStandard(framework_id=sample_framework.id, code="APUSH.5.1.A", title="Secession", grade_level="11", parent=causes)
+    reconstruction = CurriculumStandard(framework_id=sample_framework.id, code="APUSH.5.2", title="Reconstruction", grade_level="11", parent=period)
+    db.add_all([period, causes, secession, reconstruction])
+    db.commit()
+    return {s.code: s for s in (period, causes, secession, reconstruction)}
+
+
 @pytest.fixture
 def sample_timeline(db, test_user):
     """Create and return a sample timeline for the test user."""
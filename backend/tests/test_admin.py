@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.profiler import RouteProfiler, profiler
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler():
+    yield
+    profiler.clear()
+
+
+def _busy_wait(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.fixture
+def slow_app():
+    app = FastAPI()
+
+    @app.get("/slow")
+    def slow():
+        _busy_wait(0.03)
+        return {"ok": True}
+
+    @app.get("/slow-async")
+    async def slow_async():
+        await asyncio.sleep(0.03)
+        return {"ok": True}
+
+    return app
+
+
+class TestRouteProfiler:
+    def test_samples_sync_endpoint_then_restores_it(self, slow_app):
+        route = next(r for r in slow_app.routes if getattr(r, "path", None) == "/slow")
+        original = route.dependant.call
+        route_profiler = RouteProfiler()
+        session = route_profiler.arm(slow_app.routes, "GET", "/slow", requests=2, interval_ms=2)
+        client = TestClient(slow_app)
+
+        for _ in range(3):
+            assert client.get("/slow").json() == {"ok": True}
+
+        assert route.dependant.call is original
+        assert session.summary()["completed"] == 2
+        lines = session.collapsed().splitlines()
+        assert any("tests.test_admin:slow;tests.test_admin:_busy_wait" in line for line in lines)
+        assert all(line.startswith("GET /slow") for line in lines)
+
+    def test_async_endpoint_waiting_is_suspended(self, slow_app):
+        session = RouteProfiler().arm(slow_app.routes, "GET", "/slow-async", requests=1, interval_ms=2)
+
+        TestClient(slow_app).get("/slow-async")
+
+        assert "GET /slow-async;(suspended)" in session.collapsed()
+
+    def test_unknown_route(self, slow_app):
+        with pytest.raises(LookupError):
+            RouteProfiler().arm(slow_app.routes, "POST", "/slow", requests=1)
+
+
+class TestProfilerEndpoints:
+    def test_requires_admin(self, client, auth_headers):
+        resp = client.post("/api/admin/profiler", json={"path": "/api/events"}, headers=auth_headers)
+        assert resp.status_code == 403
+
+    def test_arm_profile_and_fetch(self, client, admin_auth_headers, sample_event):
+        resp = client.post(
+            "/api/admin/profiler",
+            json={"path": "/api/events/{event_id}", "requests": 2},
+            headers=admin_auth_headers,
+        )
+        assert resp.status_code == 200
+        assert resp.json()["armed"] is True
+
+        conflict = client.post("/api/admin/profiler", json={"path": "/api/events/{event_id}"}, headers=admin_auth_headers)
+        assert conflict.status_code == 409
+
+        for _ in range(2):
+            assert client.get(f"/api/events/{sample_event.id}").status_code == 200
+
+        sessions = client.get("/api/admin/profiler", headers=admin_auth_headers).json()
+        assert sessions[0]["completed"] == 2
+        assert sessions[0]["armed"] is False
+
+        collapsed = client.get(
+            "/api/admin/profiler/collapsed", params={"path": "/api/events/{event_id}"}, headers=admin_auth_headers
+        )
+        assert collapsed.status_code == 200
+        assert collapsed.headers["content-type"].startswith("text/plain")
+
+        deleted = client.delete("/api/admin/profiler", params={"path": "/api/events/{event_id}"}, headers=admin_auth_headers)
+        assert deleted.status_code == 200
+        assert client.get("/api/admin/profiler", headers=admin_auth_headers).json() == []
+
+    def test_unknown_route_is_404(self, client, admin_auth_headers):
+        resp = client.post("/api/admin/profiler", json={"path": "/api/nope"}, headers=admin_auth_headers)
+        assert resp.status_code == 404
@@ -105,3 +105,90 @@ class TestTokenValidation:
             "Authorization": f"Bearer {token}",
         })
         assert resp.status_code == 401
+
+
+class TestClaimsFastPath:
+    def _login(self, client):
+        resp = client.post("/api/auth/login", data={
+            "username": "teacher@example.com",
+            "password": "password123",
+        })
+        return resp.json()["access_token"]
+
+    def test_login_token_carries_claims(self, client, test_user):
+        payload = jwt.decode(self._login(client), settings.secret_key, algorithms=[settings.algorithm])
+        assert payload["is_pro"] is False
+        assert payload["is_admin"] is False
+        assert payload["tv"] == 0
+        assert "iat" in payload
+
+    def test_fresh_claims_skip_users_lookup(self, client, db, test_user):
+        headers = {"Authorization": f"Bearer {self._login(client)}"}
+        db.delete(test_user)
+        db.commit()
+
+        # Trusted claims: no users row needed for ordinary routes...
+        assert client.get("/api/timelines", headers=headers).status_code == 200
+        # ...but the profile route always reads the current row.
+        assert client.get("/api/users/me", headers=headers).status_code == 401
+
+    def test_stale_claims_fall_back_to_database(self, client, db, test_user):
+        token = jwt.encode(
+            {
+                "sub": str(test_user.id),
+                "is_pro": True,
+                "is_admin": False,
+                "tv": 0,
+                "iat": datetime.utcnow() - timedelta(seconds=settings.auth_claims_max_age_seconds + 60),
+                "exp": datetime.utcnow() + timedelta(hours=1),
+            },
+            settings.secret_key,
+            algorithm=settings.algorithm,
+        )
+        db.delete(test_user)
+        db.commit()
+
+        resp = client.get("/api/timelines", headers={"Authorization": f"Bearer {token}"})
+        assert resp.status_code == 401
+
+    def test_token_version_revokes_old_tokens(self, client, db, test_user):
+        headers = {"Authorization": f"Bearer {self._login(client)}"}
+        test_user.token_version = 1
+        db.commit()
+
+        assert client.get("/api/users/me", headers=headers).status_code == 401
+
+    def test_user_row_cached_between_requests(self, client, db, test_user, auth_headers):
+        from app.services.auth import user_cache
+
+        assert client.get("/api/timelines", headers=auth_headers).status_code == 200
+        hits = user_cache.hits
+        assert client.get("/api/timelines", headers=auth_headers).status_code == 200
+        assert user_cache.hits == hits + 1
+
+    def test_user_update_invalidates_cache(self, client, db, test_user, auth_headers):
+        from app.services.auth import user_cache
+
+        client.get("/api/timelines", headers=auth_headers)
+        test_user.display_name = "Renamed"
+        db.commit()
+        assert user_cache.get(test_user.id) is None
+
+
+class TestTokenCache:
+    def test_repeat_requests_reuse_decoded_claims(self, client, auth_headers, test_user):
+        from app.services.auth import token_cache
+
+        client.get("/api/timelines", headers=auth_headers)
+        before = token_cache.stats()
+        client.get("/api/timelines", headers=auth_headers)
+        after = token_cache.stats()
+
+        assert after["hits"] == before["hits"] + 1
+        assert after["size"] == 1
+
+    def test_invalid_tokens_are_not_cached(self, client):
+        from app.services.auth import token_cache
+
+        client.get("/api/users/me", headers={"Authorization": "Bearer not-a-valid-token"})
+        assert token_cache.stats()["size"] == 0
@@ -0,0 +1,73 @@
+import json
+
+from sqlalchemy import create_engine, func, select
+
+from app.database import Base
+from app.models import Event, TimelineEvent
+from app.services.import_events import import_events_from_file
+from benchmarks import percentile
+from benchmarks.load_test import Request, api_gateway_event, parse_db_statements
+from benchmarks.suite import compare
+from benchmarks.synthetic import generate, write_import_file
+
+
+def _fresh_engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+class TestSyntheticData:
+    def test_same_seed_same_dataset(self):
+        first = generate(_fresh_engine(), events=50, users=5, seed=7)
+        second = generate(_fresh_engine(), events=50, users=5, seed=7)
+        assert first == second
+        assert first.counts["events"] == 50
+        assert first.counts["users"] == 5
+
+    def test_rows_are_inserted(self):
+        engine = _fresh_engine()
+        dataset = generate(engine, events=50, users=5)
+        with engine.connect() as conn:
+            assert conn.execute(select(func.count()).select_from(Event.__table__)).scalar() == 50
+            entries = conn.execute(select(func.count()).select_from(TimelineEvent.__table__)).scalar()
+        assert entries == dataset.counts["timeline_events"]
+
+    def test_import_file_loads(self, db, tmp_path):
+        dataset = generate(db.get_bind(), events=20, users=1)
+        path = write_import_file(tmp_path / "import.json", dataset, events=10)
+
+        result = import_events_from_file(db, path)
+
+        assert result == {"topic": "synthetic_import", "inserted": 10, "updated": 0}
+
+
+class TestCompare:
+    def test_flags_p50_regressions_only(self):
+        baseline = {"results": {"a": {"p50_ms": 10.0}, "b": {"p50_ms": 10.0}}}
+        current = {"results": {"a": {"p50_ms": 11.0}, "b": {"p50_ms": 15.0}, "new": {"p50_ms": 1.0}}}
+
+        regressions = compare(baseline, current, tolerance=0.2)
+
+        assert [r["benchmark"] for r in regressions] == ["b"]
+        assert regressions[0]["ratio"] == 1.5
+
+    def test_percentile(self):
+        assert percentile([3, 1, 2], 50) == 2
+        assert percentile([], 95) == 0.0
+
+
+class TestLoadTestHarness:
+    def test_api_gateway_event_reaches_the_app(self, sample_event):
+        import handler
+
+        event = api_gateway_event(Request("GET", "/api/events", params={"topic": "civil-war"}))
+        result = handler.handler(event, None)
+
+        assert result["statusCode"] == 200
+        assert [e["title"] for e in json.loads(result["body"])] == [sample_event.title]
+
+    def test_parse_db_statements(self):
+        header = 'db;dur=1.20;desc="3 queries", ser;dur=0.10, total;dur=4.00'
+        assert parse_db_statements(header) == 3
+        assert parse_db_statements(None) is None
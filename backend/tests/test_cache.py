@@ -0,0 +1,51 @@
+from app.cache import ExpiringLRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestExpiringLRUCache:
+    def test_hit_and_miss_counts(self):
+        cache = ExpiringLRUCache(maxsize=4)
+        assert cache.get("a") is None
+        cache.put("a", 1, expires_at=float("inf"))
+        assert cache.get("a") == 1
+        assert cache.stats() == {"size": 1, "maxsize": 4, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = ExpiringLRUCache(maxsize=4, clock=clock)
+        cache.put("token", "claims", expires_at=clock.now + 10)
+        clock.now += 9
+        assert cache.get("token") == "claims"
+        clock.now += 1
+        assert cache.get("token") is None
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = ExpiringLRUCache(maxsize=2)
+        cache.put("a", 1, expires_at=float("inf"))
+        cache.put("b", 2, expires_at=float("inf"))
+        cache.get("a")
+        cache.put("c", 3, expires_at=float("inf"))
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_zero_size_disables(self):
+        cache = ExpiringLRUCache(maxsize=0)
+        cache.put("a", 1, expires_at=float("inf"))
+        assert cache.get("a") is None
+
+    def test_invalid_entries_are_misses(self):
+        cache = ExpiringLRUCache(maxsize=4)
+        cache.put("tree", ("v1", "body"), expires_at=float("inf"))
+        assert cache.get("tree", valid=lambda entry: entry[0] == "v1") == ("v1", "body")
+        assert cache.get("tree", valid=lambda entry: entry[0] == "v2") is None
+        assert cache.stats()["size"] == 0
+        assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,91 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event as sa_event
+
+from app.config import get_settings
+from app.models import Event, Tag, Topic
+from app.services.catalog_index import _positions
+
+
+@pytest.fixture
+def catalog(db, sample_event, sample_topic, standard_tree):
+    policy = Tag(name="policy", category="theme")
+    reconstruction = Topic(slug="reconstruction", name="Reconstruction")
+    sample_event.standards = [standard_tree["APUSH.5.1"], standard_tree["APUSH.5.1.A"]]
+    db.add_all([
+        Event(
+            topic_id=sample_topic.id, title="Emancipation Proclamation", description="d",
+            date_start=date(1863, 1, 1), date_display="1863", tags=[policy], standards=[standard_tree["APUSH.5.2"]],
+        ),
+        Event(
+            topic=reconstruction, title="Freedmen's Bureau", description="d",
+            date_start=date(1865, 3, 3), date_display="1865", tags=[policy, sample_event.tags[0]],
+        ),
+    ])
+    db.commit()
+    return standard_tree
+
+
+def _search(client, monkeypatch, enabled, params):
+    monkeypatch.setattr(get_settings(), "catalog_index_enabled", enabled)
+    resp = client.get("/api/events", params={**params, "facets": "topic,tag,grade,framework"})
+    assert resp.status_code == 200
+    data = resp.json()
+    for event in data["events"]:
+        event["tags"].sort(key=lambda t: t["name"])
+    return data
+
+
+class TestCatalogIndex:
+    @pytest.mark.parametrize("params", [
+        {},
+        {"topic": "civil-war"},
+        {"topic": "no-such-topic"},
+        {"tag": "policy"},
+        {"tag": "battle", "topic": "reconstruction"},
+        {"tag": "missing"},
+        {"grade": "11"},
+        {"grade": "11", "tag": "policy"},
+        {"standard": "APUSH.5"},
+        {"standard": "APUSH.5", "include_descendants": True},
+        {"standard": "APUSH.5.1", "include_descendants": True, "tag": "battle"},
+        {"date_from": "1863-07-02"},
+        {"date_from": "1863-07-04"},
+        {"date_to": "1863-07-01"},
+        {"date_from": "1863-01-02", "date_to": "1863-06-30"},
+        {"date_from": "1863-01-01", "date_to": "1863-12-31", "tag": "policy"},
+    ])
+    def test_matches_sql(self, client, monkeypatch, catalog, params):
+        if "standard" in params:
+            params = {**params, "standard": str(catalog[params["standard"]].id)}
+        assert _search(client, monkeypatch, True, params) == _search(client, monkeypatch, False, params)
+
+    def test_served_from_memory(self, client, db, monkeypatch, catalog):
+        _search(client, monkeypatch, True, {"tag": "policy"})
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        sa_event.listen(db.get_bind(), "before_cursor_execute", listener)
+        try:
+            data = _search(client, monkeypatch, True, {"grade": "11"})
+        finally:
+            sa_event.remove(db.get_bind(), "before_cursor_execute", listener)
+        assert len(data["events"]) == 2
+        assert not [s for s in statements if "events" in s]
+
+    def test_rebuilt_when_catalog_changes(self, client, db, monkeypatch, catalog):
+        assert len(_search(client, monkeypatch, True, {"tag": "policy"})["events"]) == 2
+        db.query(Event).filter(Event.title == "Freedmen's Bureau").one().tags = []
+        db.commit()
+        assert len(_search(client, monkeypatch, True, {"tag": "policy"})["events"]) == 1
+
+    def test_keyword_search_uses_sql(self, client, monkeypatch, catalog):
+        data = _search(client, monkeypatch, True, {"q": "bureau"})
+        assert [e["title"] for e in data["events"]] == ["Freedmen's Bureau"]
+
+
+class TestPositions:
+    def test_set_bits(self):
+        assert list(_positions(0)) == []
+        assert list(_positions(0b101001)) == [0, 3, 5]
+        assert list(_positions(1 << 200)) == [200]
@@ -0,0 +1,118 @@
+import json
+import sqlite3
+
+import pytest
+
+from app.config import get_settings
+from app.models import CurriculumStandard, Event, Tag, Topic
+from app.seed import STANDARDS_DATA
+from app.services.catalog_snapshot import (
+    EVENT_DATA_DIR,
+    CatalogSnapshot,
+    SnapshotError,
+    build_snapshot,
+    catalog_id,
+    get_snapshot,
+    load_snapshot_into_db,
+)
+
+
+def _json_event_count():
+    return sum(len(json.loads(p.read_text())["events"]) for p in EVENT_DATA_DIR.glob("*.json"))
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = tmp_path / "catalog.snapshot"
+    build_snapshot(EVENT_DATA_DIR, path)
+    return path
+
+
+class TestBuildSnapshot:
+    def test_build_records_version_and_counts(self, snapshot_path):
+        snapshot = CatalogSnapshot(snapshot_path)
+        assert snapshot.meta["format_version"] == "1"
+        assert len(snapshot.catalog_version) == 16
+        assert int(snapshot.meta["event_count"]) == _json_event_count()
+        assert len(snapshot.events()) == _json_event_count()
+        assert len(snapshot.standards()) == len(STANDARDS_DATA)
+
+    def test_build_is_deterministic(self, tmp_path, snapshot_path):
+        other = tmp_path / "other.snapshot"
+        build_snapshot(EVENT_DATA_DIR, other)
+        assert CatalogSnapshot(other).catalog_version == CatalogSnapshot(snapshot_path).catalog_version
+        assert CatalogSnapshot(other).topics() == CatalogSnapshot(snapshot_path).topics()
+
+    def test_ids_derive_from_natural_keys(self, snapshot_path):
+        topics = CatalogSnapshot(snapshot_path).topics()
+        civil_war = next(t for t in topics if t["slug"] == "civil_war")
+        assert civil_war["id"] == str(catalog_id("topic", "civil_war"))
+
+    def test_rejects_other_format_version(self, snapshot_path):
+        conn = sqlite3.connect(snapshot_path)
+        conn.execute("UPDATE meta SET value = '999' WHERE key = 'format_version'")
+        conn.commit()
+        conn.close()
+        with pytest.raises(SnapshotError):
+            CatalogSnapshot(snapshot_path)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(SnapshotError):
+            CatalogSnapshot(tmp_path / "missing.snapshot")
+
+
+class TestLoadSnapshot:
+    def test_bulk_load_into_empty_db(self, db, snapshot_path):
+        result = load_snapshot_into_db(db, CatalogSnapshot(snapshot_path))
+        db.commit()
+
+        assert result["inserted"] == _json_event_count()
+        assert result["updated"] == 0
+        assert db.query(Event).count() == _json_event_count()
+        assert db.query(CurriculumStandard).count() == len(STANDARDS_DATA)
+
+        event = db.query(Event).filter_by(source_id="evt_fort_sumter").one()
+        assert event.id == catalog_id("event", "evt_fort_sumter")
+        assert {t.name for t in event.tags} == {"military", "battle"}
+        assert event.standards
+
+    def test_reload_updates_in_place(self, db, snapshot_path):
+        snapshot = CatalogSnapshot(snapshot_path)
+        load_snapshot_into_db(db, snapshot)
+        db.commit()
+
+        result = load_snapshot_into_db(db, snapshot)
+        db.commit()
+
+        assert result["inserted"] == 0
+        assert result["updated"] == _json_event_count()
+        assert db.query(Event).count() == _json_event_count()
+        event = db.query(Event).filter_by(source_id="evt_fort_sumter").one()
+        assert len(event.tags) == 2
+
+    def test_keeps_existing_ids(self, db, snapshot_path, sample_tag):
+        load_snapshot_into_db(db, CatalogSnapshot(snapshot_path))
+        db.commit()
+        assert db.query(Tag).filter_by(name="battle").one().id == sample_tag.id
+        assert db.query(Topic).count() == len(list(EVENT_DATA_DIR.glob("*.json")))
+
+
+@pytest.fixture
+def serve_snapshot(monkeypatch, snapshot_path):
+    monkeypatch.setattr(get_settings(), "catalog_snapshot_path", str(snapshot_path))
+    yield
+    get_snapshot.cache_clear()
+
+
+class TestServeFromSnapshot:
+    def test_topics_served_from_snapshot(self, client, serve_snapshot):
+        resp = client.get("/api/topics")
+        assert resp.status_code == 200
+        slugs = {t["slug"] for t in resp.json()}
+        assert "civil_war" in slugs
+
+    def test_tags_and_frameworks_served_from_snapshot(self, client, serve_snapshot):
+        tags = client.get("/api/tags", params={"category": "type"}).json()
+        assert tags and all(t["category"] == "type" for t in tags)
+        frameworks = client.get("/api/standards/frameworks").json()
+        assert {f["code"] for f in frameworks} == {"CCSS", "AP_USH", "TEKS"}
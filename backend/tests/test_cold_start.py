@@ -0,0 +1,56 @@
+"""
+Cold-start budget for the Lambda handler, measured with `python -X importtime`.
+
+Asserts that importing handler stays within COLD_START_BUDGET_MS and that the
+heavy packages in DEFERRED_PACKAGES are not imported at cold start. To see the
+per-module timings:
+    python -X importtime -c "import handler" 2>&1 | sort -t'|' -k2 -n | tail
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Generous enough for a loaded CI runner; tighten with COLD_START_BUDGET_MS.
+COLD_START_BUDGET_MS = int(os.environ.get("COLD_START_BUDGET_MS", "3000"))
+
+# Heavy packages that must only be imported on the code paths that need them.
+DEFERRED_PACKAGES = ["reportlab", "boto3", "botocore", "passlib", "jose", "cryptography"]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import module in a fresh interpreter; return {package: cumulative microseconds}."""
+    env = {k: v for k, v in os.environ.items() if k != "DATABASE_SECRET_ARN"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.coldstart
+class TestColdStart:
+    def test_handler_import_within_budget(self):
+        # Best of three runs, to keep a noisy neighbour from failing the build.
+        best_ms = min(_import_times("handler")["handler"] for _ in range(3)) / 1000
+        assert best_ms <= COLD_START_BUDGET_MS, f"handler cold import: {best_ms:.0f}ms (budget {COLD_START_BUDGET_MS}ms)"
+
+    def test_heavy_packages_are_deferred(self):
+        imported = _import_times("handler")
+        loaded = [pkg for pkg in DEFERRED_PACKAGES if pkg in imported]
+        assert loaded == [], f"imported at cold start: {loaded}"
@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.credentials import (
+    CachedCredentialsProvider,
+    DatabaseCredentials,
+    StaticCredentialsProvider,
+    connect_with_credentials,
+    is_auth_failure,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeOperationalError(Exception):
+    def __init__(self, message, pgcode=None):
+        super().__init__(message)
+        self.pgcode = pgcode
+
+
+class FakeDialect:
+    """Accepts only the password in `valid`, like a database after rotation."""
+
+    def __init__(self, valid):
+        self.valid = valid
+        self.loaded_dbapi = SimpleNamespace(OperationalError=FakeOperationalError)
+        self.attempts = []
+
+    def connect(self, *cargs, **cparams):
+        self.attempts.append(cparams["password"])
+        if cparams["password"] != self.valid:
+            raise FakeOperationalError('FATAL:  password authentication failed for user "app"')
+        return SimpleNamespace(user=cparams["user"], password=cparams["password"])
+
+
+class TestCachedCredentialsProvider:
+    def test_caches_until_ttl_expires(self):
+        clock = FakeClock()
+        fetches = []
+
+        def fetch():
+            fetches.append(clock.now)
+            return DatabaseCredentials("app", f"pw-{len(fetches)}")
+
+        provider = CachedCredentialsProvider(fetch, ttl_seconds=60, clock=clock)
+        assert provider.get().password == "pw-1"
+        clock.now = 59
+        assert provider.get().password == "pw-1"
+        clock.now = 60
+        assert provider.get().password == "pw-2"
+        assert fetches == [0, 60]
+
+    def test_force_refresh_bypasses_cache(self):
+        passwords = iter(["old", "new"])
+        provider = CachedCredentialsProvider(
+            lambda: DatabaseCredentials("app", next(passwords)), ttl_seconds=300, clock=FakeClock()
+        )
+        assert provider.get().password == "old"
+        assert provider.get(force_refresh=True).password == "new"
+        assert provider.get().password == "new"
+
+
+class TestConnectWithCredentials:
+    def test_injects_current_credentials(self):
+        provider = StaticCredentialsProvider("app", "secret")
+        dialect = FakeDialect(valid="secret")
+        cparams = {"host": "db"}
+
+        conn = connect_with_credentials(provider)(dialect, None, [], cparams)
+
+        assert conn.user == "app"
+        assert cparams == {"host": "db", "user": "app", "password": "secret"}
+        assert provider.refreshes == 0
+
+    def test_refreshes_once_after_rotation(self):
+        passwords = iter(["rotated-away", "current"])
+        provider = CachedCredentialsProvider(
+            lambda: DatabaseCredentials("app", next(passwords)), ttl_seconds=300, clock=FakeClock()
+        )
+        provider.get()
+        dialect = FakeDialect(valid="current")
+
+        conn = connect_with_credentials(provider)(dialect, None, [], {})
+
+        assert conn.password == "current"
+        assert dialect.attempts == ["rotated-away", "current"]
+
+    def test_other_errors_are_not_retried(self):
+        provider = StaticCredentialsProvider("app", "secret")
+        dialect = FakeDialect(valid="secret")
+
+        def refuse(*cargs, **cparams):
+            raise FakeOperationalError("could not connect to server: Connection refused")
+
+        dialect.connect = refuse
+        with pytest.raises(FakeOperationalError):
+            connect_with_credentials(provider)(dialect, None, [], {})
+        assert provider.refreshes == 0
+
+
+class TestIsAuthFailure:
+    def test_sqlstate(self):
+        assert is_auth_failure(FakeOperationalError("boom", pgcode="28P01"))
+
+    def test_message(self):
+        assert is_auth_failure(FakeOperationalError('password authentication failed for user "x"'))
+
+    def test_unrelated(self):
+        assert not is_auth_failure(FakeOperationalError("timeout expired"))
@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.database import PoolMetrics, engine_options, resolve_pool_profile
+
+PG_URL = "postgresql://db.internal:5432/lessonlines"
+
+
+class TestPoolProfiles:
+    def test_auto_uses_lambda_profile_in_lambda(self, monkeypatch):
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "lessonlines-dev-api")
+        assert resolve_pool_profile("auto") == "lambda"
+
+    def test_auto_uses_server_profile_locally(self, monkeypatch):
+        monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+        assert resolve_pool_profile("auto") == "server"
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError):
+            resolve_pool_profile("huge")
+
+    def test_lambda_profile_keeps_one_connection(self):
+        options = engine_options(PG_URL, "lambda")
+        assert options["pool_size"] == 1
+        assert options["max_overflow"] == 0
+        assert options["pool_pre_ping"] is True
+
+    def test_lambda_nullpool_profile(self):
+        assert engine_options(PG_URL, "lambda_nullpool") == {"poolclass": NullPool}
+
+    def test_server_profile_is_larger(self):
+        assert engine_options(PG_URL, "server")["pool_size"] > engine_options(PG_URL, "lambda")["pool_size"]
+
+    def test_sqlite_ignores_profile(self):
+        assert engine_options("sqlite:///./x.db", "lambda") == {"connect_args": {"check_same_thread": False}}
+
+
+class TestPoolMetrics:
+    def test_counts_checkouts_connects_and_overflow(self):
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=1)
+        metrics = PoolMetrics()
+        metrics.attach(engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            during = metrics.snapshot()
+
+        after = metrics.snapshot()
+        assert after["checkouts"] == 3
+        assert after["checkins"] == 3
+        assert after["connects"] == 2
+        assert after["overflow_checkouts"] == 1
+        assert after["acquisitions"] == 3
+        assert after["waits"] == 0
+        assert during["checked_out"] == 2
+        assert during["overflow"] == 1
+        assert after["pool_size"] == 1
+
+    def test_waits_on_exhausted_lambda_pool(self):
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05)
+        metrics = PoolMetrics()
+        metrics.attach(engine)
+
+        with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+        snapshot = metrics.snapshot()
+        assert snapshot["waits"] == 1
+        assert snapshot["wait_timeouts"] == 1
+        assert snapshot["wait_seconds"] >= 0.05
+        assert snapshot["overflow_checkouts"] == 0
+
+    def test_wait_until_released(self):
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0, pool_timeout=5)
+        metrics = PoolMetrics()
+        metrics.attach(engine)
+
+        first = engine.connect()
+        threading.Timer(0.05, first.close).start()
+        with engine.connect():
+            pass
+        snapshot = metrics.snapshot()
+        assert snapshot["waits"] == 1
+        assert snapshot["wait_timeouts"] == 0
+        assert 0.05 <= snapshot["wait_seconds"] <= snapshot["acquire_seconds"]
+
+    def test_timing_survives_dispose(self):
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0)
+        metrics = PoolMetrics()
+        metrics.attach(engine)
+        engine.dispose()
+        with engine.connect():
+            pass
+        assert metrics.snapshot()["acquisitions"] == 1
+
+    def test_snapshot_without_sized_pool(self):
+        engine = create_engine("sqlite://", poolclass=NullPool)
+        metrics = PoolMetrics()
+        metrics.attach(engine)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        snapshot = metrics.snapshot()
+        assert snapshot["connects"] == 1
+        assert "pool_size" not in snapshot
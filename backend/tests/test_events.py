@@ -1,7 +1,16 @@
+import json
 import uuid
 from datetime import date
 
+import pytest
+from sqlalchemy import event as sa_event
+from sqlalchemy.exc import IntegrityError
+
+from app.config import get_settings
 from app.models import Event, Tag, Topic
+from app.schemas import EventListResponse
+from app.services.event_search import LIST_FIELDS, EventFilters, apply_filters
+from app.services.import_events import import_events_from_file
 
 
 class TestGetTopics:
@@ -90,6 +99,315 @@ class TestSearchEvents:
         assert data[0]["tags"][0]["name"] == "battle"
 
 
+class TestFuzzySearch:
+    def test_typo_needs_fuzzy(self, client, sample_event):
+        assert client.get("/api/events", params={"q": "Gettysberg"}).json() == []
+        data = client.get("/api/events", params={"q": "Gettysberg", "fuzzy": True}).json()
+        assert [e["title"] for e in data] == ["Battle of Gettysburg"]
+
+    def test_ranked_by_similarity(self, client, db, sample_event, sample_topic):
+        db.add_all([
+            Event(
+                topic_id=sample_topic.id, title="Gettysburg Address", description="Speech",
+                date_start=date(1863, 11, 19), date_display="1863",
+            ),
+            Event(
+                topic_id=sample_topic.id, title="Siege of Vicksburg", description="Siege",
+                date_start=date(1863, 5, 18), date_display="1863",
+            ),
+        ])
+        db.commit()
+        data = client.get("/api/events", params={"q": "gettysburg adress", "fuzzy": True}).json()
+        assert [e["title"] for e in data] == ["Gettysburg Address", "Battle of Gettysburg"]
+
+
+class TestStandardFilter:
+    def _tagged(self, db, sample_topic, standards, title):
+        event = Event(
+            topic_id=sample_topic.id, title=title, description="d",
+            date_start=date(1861, 1, 1), date_display="1861",
+        )
+        event.standards = standards
+        db.add(event)
+        db.commit()
+        return event
+
+    def test_descendants(self, client, db, sample_topic, standard_tree):
+        self._tagged(db, sample_topic, [standard_tree["APUSH.5.1.A"]], "Secession crisis")
+        self._tagged(db, sample_topic, [standard_tree["APUSH.5.2"], standard_tree["APUSH.5"]], "Reconstruction acts")
+        self._tagged(db, sample_topic, [], "Unaligned")
+        period = standard_tree["APUSH.5"].id
+
+        exact = client.get("/api/events", params={"standard": str(period)}).json()
+        subtree = client.get("/api/events", params={"standard": str(period), "include_descendants": True}).json()
+        branch = client.get(
+            "/api/events", params={"standard": str(standard_tree["APUSH.5.1"].id), "include_descendants": True}
+        ).json()
+
+        assert [e["title"] for e in exact] == ["Reconstruction acts"]
+        assert sorted(e["title"] for e in subtree) == ["Reconstruction acts", "Secession crisis"]
+        assert [e["title"] for e in branch] == ["Secession crisis"]
+
+
+class TestCombinedFilters:
+    def test_no_duplicate_rows(self, client, db, sample_event, sample_tag, standard_tree):
+        """An event matching standard, grade and tag through several rows is returned once."""
+        sample_event.standards = [standard_tree["APUSH.5"], standard_tree["APUSH.5.1"], standard_tree["APUSH.5.1.A"]]
+        sample_event.tags.append(Tag(name="turning-point", category="theme"))
+        db.commit()
+        filters = EventFilters(standard=standard_tree["APUSH.5"].id, include_descendants=True, tag="battle", grade="11")
+
+        ids = apply_filters(db.query(Event.id), db, filters).all()
+        assert ids == [(sample_event.id,)]
+        resp = client.get("/api/events", params={
+            "standard": str(standard_tree["APUSH.5"].id), "include_descendants": True, "tag": "battle", "grade": "11",
+        })
+        [event] = resp.json()
+        assert sorted(t["name"] for t in event["tags"]) == ["battle", "turning-point"]
+
+    def test_filters_are_independent(self, client, db, sample_event, standard_tree):
+        """standard and grade may be satisfied by different standards of the same event."""
+        standard_tree["APUSH.5.2"].grade_level = "8"
+        sample_event.standards = [standard_tree["APUSH.5.1"], standard_tree["APUSH.5.2"]]
+        db.commit()
+        params = {"standard": str(standard_tree["APUSH.5.1"].id), "grade": "8"}
+        assert [e["id"] for e in client.get("/api/events", params=params).json()] == [str(sample_event.id)]
+        params["grade"] = "5"
+        assert client.get("/api/events", params=params).json() == []
+
+
+class TestDateRange:
+    def _titles(self, client, **params):
+        resp = client.get("/api/events", params=params)
+        assert resp.status_code == 200
+        return [e["title"] for e in resp.json()]
+
+    def test_overlap(self, client, db, sample_event, sample_topic):
+        # sample_event: Gettysburg, 1863-07-01 to 1863-07-03.
+        db.add(Event(
+            topic_id=sample_topic.id, title="Siege of Vicksburg", description="d",
+            date_start=date(1863, 5, 18), date_end=date(1863, 7, 4), date_display="1863",
+        ))
+        db.add(Event(
+            topic_id=sample_topic.id, title="Fort Sumter", description="d",
+            date_start=date(1861, 4, 12), date_display="April 12, 1861",
+        ))
+        db.commit()
+
+        assert self._titles(client, date_from="1860-01-01", date_to="1862-12-31") == ["Fort Sumter"]
+        assert self._titles(client, date_from="1863-07-03") == ["Siege of Vicksburg", "Battle of Gettysburg"]
+        assert self._titles(client, date_from="1863-07-04") == ["Siege of Vicksburg"]
+        assert self._titles(client, date_to="1863-06-30") == ["Fort Sumter", "Siege of Vicksburg"]
+        assert self._titles(client, date_from="1861-04-12", date_to="1861-04-12") == ["Fort Sumter"]
+
+    def test_inverted_range(self, client):
+        resp = client.get("/api/events", params={"date_from": "1870-01-01", "date_to": "1860-01-01"})
+        assert resp.status_code == 422
+
+    def test_import_rejects_end_before_start(self, db, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_text(json.dumps({
+            "topic": {"slug": "civil-war", "name": "Civil War"},
+            "events": [{
+                "id": "evt_backwards", "title": "Backwards", "description": "d",
+                "date_start": "1863-07-03", "date_end": "1863-07-01", "date_display": "1863",
+            }],
+        }))
+        with pytest.raises(ValueError, match="evt_backwards"):
+            import_events_from_file(db, path)
+
+    def test_check_constraint_rejects_end_before_start(self, db, sample_topic):
+        db.add(Event(
+            topic_id=sample_topic.id, title="Backwards", description="d",
+            date_start=date(1863, 7, 3), date_end=date(1863, 7, 1), date_display="1863",
+        ))
+        with pytest.raises(IntegrityError):
+            db.commit()
+        db.rollback()
+
+
+class TestFacets:
+    @staticmethod
+    def _catalog(db, sample_event, sample_topic, standard_tree):
+        policy = Tag(name="policy", category="theme")
+        reconstruction = Topic(slug="reconstruction", name="Reconstruction")
+        # Two grade-11 standards on one event still count it once.
+        sample_event.standards = [standard_tree["APUSH.5.1"], standard_tree["APUSH.5.1.A"]]
+        proclamation = Event(
+            topic_id=sample_topic.id, title="Emancipation Proclamation", description="d",
+            date_start=date(1863, 1, 1), date_display="1863", tags=[policy], standards=[standard_tree["APUSH.5.2"]],
+        )
+        freedmen = Event(
+            topic=reconstruction, title="Freedmen's Bureau", description="d",
+            date_start=date(1865, 3, 3), date_display="1865", tags=[policy],
+        )
+        db.add_all([proclamation, freedmen])
+        db.commit()
+
+    @staticmethod
+    def _counts(facet):
+        return {c["value"]: c["count"] for c in facet}
+
+    def test_counts_all_facets(self, client, db, sample_event, sample_topic, standard_tree):
+        self._catalog(db, sample_event, sample_topic, standard_tree)
+        resp = client.get("/api/events", params={"facets": "topic,tag,grade,framework"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["events"]) == 3
+        facets = data["facets"]
+        assert self._counts(facets["topic"]) == {"civil-war": 2, "reconstruction": 1}
+        assert facets["topic"][0] == {"value": "civil-war", "label": "Civil War", "count": 2}
+        assert self._counts(facets["tag"]) == {"policy": 2, "battle": 1}
+        assert self._counts(facets["grade"]) == {"11": 2}
+        assert facets["framework"] == [{"value": "APUSH", "label": "AP US History", "count": 2}]
+
+    def test_counts_follow_filters(self, client, db, sample_event, sample_topic, standard_tree):
+        self._catalog(db, sample_event, sample_topic, standard_tree)
+        data = client.get("/api/events", params={"tag": "policy", "facets": "topic,grade"}).json()
+        assert sorted(e["title"] for e in data["events"]) == ["Emancipation Proclamation", "Freedmen's Bureau"]
+        assert set(data["facets"]) == {"topic", "grade"}
+        assert self._counts(data["facets"]["topic"]) == {"civil-war": 1, "reconstruction": 1}
+        assert self._counts(data["facets"]["grade"]) == {"11": 1}
+
+    def test_without_facets_returns_list(self, client, sample_event):
+        assert isinstance(client.get("/api/events").json(), list)
+
+    def test_unknown_facet(self, client):
+        resp = client.get("/api/events", params={"facets": "topic,color"})
+        assert resp.status_code == 422
+        assert "color" in resp.json()["detail"]
+
+
+class TestFieldProjection:
+    def test_only_requested_fields(self, client, db, sample_event):
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        sa_event.listen(db.get_bind(), "before_cursor_execute", listener)
+        try:
+            resp = client.get("/api/events", params={"fields": "title,date_start"})
+        finally:
+            sa_event.remove(db.get_bind(), "before_cursor_execute", listener)
+        assert resp.status_code == 200
+        assert resp.json() == [{"id": str(sample_event.id), "title": "Battle of Gettysburg", "date_start": "1863-07-01"}]
+        assert not [s for s in statements if "events.description" in s or "tags" in s]
+
+    def test_full_rows_without_fields(self, client, sample_event):
+        [event] = client.get("/api/events").json()
+        assert set(event) == set(LIST_FIELDS)
+
+    def test_projection_in_openapi_schema(self, client):
+        schemas = client.get("/openapi.json").json()["components"]["schemas"]
+        assert schemas["EventProjection"]["required"] == ["id"]
+        assert set(schemas["EventProjection"]["properties"]) == set(LIST_FIELDS)
+
+    def test_tags(self, client, sample_event):
+        [event] = client.get("/api/events", params={"fields": "tags", "tag": "battle"}).json()
+        assert set(event) == {"id", "tags"}
+        assert event["tags"][0]["name"] == "battle"
+
+    def test_with_facets(self, client, sample_event):
+        data = client.get("/api/events", params={"fields": "title", "facets": "topic"}).json()
+        assert data["events"] == [{"id": str(sample_event.id), "title": "Battle of Gettysburg"}]
+        assert data["facets"]["topic"][0]["count"] == 1
+
+    def test_with_fuzzy_ranking(self, client, sample_event):
+        data = client.get("/api/events", params={"q": "Gettysberg", "fuzzy": True, "fields": "date_start"}).json()
+        assert data == [{"id": str(sample_event.id), "date_start": "1863-07-01"}]
+
+    def test_from_catalog_index(self, client, monkeypatch, sample_event):
+        monkeypatch.setattr(get_settings(), "catalog_index_enabled", True)
+        [event] = client.get("/api/events", params={"fields": "title,tags"}).json()
+        assert set(event) == {"id", "title", "tags"}
+
+    def test_unknown_field(self, client):
+        resp = client.get("/api/events", params={"fields": "title,significance"})
+        assert resp.status_code == 422
+        assert "significance" in resp.json()["detail"]
+
+    def test_fields_match_list_schema(self):
+        assert LIST_FIELDS == tuple(EventListResponse.model_fields)
+
+
+class TestSuggest:
+    def test_prefix_matches(self, client, db, sample_event, sample_topic):
+        db.add_all([
+            Event(
+                topic_id=sample_topic.id, title="Gettysburg Address", description="Speech",
+                date_start=date(1863, 11, 19), date_display="November 19, 1863",
+            ),
+            Event(
+                topic_id=sample_topic.id, title="Battle of Antietam", description="Battle",
+                date_start=date(1862, 9, 17), date_display="1862",
+            ),
+        ])
+        db.commit()
+        data = client.get("/api/events/suggest", params={"q": "getty"}).json()
+        # Title prefixes first, then word prefixes.
+        assert [e["title"] for e in data] == ["Gettysburg Address", "Battle of Gettysburg"]
+        assert set(data[0]) == {"id", "title", "date_start", "date_display"}
+
+        titles = [e["title"] for e in client.get("/api/events/suggest", params={"q": "Battle o"}).json()]
+        assert titles == ["Battle of Antietam", "Battle of Gettysburg"]
+        assert len(client.get("/api/events/suggest", params={"q": "battle", "limit": 1}).json()) == 1
+
+    def test_no_match_and_validation(self, client, sample_event):
+        assert client.get("/api/events/suggest", params={"q": "zz"}).json() == []
+        assert client.get("/api/events/suggest", params={"q": ""}).status_code == 422
+
+    def test_sees_new_events(self, client, db, sample_event, sample_topic):
+        assert client.get("/api/events/suggest", params={"q": "fort"}).json() == []
+        db.add(Event(
+            topic_id=sample_topic.id, title="Fort Sumter", description="d", date_start=date(1861, 4, 12), date_display="1861",
+        ))
+        db.commit()
+        assert [e["title"] for e in client.get("/api/events/suggest", params={"q": "fort"}).json()] == ["Fort Sumter"]
+
+
+class TestEventBatch:
+    def _events(self, db, sample_topic, standard_tree, count):
+        events = [
+            Event(
+                topic_id=sample_topic.id, title=f"Event {i}", description="d", date_start=date(1860 + i, 1, 1),
+                date_display=str(1860 + i), tags=[Tag(name=f"tag-{i}")], standards=[standard_tree["APUSH.5.1"]],
+            )
+            for i in range(count)
+        ]
+        db.add_all(events)
+        db.commit()
+        return [str(e.id) for e in events]
+
+    def test_request_order_and_missing(self, client, db, sample_topic, standard_tree):
+        ids = self._events(db, sample_topic, standard_tree, 3)
+        unknown = str(uuid.uuid4())
+        resp = client.post("/api/events/batch", json={"ids": [ids[2], unknown, ids[0], ids[2]]})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [e["id"] for e in data["events"]] == [ids[2], ids[0]]
+        assert data["missing"] == [unknown]
+        first = data["events"][0]
+        assert first["tags"][0]["name"] == "tag-2"
+        assert first["standards"][0]["framework_code"] == "APUSH"
+
+    def test_fixed_query_count(self, client, db, sample_topic, standard_tree):
+        ids = self._events(db, sample_topic, standard_tree, 6)
+        counts = []
+        for batch in (ids[:2], ids):
+            statements = []
+            listener = lambda conn, cursor, statement, *args: statements.append(statement)
+            sa_event.listen(db.get_bind(), "before_cursor_execute", listener)
+            try:
+                assert len(client.post("/api/events/batch", json={"ids": batch}).json()["events"]) == len(batch)
+            finally:
+                sa_event.remove(db.get_bind(), "before_cursor_execute", listener)
+            counts.append(len(statements))
+        assert counts[0] == counts[1] == 3
+
+    def test_limits(self, client):
+        assert client.post("/api/events/batch", json={"ids": []}).status_code == 422
+        too_many = [str(uuid.uuid4()) for _ in range(101)]
+        assert client.post("/api/events/batch", json={"ids": too_many}).status_code == 422
+
+
 class TestGetEvent:
     def test_get_event_success(self, client, sample_event):
         resp = client.get(f"/api/events/{sample_event.id}")
@@ -0,0 +1,23 @@
+from app.services.fuzzy_search import TrigramIndex, trigrams, word_similarity
+
+
+class TestTrigrams:
+    def test_padded_like_pg_trgm(self):
+        assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+        assert trigrams("a-b") == {"  a", " a ", "  b", " b "}
+
+    def test_word_similarity(self):
+        # Example from the pg_trgm documentation.
+        assert word_similarity("word", "two words") == 0.8
+        assert word_similarity("gettysburg", "Battle of Gettysburg") == 1.0
+        assert 0.6 < word_similarity("Gettysberg", "Battle of Gettysburg") < 0.7
+        assert word_similarity("", "anything") == 0.0
+
+
+class TestTrigramIndex:
+    def test_search(self):
+        index = TrigramIndex([(1, "Battle of Gettysburg"), (2, "Siege of Vicksburg"), (3, "Gettysburg Address")])
+        scores = index.search("Gettysberg")
+        assert set(scores) == {1, 3}
+        assert index.search("Vicksberg") == {2: word_similarity("Vicksberg", "Siege of Vicksburg")}
+        assert index.search("zzz") == {}
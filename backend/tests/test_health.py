@@ -0,0 +1,140 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from app import health
+from app.config import get_settings
+from app.database import POOL_PROFILES, Base, PoolMetrics
+from app.health import ReadinessProbe, migration_heads, readiness_probe, run_checks
+from app.services.catalog_cache import catalog_version
+from app.services.catalog_snapshot import EVENT_DATA_DIR, build_snapshot, get_snapshot
+
+
+@pytest.fixture(autouse=True)
+def fresh_probe():
+    readiness_probe.clear()
+    yield
+    readiness_probe.clear()
+
+
+def _stamp(db, revision):
+    db.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+    db.execute(text("INSERT INTO alembic_version VALUES (:rev)"), {"rev": revision})
+    db.commit()
+
+
+@pytest.fixture
+def alembic_table(db):
+    yield
+    db.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    db.commit()
+
+
+class TestReadinessEndpoint:
+    def test_ready_without_alembic_table(self, client):
+        resp = client.get("/health/ready")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["status"] == "ready"
+        assert body["checks"]["database"]["ok"] is True
+        assert body["checks"]["migrations"]["ok"] is None
+        assert body["checks"]["catalog"]["source"] == "database"
+        assert body["checks"]["catalog"]["catalog_version"]
+
+    def test_at_head(self, client, db, alembic_table):
+        _stamp(db, migration_heads()[0])
+        body = client.get("/health/ready").json()
+        assert body["checks"]["migrations"]["ok"] is True
+        assert body["status"] == "ready"
+
+    def test_behind_head_is_unavailable(self, client, db, alembic_table):
+        _stamp(db, "001_initial")
+        resp = client.get("/health/ready")
+        assert resp.status_code == 503
+        assert resp.json()["checks"]["migrations"]["current"] == ["001_initial"]
+
+    def test_results_are_cached(self, client):
+        assert client.get("/health/ready").json()["cached"] is False
+        assert client.get("/health/ready").json()["cached"] is True
+
+    def test_slow_database_is_degraded(self, client, monkeypatch):
+        monkeypatch.setattr(get_settings(), "readiness_db_latency_warn_ms", -1)
+        body = client.get("/health/ready").json()
+        assert body["status"] == "degraded"
+        assert body["checks"]["database"]["slow"] is True
+
+
+class FailingSession:
+    def execute(self, *args, **kwargs):
+        raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+    def rollback(self):
+        pass
+
+
+class TestRunChecks:
+    def test_unreachable_database(self):
+        result = run_checks(FailingSession())
+        assert result["status"] == "unavailable"
+        assert result["checks"]["database"] == {"ok": False, "error": "OperationalError"}
+        assert "migrations" not in result["checks"]
+
+    def test_lambda_pool_is_not_saturated_by_the_probe(self, tmp_path, monkeypatch):
+        engine = create_engine(f"sqlite:///{tmp_path / 'probe.db'}", poolclass=QueuePool, **POOL_PROFILES["lambda"])
+        Base.metadata.create_all(bind=engine)
+        metrics = PoolMetrics()
+        metrics.attach(engine)
+        monkeypatch.setattr(health, "pool_metrics", metrics)
+
+        with Session(engine) as session:
+            result = run_checks(session)
+
+        pool = result["checks"]["pool"]
+        assert pool["capacity"] == 1
+        assert pool["checked_out"] == 0
+        assert pool["saturated"] is False
+        assert result["status"] == "ready"
+        engine.dispose()
+
+    def test_catalog_query_failure_is_degraded(self, db, monkeypatch):
+        def fail(session):
+            raise OperationalError("SELECT count(*)", {}, Exception("relation does not exist"))
+
+        monkeypatch.setattr(catalog_version, "current", fail)
+        result = run_checks(db)
+        assert result["status"] == "degraded"
+        assert result["checks"]["catalog"] == {"source": "database", "ok": False, "error": "OperationalError"}
+
+    def test_incomplete_snapshot_is_degraded(self, db, tmp_path, monkeypatch):
+        path = tmp_path / "catalog.snapshot"
+        build_snapshot(EVENT_DATA_DIR, path)
+        with sqlite3.connect(path) as conn:
+            conn.execute("DELETE FROM meta WHERE key = 'built_at'")
+        monkeypatch.setattr(get_settings(), "catalog_snapshot_path", str(path))
+        get_snapshot.cache_clear()
+        try:
+            result = run_checks(db)
+        finally:
+            get_snapshot.cache_clear()
+
+        catalog = result["checks"]["catalog"]
+        assert result["status"] == "degraded"
+        assert catalog["ok"] is False
+        assert catalog["fresh"] is False
+        assert "built_at" in catalog["error"]
+
+    def test_probe_ttl(self, db):
+        now = [0.0]
+        probe = ReadinessProbe(ttl_seconds=5, clock=lambda: now[0])
+
+        first, cached = probe.check(db)
+        assert cached is False
+        now[0] = 4.9
+        assert probe.check(db) == (first, True)
+        now[0] = 5.0
+        assert probe.check(db)[1] is False
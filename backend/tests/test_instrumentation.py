@@ -0,0 +1,88 @@
+import json
+import logging
+import re
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, field_validator
+
+from app.database import get_db
+from app.instrumentation import (
+    InstrumentedJSONResponse,
+    current_request_stats,
+    install_request_instrumentation,
+    uninstrument_engine,
+)
+from app.routers import events_router
+from tests.conftest import engine, override_get_db
+
+
+@pytest.fixture
+def instrumented_client():
+    app = FastAPI(default_response_class=InstrumentedJSONResponse)
+    install_request_instrumentation(app, engine)
+    app.include_router(events_router)
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    uninstrument_engine(engine)
+
+
+def _timing(resp) -> dict:
+    header = resp.headers["server-timing"]
+    return {m.group(1): float(m.group(2)) for m in re.finditer(r"(\w+);dur=([\d.]+)", header)}
+
+
+class TestRequestInstrumentation:
+    def test_server_timing_counts_statements(self, instrumented_client, sample_event):
+        resp = instrumented_client.get("/api/events")
+        assert resp.status_code == 200
+        assert 'desc="1 queries"' in resp.headers["server-timing"]
+        timing = _timing(resp)
+        assert set(timing) == {"db", "ser", "total"}
+        assert timing["total"] >= timing["db"]
+
+    def test_each_statement_is_counted(self, instrumented_client, sample_event):
+        # The topic filter resolves the slug first, then runs the search.
+        resp = instrumented_client.get("/api/events", params={"topic": "civil-war"})
+        assert 'desc="2 queries"' in resp.headers["server-timing"]
+
+    def test_logs_structured_line(self, instrumented_client, sample_event, caplog):
+        with caplog.at_level(logging.INFO, logger="app.instrumentation"):
+            instrumented_client.get(f"/api/events/{sample_event.id}")
+
+        line = json.loads(caplog.records[-1].getMessage())
+        assert line["route"] == "/api/events/{event_id}"
+        assert line["status"] == 200
+        assert line["db_statements"] == 1
+
+    def test_response_model_validation_counts_as_serialization(self):
+        class Slow(BaseModel):
+            n: int
+
+            @field_validator("n")
+            @classmethod
+            def slow(cls, value):
+                time.sleep(0.01)
+                return value
+
+        app = FastAPI(default_response_class=InstrumentedJSONResponse)
+        install_request_instrumentation(app, engine)
+
+        @app.get("/slow", response_model=list[Slow])
+        def slow():
+            return [{"n": i} for i in range(3)]
+
+        try:
+            resp = TestClient(app).get("/slow")
+        finally:
+            uninstrument_engine(engine)
+        assert resp.json() == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert _timing(resp)["ser"] >= 30
+
+    def test_no_stats_outside_requests(self, db, sample_event):
+        assert current_request_stats() is None
+
+    def test_main_app_is_uninstrumented_by_default(self, client, sample_event):
+        assert "server-timing" not in client.get("/api/events").headers
@@ -0,0 +1,83 @@
+import uuid
+from datetime import date
+
+import pytest
+
+from app.models import Event, TimelineEvent, Topic, event_tags
+from app.services.maintenance import deduplicate_events
+
+
+def _event(topic, title, source_id=None, tags=()):
+    event = Event(
+        id=uuid.uuid4(),
+        source_id=source_id,
+        topic_id=topic.id,
+        title=title,
+        description=f"{title} description",
+        date_start=date(1863, 7, 1),
+        date_display="1863",
+    )
+    event.tags.extend(tags)
+    return event
+
+
+@pytest.fixture
+def duplicated(db, sample_topic, sample_tag, sample_timeline):
+    """A legacy event with a canonical twin, referenced from a timeline."""
+    legacy = _event(sample_topic, "Battle of Antietam", tags=[sample_tag])
+    canonical = _event(sample_topic, "Battle of Antietam", source_id="evt_antietam")
+    unmatched = _event(sample_topic, "Emancipation Proclamation")
+    db.add_all([legacy, canonical, unmatched])
+    db.flush()
+    db.add(TimelineEvent(timeline_id=sample_timeline.id, event_id=legacy.id, position=0))
+    db.commit()
+    return legacy, canonical, unmatched
+
+
+class TestDeduplicateEvents:
+    def test_dry_run_reports_without_changes(self, db, duplicated):
+        legacy, canonical, _ = duplicated
+        result = deduplicate_events(db, dry_run=True)
+
+        assert result["dry_run"] is True
+        assert result["duplicates"] == 1
+        assert result["timeline_events_to_reassign"] == 1
+        assert result["sample"] == [
+            {"old_id": str(legacy.id), "new_id": str(canonical.id), "title": "Battle of Antietam"}
+        ]
+        assert db.query(Event).count() == 3
+
+    def test_reassigns_and_deletes(self, db, duplicated):
+        legacy_id, canonical_id, unmatched_id = (e.id for e in duplicated)
+        result = deduplicate_events(db)
+        db.commit()
+
+        assert result == {"dry_run": False, "deleted": 1, "timeline_events_reassigned": 1}
+        assert {e.id for e in db.query(Event).all()} == {canonical_id, unmatched_id}
+        assert db.query(TimelineEvent).one().event_id == canonical_id
+        assert db.query(event_tags).filter(event_tags.c.event_id == legacy_id).count() == 0
+
+    def test_other_topic_is_not_a_twin(self, db, sample_topic):
+        other_topic = Topic(id=uuid.uuid4(), slug="other", name="Other")
+        db.add(other_topic)
+        db.add_all([
+            _event(sample_topic, "Treaty of Paris"),
+            _event(other_topic, "Treaty of Paris", source_id="evt_treaty_of_paris"),
+        ])
+        db.commit()
+
+        assert deduplicate_events(db) == {"dry_run": False, "deleted": 0, "timeline_events_reassigned": 0}
+        assert db.query(Event).count() == 2
+
+    def test_picks_single_canonical_among_several(self, db, sample_topic):
+        db.add_all([
+            _event(sample_topic, "Siege of Vicksburg"),
+            _event(sample_topic, "Siege of Vicksburg", source_id="evt_vicksburg_b"),
+            _event(sample_topic, "Siege of Vicksburg", source_id="evt_vicksburg_a"),
+        ])
+        db.commit()
+
+        report = deduplicate_events(db, dry_run=True)
+        assert report["duplicates"] == 1
+        canonical = db.query(Event).filter_by(source_id="evt_vicksburg_a").one()
+        assert report["sample"][0]["new_id"] == str(canonical.id)
@@ -0,0 +1,130 @@
+import uuid
+
+from app.metrics import Counter, Histogram, MetricsRegistry, flush_emf, pdf_export_duration
+
+
+class TestMetricTypes:
+    def test_counter_render(self):
+        counter = Counter("requests_total", "Requests.")
+        counter.inc(route="/a", status="200")
+        counter.inc(2, route="/a", status="200")
+
+        assert counter.render() == [
+            "# HELP requests_total Requests.",
+            "# TYPE requests_total counter",
+            'requests_total{route="/a",status="200"} 3',
+        ]
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5):
+            histogram.observe(value, route="/a")
+
+        lines = histogram.render()[2:]
+        assert lines == [
+            'latency_seconds_bucket{le="0.1",route="/a"} 1',
+            'latency_seconds_bucket{le="1",route="/a"} 3',
+            'latency_seconds_bucket{le="+Inf",route="/a"} 4',
+            'latency_seconds_sum{route="/a"} 6.25',
+            'latency_seconds_count{route="/a"} 4',
+        ]
+
+    def test_label_values_are_escaped(self):
+        counter = Counter("c", "C.")
+        counter.inc(q='say "hi"\n')
+        assert counter.render()[-1] == 'c{q="say \\"hi\\"\\n"} 1'
+
+
+class TestCollectors:
+    def test_counter_families_get_total_suffix(self):
+        registry = MetricsRegistry()
+        registry.register_collector(lambda: [
+            ("pool_checkouts", "counter", "Checkouts.", [({}, 7)]),
+            ("pool_checked_out", "gauge", "Checked out.", [({}, 2)]),
+        ])
+
+        assert registry.render_prometheus().splitlines() == [
+            "# HELP lessonlines_pool_checkouts_total Checkouts.",
+            "# TYPE lessonlines_pool_checkouts_total counter",
+            "lessonlines_pool_checkouts_total 7",
+            "# HELP lessonlines_pool_checked_out Checked out.",
+            "# TYPE lessonlines_pool_checked_out gauge",
+            "lessonlines_pool_checked_out 2",
+        ]
+
+
+class TestEmf:
+    def test_groups_observations_by_dimensions(self):
+        registry = MetricsRegistry()
+        registry.emf_enabled = True
+        registry.record_emf("Latency", 12.5, "Milliseconds", Route="/api/events", Method="GET")
+        registry.record_emf("Latency", 7.5, "Milliseconds", Route="/api/events", Method="GET")
+        registry.record_emf("Latency", 3.0, "Milliseconds", Route="/api/topics", Method="GET")
+
+        documents = registry.emf_documents("LessonLines", timestamp_ms=1000)
+
+        events = next(d for d in documents if d["Route"] == "/api/events")
+        assert events["Latency"] == [12.5, 7.5]
+        assert events["_aws"] == {
+            "Timestamp": 1000,
+            "CloudWatchMetrics": [{
+                "Namespace": "LessonLines",
+                "Dimensions": [["Method", "Route"]],
+                "Metrics": [{"Name": "Latency", "Unit": "Milliseconds"}],
+            }],
+        }
+        assert registry.emf_documents("LessonLines") == []
+
+    def test_disabled_records_nothing(self):
+        registry = MetricsRegistry()
+        registry.record_emf("Latency", 1.0, "Milliseconds", Route="/")
+        assert registry.emf_documents("LessonLines") == []
+
+    def test_flush_writes_json_lines(self, monkeypatch):
+        from app import metrics
+
+        registry = MetricsRegistry()
+        registry.emf_enabled = True
+        registry.record_emf("Errors", 0, "Count", Route="/")
+        monkeypatch.setattr(metrics, "registry", registry)
+        lines = []
+
+        assert flush_emf("LessonLines", write=lines.append) == 1
+        assert '"Errors":0' in lines[0]
+
+
+class TestMetricsEndpoint:
+    def test_requires_admin(self, client, auth_headers):
+        assert client.get("/api/admin/metrics", headers=auth_headers).status_code == 403
+
+    def test_reports_routes_pool_and_caches(self, client, admin_auth_headers, sample_event):
+        client.get("/api/events")
+        client.get(f"/api/events/{uuid.uuid4()}")
+
+        resp = client.get("/api/admin/metrics", headers=admin_auth_headers)
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = resp.text
+        assert 'lessonlines_http_requests_total{method="GET",route="/api/events",status="200"}' in body
+        assert 'lessonlines_http_requests_total{method="GET",route="/api/events/{event_id}",status="404"}' in body
+        assert 'lessonlines_http_request_duration_seconds_bucket{le="+Inf",method="GET",route="/api/events"}' in body
+        assert "# TYPE lessonlines_db_pool_checkouts_total counter" in body
+        assert "# TYPE lessonlines_db_pool_overflow_checkouts_total counter" in body
+        assert "# TYPE lessonlines_db_pool_waits_total counter" in body
+        assert "# TYPE lessonlines_db_pool_wait_seconds_total counter" in body
+        assert 'lessonlines_cache_hits_total{cache="token"}' in body
+        assert "# TYPE lessonlines_cache_hit_rate gauge" in body
+        assert 'lessonlines_cache_hit_rate{cache="token"}' in body
+
+    def test_pdf_export_is_timed(self, client, pro_auth_headers, db, pro_user):
+        from app.models import Timeline
+
+        timeline = Timeline(id=uuid.uuid4(), user_id=pro_user.id, title="Timed")
+        db.add(timeline)
+        db.commit()
+        before = sum(count for _, _, _, count in pdf_export_duration.snapshot())
+
+        client.post(f"/api/timelines/{timeline.id}/export/pdf", headers=pro_auth_headers)
+
+        assert sum(count for _, _, _, count in pdf_export_duration.snapshot()) == before + 1
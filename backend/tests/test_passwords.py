@@ -0,0 +1,51 @@
+import asyncio
+
+from app.models import User
+from app.services.passwords import PasswordHasher
+
+
+class TestPasswordHasher:
+    def test_hash_uses_configured_cost(self):
+        hasher = PasswordHasher(rounds=5, max_workers=1)
+        assert hasher.hash("pw").startswith("$2b$05$")
+
+    def test_verify_and_update_rehashes_other_cost(self):
+        old_hash = PasswordHasher(rounds=5, max_workers=1).hash("pw")
+        hasher = PasswordHasher(rounds=4, max_workers=1)
+
+        valid, new_hash = hasher.verify_and_update("pw", old_hash)
+        assert valid
+        assert new_hash.startswith("$2b$04$")
+        assert hasher.verify_and_update("pw", new_hash) == (True, None)
+
+    def test_wrong_password_is_not_rehashed(self):
+        hasher = PasswordHasher(rounds=4, max_workers=1)
+        old_hash = PasswordHasher(rounds=5, max_workers=1).hash("pw")
+        assert hasher.verify_and_update("nope", old_hash) == (False, None)
+
+    def test_async_runs_on_dedicated_pool(self):
+        hasher = PasswordHasher(rounds=4, max_workers=2)
+
+        async def run():
+            return await asyncio.gather(*(hasher.hash_async(f"pw{i}") for i in range(4)))
+
+        hashes = asyncio.run(run())
+        assert all(hasher.verify(f"pw{i}", h) for i, h in enumerate(hashes))
+        assert hasher.executor._max_workers == 2
+
+
+class TestRehashOnLogin:
+    def test_login_upgrades_hash_cost(self, client, db):
+        from app.services.passwords import password_hasher
+
+        old_hash = PasswordHasher(rounds=password_hasher.rounds + 1, max_workers=1).hash("password123")
+        user = User(email="old@example.com", hashed_password=old_hash)
+        db.add(user)
+        db.commit()
+
+        resp = client.post("/api/auth/login", data={"username": "old@example.com", "password": "password123"})
+        assert resp.status_code == 200
+
+        db.refresh(user)
+        assert user.hashed_password != old_hash
+        assert user.hashed_password.startswith(f"$2b${password_hasher.rounds:02d}$")
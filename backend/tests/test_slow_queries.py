@@ -0,0 +1,88 @@
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.database import get_db
+from app.instrumentation import install_request_instrumentation, uninstrument_engine
+from app.routers import events_router
+from app.slow_queries import SlowQueryLog, normalize_sql, parameter_shapes
+from tests.conftest import engine, override_get_db
+
+
+class TestNormalizeSql:
+    def test_placeholders_and_literals(self):
+        sql = "SELECT *\n  FROM events WHERE title = 'Gettysburg' AND year > 1860 AND topic_id = :topic_id"
+        assert normalize_sql(sql) == "SELECT * FROM events WHERE title = ? AND year > ? AND topic_id = ?"
+
+    def test_in_lists_collapse(self):
+        short = normalize_sql("SELECT * FROM tags WHERE id IN (?, ?)")
+        long = normalize_sql("SELECT * FROM tags WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)")
+        assert short == long == "SELECT * FROM tags WHERE id IN (?)"
+
+    def test_identifiers_with_digits_are_kept(self):
+        assert normalize_sql("SELECT events_1.id FROM events AS events_1 LIMIT ?") == (
+            "SELECT events_1.id FROM events AS events_1 LIMIT ?"
+        )
+
+
+class TestParameterShapes:
+    def test_values_are_not_logged(self):
+        assert parameter_shapes({"q": "secret", "n": 3, "x": None}) == {"q": "str", "n": "int", "x": "null"}
+        assert parameter_shapes(("secret", 1.5)) == ["str", "float"]
+
+    def test_executemany(self):
+        assert parameter_shapes([(1, "a"), (2, "b")], executemany=True) == {"rows": 2, "shape": ["int", "str"]}
+
+
+@pytest.fixture
+def slow_log():
+    log = SlowQueryLog(threshold_ms=0)
+    log.attach(engine)
+    yield log
+    log.detach(engine)
+
+
+class TestSlowQueryLog:
+    def test_records_statements_over_threshold(self, db, slow_log, caplog):
+        with caplog.at_level(logging.WARNING, logger="app.slow_queries"):
+            db.execute(text("SELECT :n + 1"), {"n": 41})
+
+        entry = json.loads(caplog.records[-1].getMessage())
+        assert entry["event"] == "slow_query"
+        assert entry["statement"] == "SELECT ? + ?"
+        assert entry["parameters"] == ["int"]
+        assert entry["route"] is None
+        assert "plan" not in entry
+        assert slow_log.recent[-1] == entry
+
+    def test_fast_statements_are_skipped(self, db, slow_log):
+        slow_log.threshold_seconds = 60
+        db.execute(text("SELECT 1"))
+        assert not slow_log.recent
+
+    def test_sampling(self, db, slow_log):
+        slow_log.sample_rate = 0.0
+        db.execute(text("SELECT 1"))
+        assert not slow_log.recent
+
+    def test_explain_is_postgres_only(self, db, slow_log):
+        slow_log.explain = True
+        db.execute(text("SELECT 1"))
+        assert slow_log.recent[-1]["plan"] is None
+
+    def test_route_from_request_context(self, slow_log, sample_event):
+        app = FastAPI()
+        install_request_instrumentation(app, engine, report=False)
+        app.include_router(events_router)
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            resp = TestClient(app).get(f"/api/events/{sample_event.id}")
+        finally:
+            uninstrument_engine(engine)
+
+        assert "server-timing" not in resp.headers
+        assert slow_log.recent[-1]["route"] == "/api/events/{event_id}"
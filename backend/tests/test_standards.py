@@ -1,6 +1,9 @@
 import uuid
 
-from app.models import CurriculumFramework, CurriculumStandard
+from sqlalchemy import select
+
+from app.models import CurriculumFramework, CurriculumStandard, curriculum_standard_closure, rebuild_standard_closure
+from app.services.catalog_cache import CatalogVersion, catalog_cache
 
 
 class TestGetFrameworks:
@@ -18,6 +21,63 @@ class TestGetFrameworks:
         assert resp.json() == []
 
 
+class TestFrameworkTree:
+    def test_nested_tree(self, client, standard_tree):
+        resp = client.get("/api/standards/frameworks/APUSH/tree")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["framework"]["code"] == "APUSH"
+        assert data["catalog_version"]
+        [period] = data["standards"]
+        assert period["code"] == "APUSH.5"
+        assert [c["code"] for c in period["children"]] == ["APUSH.5.1", "APUSH.5.2"]
+        assert [c["code"] for c in period["children"][0]["children"]] == ["APUSH.5.1.A"]
+        assert period["children"][1]["children"] == []
+
+    def test_unknown_framework(self, client):
+        resp = client.get("/api/standards/frameworks/NOPE/tree")
+        assert resp.status_code == 404
+
+    def test_cached_until_catalog_changes(self, client, db, standard_tree):
+        first = client.get("/api/standards/frameworks/APUSH/tree").json()
+        assert client.get("/api/standards/frameworks/APUSH/tree").json() == first
+        assert catalog_cache.stats()["hits"] >= 1
+
+        standard_tree["APUSH.5.2"].title = "Reconstruction era"
+        db.commit()
+        second = client.get("/api/standards/frameworks/APUSH/tree").json()
+        assert second["catalog_version"] != first["catalog_version"]
+        assert second["standards"][0]["children"][1]["title"] == "Reconstruction era"
+
+
+class TestCatalogVersion:
+    def test_rechecks_database_after_interval(self, db, sample_framework):
+        now = [0.0]
+        version = CatalogVersion(recheck_seconds=5, clock=lambda: now[0])
+        before = version.current(db)
+
+        # A write from another process: no local invalidation.
+        db.execute(CurriculumStandard.__table__.insert().values(
+            id=uuid.uuid4(), framework_id=sample_framework.id, code="X.1", title="X"
+        ))
+        assert version.current(db) == before
+        now[0] = 6.0
+        assert version.current(db) != before
+
+    def test_fingerprint_query_runs_outside_lock(self, db, monkeypatch):
+        version = CatalogVersion(recheck_seconds=5)
+        execute = db.execute
+        held = []
+
+        def spy(*args, **kwargs):
+            held.append(version._lock.locked())
+            return execute(*args, **kwargs)
+
+        monkeypatch.setattr(db, "execute", spy)
+        version.current(db)
+        assert held == [False]
+
+
 class TestSearchStandards:
     def test_list_standards(self, client, sample_standard):
         resp = client.get("/api/standards")
@@ -64,6 +124,17 @@ class TestSearchStandards:
         assert resp.json() == []
 
 
+class TestFuzzyStandardSearch:
+    def test_typo_in_title(self, client, standard_tree):
+        assert client.get("/api/standards", params={"q": "Reconstrution"}).json() == []
+        data = client.get("/api/standards", params={"q": "Reconstrution", "fuzzy": True}).json()
+        assert [s["code"] for s in data] == ["APUSH.5.2"]
+
+    def test_exact_matches_still_found(self, client, standard_tree):
+        data = client.get("/api/standards", params={"q": "Secession", "fuzzy": True}).json()
+        assert [s["code"] for s in data] == ["APUSH.5.1.A"]
+
+
 class TestGetStandard:
     def test_get_standard_success(self, client, sample_standard):
         resp = client.get(f"/api/standards/{sample_standard.id}")
@@ -76,3 +147,38 @@ class TestGetStandard:
         fake_id = uuid.uuid4()
         resp = client.get(f"/api/standards/{fake_id}")
         assert resp.status_code == 404
+
+
+class TestStandardClosure:
+    def _pairs(self, db, tree):
+        codes = {s.id: code for code, s in tree.items()}
+        rows = db.execute(select(curriculum_standard_closure)).all()
+        return {(codes[r.ancestor_id], codes[r.descendant_id], r.depth) for r in rows}
+
+    def test_maintained_on_insert(self, db, standard_tree):
+        pairs = self._pairs(db, standard_tree)
+        assert ("APUSH.5", "APUSH.5.1.A", 2) in pairs
+        assert ("APUSH.5.1", "APUSH.5.1.A", 1) in pairs
+        assert ("APUSH.5.2", "APUSH.5.2", 0) in pairs
+        assert len(pairs) == 4 + 3 + 1  # self pairs, parent links, grandparent link
+
+    def test_reparenting_moves_subtree(self, db, standard_tree):
+        standard_tree["APUSH.5.1"].parent = standard_tree["APUSH.5.2"]
+        db.commit()
+
+        pairs = self._pairs(db, standard_tree)
+        assert ("APUSH.5.2", "APUSH.5.1.A", 2) in pairs
+        assert ("APUSH.5", "APUSH.5.1.A", 3) in pairs
+        assert ("APUSH.5.1", "APUSH.5.1.A", 1) in pairs
+
+    def test_delete_removes_rows(self, db, standard_tree):
+        leaf = standard_tree.pop("APUSH.5.1.A")
+        db.delete(leaf)
+        db.commit()
+        assert all(leaf.code not in (a, d) for a, d, _ in self._pairs(db, standard_tree))
+
+    def test_rebuild_matches_incremental(self, db, standard_tree):
+        before = self._pairs(db, standard_tree)
+        assert rebuild_standard_closure(db.connection()) == len(before)
+        db.commit()
+        assert self._pairs(db, standard_tree) == before
@@ -46,6 +46,8 @@ export class BackendStack extends cdk.Stack {
             [
               'pip install -r requirements-lambda.txt -t /asset-output',
               'cp -r app alembic handler.py event-data /asset-output/',
+              // Precompile the curated catalog so cold starts and imports skip JSON parsing
+              'cd /asset-output && PYTHONPATH=/asset-output python -m app.services.catalog_snapshot build --output event-data/catalog.snapshot',
               // Strip unnecessary files to reduce package size
               'find /asset-output -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null',
               'find /asset-output -type d -name "*.dist-info" -exec rm -rf {} + 2>/dev/null',
@@ -79,6 +81,12 @@ export class BackendStack extends cdk.Stack {
               });
               // Copy only runtime source files
               execSync(`cp -r ${backendPath}/app ${backendPath}/alembic ${backendPath}/handler.py ${backendPath}/event-data ${outputDir}/`, { stdio: 'inherit' });
+              // Precompile the curated catalog snapshot
+              execSync(`python3 -m app.services.catalog_snapshot build --output event-data/catalog.snapshot`, {
+                cwd: outputDir,
+                env: { ...process.env, PYTHONPATH: outputDir },
+                stdio: 'inherit',
+              });
               // Strip unnecessary files
               execSync(`find ${outputDir} -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null; true`, { stdio: 'inherit' });
               execSync(`find ${outputDir} -type d -name "*.dist-info" -exec rm -rf {} + 2>/dev/null; true`, { stdio: 'inherit' });